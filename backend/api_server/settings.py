@@ -1,178 +1,240 @@
-"""
-Django settings for api_server project.
-
-Generated by 'django-admin startproject' using Django 5.0.2.
-
-For more information on this file, see
-https://docs.djangoproject.com/en/5.0/topics/settings/
-
-For the full list of settings and their values, see
-https://docs.djangoproject.com/en/5.0/ref/settings/
-"""
-import os
-import dj_database_url
-
-from datetime import timedelta
-from pathlib import Path
-from dotenv import load_dotenv
-
-
-load_dotenv()
-
-
-# Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.getenv('SECRET_KEY')
-if not SECRET_KEY:
-    raise ValueError("SECRET_KEY environment variable is not set")
-
-
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv('DEBUG', 'False') == 'True'
-
-# ensure secure settings for production
-if not DEBUG:
-    SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
-    SECURE_SSL_REDIRECT = True
-    SESSION_COOKIE_SECURE = True
-    CSRF_COOKIE_SECURE = True
-    SECURE_BROWSER_XSS_FILTER = True
-    X_FRAME_OPTIONS = 'DENY'
-    SECURE_CONTENT_TYPE_NOSNIFF = True
-
-
-ALLOWED_HOSTS = os.getenv('DJANGO_ALLOWED_HOSTS', '*').split()  # Allow all hosts
-
-# CORS settings
-CORS_ALLOW_ALL_ORIGINS = True  # Allow all origins
-
-# Application definition
-INSTALLED_APPS = [
-    'django.contrib.admin',
-    'django.contrib.auth',
-    'django.contrib.contenttypes',
-    'django.contrib.sessions',
-    'django.contrib.messages',
-    'django.contrib.staticfiles',
-
-    'rest_framework',
-    'exercise_correction',
-
-    'corsheaders'
-]
-
-MIDDLEWARE = [
-    'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
-
-    'corsheaders.middleware.CorsMiddleware'
-]
-
-ROOT_URLCONF = 'api_server.urls'
-
-TEMPLATES = [
-    {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [],
-        'APP_DIRS': True,
-        'OPTIONS': {
-            'context_processors': [
-                'django.template.context_processors.debug',
-                'django.template.context_processors.request',
-                'django.contrib.auth.context_processors.auth',
-                'django.contrib.messages.context_processors.messages',
-            ],
-        },
-    },
-]
-
-WSGI_APPLICATION = 'api_server.wsgi.application'
-
-
-# Database
-# https://docs.djangoproject.com/en/5.0/ref/settings/#databases
-PRODUCTION = os.getenv('PRODUCTION', 'False') == 'True'
-DATABASE_URL = os.getenv('DATABASE_URL')
-
-if PRODUCTION:
-    if not DATABASE_URL:
-        raise ValueError("DATABASE_URL environment variable is not set")
-    DATABASES = {
-        'default': dj_database_url.config(default=DATABASE_URL)
-    }
-else:
-    DATABASES = {
-        'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
-        }
-    }
-
-
-# Password validation
-# https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
-AUTH_PASSWORD_VALIDATORS = [
-    {
-        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
-    },
-    {
-        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
-    },
-]
-
-
-# Internationalization
-# https://docs.djangoproject.com/en/5.0/topics/i18n/
-LANGUAGE_CODE = 'en-us'
-
-TIME_ZONE = 'UTC'
-
-USE_I18N = True
-
-USE_TZ = True
-
-
-# Static files (CSS, JavaScript, Images)
-# https://docs.djangoproject.com/en/5.0/howto/static-files/
-STATIC_URL = 'static/'
-
-
-# Default primary key field type
-# https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
-
-REST_FRAMEWORK = {
-    'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    ),
-}
-
-SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
-    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
-}
-
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
-MEDIA_URL = '/media/'
-
-
-# 100MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600
-FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600
+"""
+Django settings for api_server project.
+
+Generated by 'django-admin startproject' using Django 5.0.2.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.0/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.0/ref/settings/
+"""
+import os
+import tempfile
+import dj_database_url
+
+from datetime import timedelta
+from pathlib import Path
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = os.getenv('SECRET_KEY')
+if not SECRET_KEY:
+    raise ValueError("SECRET_KEY environment variable is not set")
+
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = os.getenv('DEBUG', 'False') == 'True'
+
+# ensure secure settings for production
+if not DEBUG:
+    SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+    SECURE_SSL_REDIRECT = True
+    SESSION_COOKIE_SECURE = True
+    CSRF_COOKIE_SECURE = True
+    SECURE_BROWSER_XSS_FILTER = True
+    X_FRAME_OPTIONS = 'DENY'
+    SECURE_CONTENT_TYPE_NOSNIFF = True
+
+
+ALLOWED_HOSTS = os.getenv('DJANGO_ALLOWED_HOSTS', '*').split()  # Allow all hosts
+
+# CORS settings
+CORS_ALLOW_ALL_ORIGINS = True  # Allow all origins
+
+# Application definition
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+
+    'rest_framework',
+    'exercise_correction',
+
+    'corsheaders'
+]
+
+MIDDLEWARE = [
+    # first so that the request latency includes the other middleware
+    'exercise_correction.middleware.metrics.MetricsMiddleware',
+
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+
+    'corsheaders.middleware.CorsMiddleware'
+]
+
+ROOT_URLCONF = 'api_server.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'api_server.wsgi.application'
+
+
+# Database
+# https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+PRODUCTION = os.getenv('PRODUCTION', 'False') == 'True'
+DATABASE_URL = os.getenv('DATABASE_URL')
+
+if PRODUCTION:
+    if not DATABASE_URL:
+        raise ValueError("DATABASE_URL environment variable is not set")
+    DATABASES = {
+        'default': dj_database_url.config(default=DATABASE_URL)
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+        }
+    }
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.0/topics/i18n/
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.0/howto/static-files/
+STATIC_URL = 'static/'
+
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'rest_framework_simplejwt.authentication.JWTAuthentication',
+    ),
+}
+
+SIMPLE_JWT = {
+    'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+}
+
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+MEDIA_URL = '/media/'
+
+
+# 100MB
+DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600
+FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600
+
+
+# pose estimation model complexity, either 'auto' to select it per job or a fixed value (0, 1 or 2)
+POSE_MODEL_COMPLEXITY = os.getenv('POSE_MODEL_COMPLEXITY', 'auto')
+# target time (seconds) to return the advice for a submitted video, used by the 'auto' model complexity
+POSE_LATENCY_SLO_SECONDS = float(os.getenv('POSE_LATENCY_SLO_SECONDS', '60'))
+# skip the pose estimation on the idle stretches of the videos, detected by frame differencing, interpolating their
+# landmarks and trimming the idle start and end of the videos, which changes the landmarks the advice is given from
+POSE_MOTION_GATING = os.getenv('POSE_MOTION_GATING', 'False') == 'True'
+# minimum number of frames between two pose estimations, the pose being estimated on every moving frame if 1
+POSE_KEYFRAME_INTERVAL = int(os.getenv('POSE_KEYFRAME_INTERVAL', '1'))
+# track the landmarks over the frames without pose estimation with the optical flow, instead of interpolating them
+# between the surrounding pose estimations
+POSE_OPTICAL_FLOW_PROPAGATION = os.getenv('POSE_OPTICAL_FLOW_PROPAGATION', 'False') == 'True'
+# submissions longer than this (seconds) are rejected before their processing
+VIDEO_MAX_DURATION_SECONDS = float(os.getenv('VIDEO_MAX_DURATION_SECONDS', '1800'))
+# largest resolution of the submissions, as WIDTHxHEIGHT either way round, the higher ones being rejected
+VIDEO_MAX_RESOLUTION = tuple(int(size) for size in os.getenv('VIDEO_MAX_RESOLUTION', '3840x2160').split('x'))
+# reject the submissions where no person is detected on a few frames sampled across them, before their processing
+VIDEO_PROBE_POSE_DETECTION = os.getenv('VIDEO_PROBE_POSE_DETECTION', 'True') == 'True'
+# transcode the submissions exceeding the resolution or frame rate of the analysis into a proxy, decoded by every
+# processing pass instead of the original video, the repetition clips being cut from the proxy as well
+ANALYSIS_PROXY = os.getenv('ANALYSIS_PROXY', 'False') == 'True'
+# largest resolution of the analysis proxies, as WIDTHxHEIGHT either way round
+ANALYSIS_PROXY_MAX_RESOLUTION = tuple(int(size)
+                                      for size in os.getenv('ANALYSIS_PROXY_MAX_RESOLUTION', '1280x720').split('x'))
+# largest frame rate of the analysis proxies, the frames above it being dropped
+ANALYSIS_PROXY_MAX_FPS = float(os.getenv('ANALYSIS_PROXY_MAX_FPS', '30'))
+# number of worker processes processing videos in parallel
+PROCESSING_WORKERS = int(os.getenv('PROCESSING_WORKERS', '3'))
+# directory shared by the worker processes to keep track of the jobs in progress
+PROCESSING_QUEUE_DIRECTORY = os.getenv('PROCESSING_QUEUE_DIRECTORY',
+                                       os.path.join(tempfile.gettempdir(), 'fitness_processing_queue'))
+# number of threads of each worker process evaluating the correction advice of the repetitions of a video in
+# parallel, shared by the jobs of the process
+ADVICE_WORKERS = int(os.getenv('ADVICE_WORKERS', '2'))
+# number of frames with a detected pose from the start of a video recognizing its exercise, when submitted with the
+# 'auto' exercise type
+EXERCISE_CLASSIFICATION_FRAMES = int(os.getenv('EXERCISE_CLASSIFICATION_FRAMES', '300'))
+# videos at least this long (seconds) are processed incrementally, one repetition at a time
+STREAMING_PROCESSING_MIN_DURATION_SECONDS = float(os.getenv('STREAMING_PROCESSING_MIN_DURATION_SECONDS', '300'))
+# landmarks extractor backend, either 'blazepose' or 'replay' to record the landmarks of each video on the first
+# run and replay them for the same video afterwards
+LANDMARKS_EXTRACTOR = os.getenv('LANDMARKS_EXTRACTOR', 'blazepose')
+LANDMARKS_RECORDINGS_DIRECTORY = os.getenv('LANDMARKS_RECORDINGS_DIRECTORY',
+                                           os.path.join(BASE_DIR, 'landmarks_recordings'))
+# directory shared by the worker processes to aggregate the metrics exported at /metrics
+METRICS_DIRECTORY = os.getenv('METRICS_DIRECTORY', os.path.join(tempfile.gettempdir(), 'fitness_metrics'))
+# addresses allowed to read /metrics without authenticating as staff, comma separated, such as the ones of the
+# metrics scrapers
+METRICS_ALLOWED_IPS = tuple(address for address in os.getenv('METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+                            if address)
+# JSON-lines file the spans of the video submissions are appended to, in the Chrome trace event format, the tracing
+# being disabled when empty as by default, since the file grows with every submission
+TRACE_FILE = os.getenv('TRACE_FILE', '')
+# JSON file of the versioned correction rules, reloaded by the worker processes whenever it changes
+CORRECTION_RULES_FILE = os.getenv('CORRECTION_RULES_FILE', os.path.join(BASE_DIR, 'exercise_correction', 'services',
+                                                                        'rules', 'correction_rules.json'))
@@ -1,6 +1,6 @@
-from django.apps import AppConfig
-
-
-class ExerciseCorrectionConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'exercise_correction'
+from django.apps import AppConfig
+
+
+class ExerciseCorrectionConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'exercise_correction'
@@ -0,0 +1,241 @@
+import itertools
+import json
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from ...models.processing_metrics import ProcessingMetrics
+from ...models.video import Video
+from ...services.landmarks_extractor.ReplayLandmarksExtractor import ReplayLandmarksExtractor
+from ...services.pose_correction.FrameResampler import FrameResampler
+from ...services.synthetic.StickFigureVideoRenderer import StickFigureVideoRenderer
+from ...services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+from ...views.video import VideoSubmitView
+
+
+class Command(BaseCommand):
+    help = ("Measures the end-to-end throughput of video submissions on locally generated stick-figure videos, "
+            "driven through the Django test client against a test database.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--exercises', nargs='+', default=['squat', 'bicep_curl', 'pushup'],
+                            choices=sorted(SyntheticPoseGenerator.EXERCISE_ANGLES))
+        parser.add_argument('--resolutions', nargs='+', default=['640x360', '1280x720'],
+                            help="resolutions of the generated videos, as WIDTHxHEIGHT")
+        parser.add_argument('--durations', nargs='+', type=float, default=[10, 30],
+                            help="durations of the generated videos, in seconds")
+        parser.add_argument('--fps', type=float, default=30, help="frame rate of the generated videos")
+        parser.add_argument('--submissions', type=int, default=12, help="number of videos submitted")
+        parser.add_argument('--concurrency', type=int, default=1, help="number of concurrent submissions")
+        parser.add_argument('--pose-estimation', choices=['replay', 'blazepose'], default='replay',
+                            help="'replay' feeds the ground-truth landmarks of the generated videos instead of "
+                                 "running BlazePose, to measure the rest of the pipeline")
+        parser.add_argument('--output', default=None, help="save the report as JSON to this file")
+
+    def handle(self, *args, **options):
+        resolutions = [self._parse_resolution(resolution) for resolution in options['resolutions']]
+        work_directory = tempfile.mkdtemp(prefix='throughput_')
+        recordings_directory = os.path.join(work_directory, 'recordings')
+
+        try:
+            self.stdout.write("Generating videos...")
+            videos = self._generate_videos(work_directory, recordings_directory, options['exercises'], resolutions,
+                                           options['durations'], options['fps'])
+
+            settings_overrides = {'LANDMARKS_RECORDINGS_DIRECTORY': recordings_directory}
+            if options['pose_estimation'] == 'replay':
+                settings_overrides['LANDMARKS_EXTRACTOR'] = 'replay'
+            else:
+                settings_overrides['LANDMARKS_EXTRACTOR'] = 'blazepose'
+
+            with override_settings(**settings_overrides):
+                report = self._run_with_test_database(videos, options['submissions'], options['concurrency'],
+                                                      work_directory)
+        finally:
+            shutil.rmtree(work_directory, ignore_errors=True)
+
+        self._write_report(report)
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(report, file, indent=2)
+
+    @staticmethod
+    def _parse_resolution(resolution: str):
+        try:
+            width, height = resolution.lower().split('x')
+            return int(width), int(height)
+        except ValueError:
+            raise CommandError(f"Invalid resolution: {resolution}")
+
+    @staticmethod
+    def _generate_videos(work_directory, recordings_directory, exercises, resolutions, durations, fps):
+        videos = []
+
+        for exercise_type, (width, height), duration in itertools.product(exercises, resolutions, durations):
+            generator = SyntheticPoseGenerator.for_frame_count(exercise_type, int(duration * fps), fps=fps,
+                                                               noise=0.001, seed=len(videos))
+            video_path = os.path.join(work_directory, f'{exercise_type}_{width}x{height}_{duration:g}s.mp4')
+            frame_count = StickFigureVideoRenderer(width, height, fps).render(generator, video_path)
+
+            landmarks = np.concatenate([block for _, block in generator.iter_landmark_arrays()])
+            recorded_videos = [(video_path, list(range(frame_count)), landmarks)]
+
+            # the view analyzes the proxy of the video instead if it exceeds its bounds, which is transcoded here the
+            # same way so that the recording of its frames is found
+            video_properties = {'fps': fps, 'frame_count': frame_count, 'width': width, 'height': height}
+            analysis_proxy_transcoder = VideoSubmitView.get_analysis_proxy_transcoder()
+            if analysis_proxy_transcoder is not None and analysis_proxy_transcoder.needs_proxy(video_properties):
+                proxy_path = VideoSubmitView.get_proxy_path(video_path)
+                proxy_properties = analysis_proxy_transcoder.transcode(video_path, proxy_path, video_properties)
+                proxy_frames = FrameResampler(fps, proxy_properties['fps']).resample(
+                    {frame: frame for frame in range(frame_count)})
+                recorded_videos.append((proxy_path, list(proxy_frames), landmarks[list(proxy_frames.values())]))
+
+            # record the ground-truth landmarks for every model complexity the view may select
+            for recorded_path, frames, recorded_landmarks in recorded_videos:
+                for model_complexity in range(3):
+                    replay_extractor = ReplayLandmarksExtractor(recordings_directory, None,
+                                                                recording_key=VideoSubmitView.get_recording_key(
+                                                                    model_complexity))
+                    replay_extractor.save_recording(replay_extractor.get_recording_path(recorded_path), frames,
+                                                    recorded_landmarks, frames[-1])
+
+            videos.append({
+                'path': video_path,
+                'exercise_type': exercise_type,
+                'resolution': f'{width}x{height}',
+                'duration': duration,
+                'frames': frame_count,
+                'bytes': os.path.getsize(video_path),
+            })
+
+        return videos
+
+    def _run_with_test_database(self, videos, submissions, concurrency, work_directory):
+        setup_test_environment()
+
+        # concurrent submissions need a database file shared between the connections of the worker threads
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        if connection.vendor == 'sqlite' and not test_settings.get('NAME'):
+            test_settings['NAME'] = os.path.join(work_directory, 'throughput.sqlite3')
+            connection.settings_dict.setdefault('OPTIONS', {})['timeout'] = 3600
+
+        # the repetition clips are written next to the submitted videos, relative to the backend directory
+        os.makedirs('media/processed_videos', exist_ok=True)
+
+        old_database_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            user = get_user_model().objects.create_user(username='throughput', password='throughput')
+            report = self._submit_videos(user, videos, submissions, concurrency)
+            self._remove_media_files()
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0)
+            teardown_test_environment()
+
+        return report
+
+    def _submit_videos(self, user, videos, submissions, concurrency):
+        url = reverse('video_submit')
+
+        def submit(video):
+            client = APIClient()
+            client.force_authenticate(user=user)
+
+            with open(video['path'], 'rb') as video_file:
+                start = time.perf_counter()
+                response = client.post(url, {'video': video_file, 'type': video['exercise_type']},
+                                       format='multipart')
+                latency = time.perf_counter() - start
+
+            # the stage timings of the submission are recorded by the view along with the processed video
+            stages = {}
+            if response.status_code == 200:
+                metrics = ProcessingMetrics.objects.filter(video_id=response.data['id']).first()
+                if metrics is not None:
+                    stages = {stage: measurements['wall_seconds'] for stage, measurements in metrics.stages.items()}
+
+            connection.close()
+
+            return {'video': video, 'status_code': response.status_code, 'latency': latency, 'stages': stages}
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(submit, [videos[i % len(videos)] for i in range(submissions)]))
+        wall_time = time.perf_counter() - start
+
+        return self._build_report(results, wall_time, concurrency)
+
+    @staticmethod
+    def _build_report(results, wall_time, concurrency):
+        latencies = np.array([result['latency'] for result in results])
+        succeeded = [result for result in results if result['status_code'] == 200]
+
+        stages = defaultdict(list)
+        for result in succeeded:
+            for stage, seconds in result['stages'].items():
+                stages[stage].append(seconds)
+
+        by_video = defaultdict(list)
+        for result in results:
+            video = result['video']
+            by_video[(video['exercise_type'], video['resolution'], video['duration'])].append(result['latency'])
+
+        return {
+            'submissions': len(results),
+            'succeeded': len(succeeded),
+            'status_codes': {str(code): sum(1 for result in results if result['status_code'] == code)
+                             for code in sorted({result['status_code'] for result in results})},
+            'concurrency': concurrency,
+            'wall_time': wall_time,
+            'videos_per_minute': len(succeeded) / wall_time * 60 if wall_time > 0 else 0,
+            'latency': {f'p{percentile}': float(np.percentile(latencies, percentile))
+                        for percentile in (50, 90, 95, 99)},
+            # the peak resident set size of the whole process, in kilobytes on Linux
+            'peak_rss_kilobytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'stages': {stage: {'mean': float(np.mean(seconds)), 'p95': float(np.percentile(seconds, 95))}
+                       for stage, seconds in stages.items()},
+            'videos': [{'exercise_type': exercise_type, 'resolution': resolution, 'duration': duration,
+                        'submissions': len(video_latencies), 'mean_latency': float(np.mean(video_latencies))}
+                       for (exercise_type, resolution, duration), video_latencies in by_video.items()],
+        }
+
+    @staticmethod
+    def _remove_media_files():
+        for video in Video.objects.prefetch_related('repetitions'):
+            for repetition in video.repetitions.all():
+                repetition.repetition.delete(save=False)
+            video.video.delete(save=False)
+
+    def _write_report(self, report):
+        self.stdout.write(f"Submissions: {report['submissions']} ({report['succeeded']} succeeded, "
+                          f"status codes {report['status_codes']}), concurrency {report['concurrency']}")
+        self.stdout.write(f"Throughput: {report['videos_per_minute']:.2f} videos/minute "
+                          f"over {report['wall_time']:.2f} s")
+        self.stdout.write("Latency: " + ', '.join(f"{name} {seconds:.3f} s"
+                                                  for name, seconds in report['latency'].items()))
+        self.stdout.write(f"Peak RSS: {report['peak_rss_kilobytes'] / 1024:.1f} MiB")
+
+        self.stdout.write("Stages (mean / p95 per submission):")
+        for stage, statistics in sorted(report['stages'].items(), key=lambda item: -item[1]['mean']):
+            self.stdout.write(f"  {stage:<22} {statistics['mean']:.3f} s / {statistics['p95']:.3f} s")
+
+        self.stdout.write("Videos (mean latency):")
+        for video in report['videos']:
+            self.stdout.write(f"  {video['exercise_type']:<11} {video['resolution']:>10} {video['duration']:>6g} s "
+                              f"{video['mean_latency']:.3f} s over {video['submissions']} submissions")
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...services.monitoring.Tracer import Tracer
+
+
+class Command(BaseCommand):
+    help = ("Exports the spans of a traced video submission, whose id is returned in the X-Trace-Id header, as a JSON "
+            "file which can be opened in the Chrome or Perfetto trace viewers.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('trace_id')
+        parser.add_argument('--output', default=None, help="path of the JSON file, trace_<trace id>.json by default")
+        parser.add_argument('--trace-file', default=None, help="JSON-lines file of the spans, TRACE_FILE by default")
+
+    def handle(self, *args, **options):
+        trace_file = options['trace_file'] or settings.TRACE_FILE
+        if not trace_file:
+            raise CommandError("Tracing is disabled, set TRACE_FILE to enable it")
+
+        try:
+            events = Tracer.load_trace(trace_file, options['trace_id'])
+        except FileNotFoundError:
+            raise CommandError(f"Trace file not found: {trace_file}")
+
+        if not events:
+            raise CommandError(f"Trace not found: {options['trace_id']}")
+
+        output = options['output'] or f"trace_{options['trace_id']}.json"
+        Tracer.save_chrome_trace(events, output)
+
+        self.stdout.write(f"Exported {len(events)} spans to {output}")
@@ -0,0 +1,37 @@
+from django.conf import settings
+
+from .services.monitoring.MetricsRegistry import MetricsRegistry
+
+
+metrics_registry = MetricsRegistry(settings.METRICS_DIRECTORY)
+
+metrics_registry.register_histogram('http_request_duration_seconds', "Latency of the HTTP requests, per view.",
+                                    labels=('view', 'method', 'status'))
+metrics_registry.register_histogram('http_request_db_queries', "Database queries executed per HTTP request.",
+                                    labels=('view', 'method'),
+                                    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000))
+metrics_registry.register_histogram('video_processing_stage_seconds',
+                                    "Wall time spent in each processing stage of a submitted video.",
+                                    labels=('exercise_type', 'stage'),
+                                    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600))
+metrics_registry.register_histogram('video_processing_frames_per_second',
+                                    "Frames of a submitted video processed per second of its whole processing.",
+                                    labels=('exercise_type',),
+                                    buckets=(1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120, 240, 480))
+metrics_registry.register_counter('video_processing_frames_total', "Frames of the submitted videos processed.",
+                                  labels=('exercise_type',))
+metrics_registry.register_counter('media_bytes_written_total', "Bytes of media files written, per processing stage.",
+                                  labels=('stage',))
+metrics_registry.register_counter('analysis_proxy_failures_total',
+                                  "Submitted videos analyzed in full size because their proxy could not be written.")
+metrics_registry.register_gauge('processing_queue_depth', "Videos being processed by any worker process.",
+                                aggregation='shared')
+metrics_registry.register_gauge('pose_graph_pool_graphs', "Pose estimation graphs of the pools, in use or idle.",
+                                labels=('model_complexity', 'state'))
+metrics_registry.register_counter('pose_graph_pool_acquisitions_total',
+                                  "Pose estimation graphs lent by the pools, reused or newly created.",
+                                  labels=('model_complexity', 'result'))
+metrics_registry.register_counter('pose_graph_pool_busy_seconds_total',
+                                  "Seconds the pose estimation graphs were lent for, whose rate is the average "
+                                  "number of graphs in use.",
+                                  labels=('model_complexity',))
@@ -0,0 +1,36 @@
+import time
+
+from django.db import connection
+
+from ..metrics import metrics_registry
+
+
+class MetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        query_count = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal query_count
+            query_count += 1
+            return execute(sql, params, many, context)
+
+        start_time = time.perf_counter()
+        status_code = 500
+        try:
+            with connection.execute_wrapper(count_query):
+                response = self.get_response(request)
+            status_code = response.status_code
+            return response
+        finally:
+            # label the requests by their route rather than their path, to bound the number of label values
+            resolver_match = getattr(request, 'resolver_match', None)
+            view = resolver_match.view_name if resolver_match is not None else 'unmatched'
+            labels = {'view': view, 'method': request.method}
+
+            metrics_registry.observe('http_request_duration_seconds', time.perf_counter() - start_time,
+                                     dict(labels, status=str(status_code)))
+            metrics_registry.observe('http_request_db_queries', query_count, labels)
+            metrics_registry.flush()
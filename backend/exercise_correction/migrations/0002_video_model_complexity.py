@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-19 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise_correction', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='model_complexity',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.6 on 2026-10-19 03:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise_correction', '0002_video_model_complexity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingMetrics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('width', models.PositiveIntegerField(blank=True, null=True)),
+                ('height', models.PositiveIntegerField(blank=True, null=True)),
+                ('frame_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('total_wall_seconds', models.FloatField()),
+                ('stages', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('video', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='processing_metrics', to='exercise_correction.video')),
+            ],
+        ),
+    ]
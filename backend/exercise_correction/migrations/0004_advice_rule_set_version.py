@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-19 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exercise_correction', '0003_processingmetrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='advice',
+            name='rule_set_version',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+    ]
@@ -1,13 +1,14 @@
-from django.db import models
-
-from .repetition import Repetition
-
-
-class Advice(models.Model):
-    repetition = models.ForeignKey(Repetition, related_name='advice', on_delete=models.CASCADE)
-    category = models.TextField()
-    text = models.TextField()
-    correction_level = models.IntegerField()
-
-    def __str__(self):
-        return f"Advice of type {self.category} for repetition {self.repetition.id} with level {self.correction_level}"
+from django.db import models
+
+from .repetition import Repetition
+
+
+class Advice(models.Model):
+    repetition = models.ForeignKey(Repetition, related_name='advice', on_delete=models.CASCADE)
+    category = models.TextField()
+    text = models.TextField()
+    correction_level = models.IntegerField()
+    rule_set_version = models.CharField(max_length=50, null=True, blank=True)
+
+    def __str__(self):
+        return f"Advice of type {self.category} for repetition {self.repetition.id} with level {self.correction_level}"
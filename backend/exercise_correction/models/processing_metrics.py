@@ -0,0 +1,22 @@
+from django.db import models
+
+from .video import Video
+
+
+class ProcessingMetrics(models.Model):
+    video = models.OneToOneField(Video, on_delete=models.CASCADE, related_name='processing_metrics')
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    frame_count = models.PositiveIntegerField(null=True, blank=True)
+    total_wall_seconds = models.FloatField()
+    # wall_seconds, cpu_seconds, frames and bytes_written of each processing stage, by stage name
+    stages = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def get_resolution(self) -> str:
+        if self.width is None or self.height is None:
+            return 'unknown'
+        return f'{self.width}x{self.height}'
+
+    def __str__(self):
+        return f"Processing metrics of Video {self.video.id}"
@@ -1,20 +1,20 @@
-from django.db import models
-from django.contrib.auth.models import User
-
-
-class UserProfile(models.Model):
-    GENDER_CHOICES = [
-        ('M', 'Male'),
-        ('F', 'Female'),
-        ('O', 'Other'),
-    ]
-
-    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
-    birthday = models.DateField(null=True, blank=True)
-    height_cm = models.PositiveIntegerField("Height (cm)", null=True, blank=True)
-    weight_kg = models.DecimalField("Weight (kg)", max_digits=5, decimal_places=2, null=True, blank=True)
-    gender = models.CharField(max_length=1, choices=GENDER_CHOICES, null=True, blank=True)
-    avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)
-
-    def __str__(self):
-        return self.user.username + "'s profile"
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class UserProfile(models.Model):
+    GENDER_CHOICES = [
+        ('M', 'Male'),
+        ('F', 'Female'),
+        ('O', 'Other'),
+    ]
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
+    birthday = models.DateField(null=True, blank=True)
+    height_cm = models.PositiveIntegerField("Height (cm)", null=True, blank=True)
+    weight_kg = models.DecimalField("Weight (kg)", max_digits=5, decimal_places=2, null=True, blank=True)
+    gender = models.CharField(max_length=1, choices=GENDER_CHOICES, null=True, blank=True)
+    avatar = models.ImageField(upload_to='avatars/', null=True, blank=True)
+
+    def __str__(self):
+        return self.user.username + "'s profile"
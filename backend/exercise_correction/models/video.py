@@ -1,18 +1,25 @@
-from django.db import models
-from django.conf import settings
-
-
-class Video(models.Model):
-    EXERCISE_CHOICES = [
-        ('squat', 'Squat'),
-        ('bicep_curl', 'Bicep Curl'),
-        ('pushup', 'Pushup'),
-    ]
-
-    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='videos')
-    video = models.FileField(upload_to='submitted_videos/')
-    exercise_type = models.CharField(max_length=50, choices=EXERCISE_CHOICES)
-    created_at = models.DateTimeField(auto_now_add=True)
-
-    def __str__(self):
-        return f"Video {self.id} uploaded by {self.user.username}"
+from django.db import models
+from django.conf import settings
+
+
+class Video(models.Model):
+    EXERCISE_CHOICES = [
+        ('squat', 'Squat'),
+        ('bicep_curl', 'Bicep Curl'),
+        ('pushup', 'Pushup'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='videos')
+    video = models.FileField(upload_to='submitted_videos/')
+    exercise_type = models.CharField(max_length=50, choices=EXERCISE_CHOICES)
+    model_complexity = models.PositiveSmallIntegerField(null=True, blank=True)
+    # container metadata probed on submission
+    fps = models.FloatField(null=True, blank=True)
+    width = models.PositiveIntegerField(null=True, blank=True)
+    height = models.PositiveIntegerField(null=True, blank=True)
+    frame_count = models.PositiveIntegerField(null=True, blank=True)
+    duration_seconds = models.FloatField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Video {self.id} uploaded by {self.user.username}"
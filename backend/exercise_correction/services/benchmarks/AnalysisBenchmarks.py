@@ -0,0 +1,141 @@
+import inspect
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..benchmarks.BenchmarkRunner import BenchmarkRunner
+from ..pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from ..pose_correction.PoseAnalyzer import PoseAnalyzer
+from ..synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class AnalysisBenchmarks:
+    DEFAULT_SIZES = (1000, 100000, 1000000)
+    # segmentation thresholds of the squat, whose knee angle is synthesized
+    ANGLE_THRESHOLD = 135
+    ERROR_THRESHOLD = 15
+    CHANGE_THRESHOLD = 15
+
+    def __init__(self, pose_analyzer: PoseAnalyzer = None, seed: int = 0) -> None:
+        """
+        Benchmarks of the per-frame analysis hot path: every per-frame compute_* method of PoseAnalyzer and the
+        AnglesAnalyzer methods running over whole videos, on synthetic squats.
+
+        :param pose_analyzer: Pose analyzer benchmarked, defaults to the BlazePose one.
+        :param seed: Seed of the synthetic squats.
+        """
+        self._pose_analyzer = PoseAnalyzer() if pose_analyzer is None else pose_analyzer
+        self._seed = seed
+
+    def get_frame_method_names(self) -> List[str]:
+        """
+        Gets the names of the PoseAnalyzer methods computing a value from the landmarks of a single frame.
+
+        :return: List of method names.
+        """
+        return [name for name, method in inspect.getmembers(self._pose_analyzer, inspect.ismethod)
+                if name.startswith('compute_') and list(inspect.signature(method).parameters) == ['landmarks']]
+
+    def get_angle_names(self) -> List[str]:
+        """
+        Gets the names of the angles which AnglesAnalyzer.compute_angles can compute.
+
+        :return: List of angle names.
+        """
+        return [name[len('compute_'):-len('_angle')] for name in self.get_frame_method_names()
+                if name.endswith('_angle')]
+
+    def run(self, runner: BenchmarkRunner, sizes: List[int] = DEFAULT_SIZES, name_filter: Optional[str] = None) -> \
+            List[dict]:
+        """
+        Runs the benchmarks on synthetic inputs of each size.
+
+        :param runner: Runner timing the benchmarks.
+        :param sizes: Numbers of frames of the inputs.
+        :param name_filter: Only run the benchmarks whose name contains this string.
+
+        :return: The statistics of the benchmarks run.
+        """
+        results = []
+
+        for frames in sizes:
+            for name, function in self.create_benchmarks(frames).items():
+                if name_filter is None or name_filter in name:
+                    results.append(runner.run(name, function, frames))
+
+        return results
+
+    def create_benchmarks(self, frames: int) -> Dict[str, callable]:
+        """
+        Creates the benchmarked functions over inputs of the given size.
+
+        :param frames: Number of frames of the inputs.
+
+        :return: Dictionary with benchmark names as keys and functions to time as values.
+        """
+        landmarks_dictionary = self.create_landmarks_dictionary(frames)
+        angles = self.create_angles(frames)
+        angle_names = self.get_angle_names()
+        split_frames = AnglesAnalyzer.get_repetition_split_frames(angles, self.ANGLE_THRESHOLD, self.ERROR_THRESHOLD,
+                                                                  self.CHANGE_THRESHOLD)
+        # a squat splits the angles of the trunk and of the knee
+        angles_data = {'right_shoulder_hip_knee': angles, 'right_hip_knee_ankle': angles}
+
+        benchmarks = {}
+
+        for method_name in self.get_frame_method_names():
+            benchmarks[f'PoseAnalyzer.{method_name}'] = self._create_frame_benchmark(
+                getattr(self._pose_analyzer, method_name), landmarks_dictionary)
+
+        def compute_angles():
+            AnglesAnalyzer(landmarks_dictionary, self._pose_analyzer).compute_angles(angle_names)
+
+        benchmarks['AnglesAnalyzer.compute_angles'] = compute_angles
+        benchmarks['AnglesAnalyzer.get_repetition_split_frames'] = lambda: AnglesAnalyzer.get_repetition_split_frames(
+            angles, self.ANGLE_THRESHOLD, self.ERROR_THRESHOLD, self.CHANGE_THRESHOLD)
+        benchmarks['AnglesAnalyzer.split_angles_data_into_repetitions'] = \
+            lambda: AnglesAnalyzer.split_angles_data_into_repetitions(angles_data, split_frames)
+        benchmarks['AnglesAnalyzer.split_landmarks_data_into_repetitions'] = \
+            lambda: AnglesAnalyzer.split_landmarks_data_into_repetitions(landmarks_dictionary, split_frames)
+        benchmarks['AnglesAnalyzer.get_eccentric_and_concentric_frames'] = \
+            lambda: AnglesAnalyzer.get_eccentric_and_concentric_frames(angles, self.ANGLE_THRESHOLD)
+
+        return benchmarks
+
+    def create_landmarks_dictionary(self, frames: int) -> Dict[int, list]:
+        """
+        Creates a processed landmarks dictionary of synthetic squats. The landmarks of a single repetition are
+        shared by all the repetitions, so that a million frames fit in memory.
+
+        :param frames: Number of frames.
+
+        :return: Dictionary with frame numbers as keys and (x, y, z) landmarks as values.
+        """
+        generator = SyntheticPoseGenerator('squat', repetitions=1, noise=0.002, seed=self._seed)
+        repetition = [[list(values[:3]) for values in landmarks]
+                      for landmarks in generator.generate_landmarks_dictionary().values()]
+
+        return {frame: repetition[frame % len(repetition)] for frame in range(frames)}
+
+    def create_angles(self, frames: int) -> Dict[int, float]:
+        """
+        Creates the knee angles of synthetic squats.
+
+        :param frames: Number of frames.
+
+        :return: Dictionary with frame numbers as keys and angles as values.
+        """
+        generator = SyntheticPoseGenerator.for_frame_count('squat', frames)
+        angles = generator.compute_joint_angles(np.arange(frames))
+        angles += np.random.default_rng(self._seed).normal(0, 1, frames)
+
+        return dict(enumerate(angles.tolist()))
+
+    @staticmethod
+    def _create_frame_benchmark(method: callable, landmarks_dictionary: Dict[int, list]) -> callable:
+        def benchmark():
+            for landmarks in landmarks_dictionary.values():
+                method(landmarks)
+
+        return benchmark
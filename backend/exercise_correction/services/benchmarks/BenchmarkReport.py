@@ -0,0 +1,127 @@
+import json
+import platform
+import sys
+
+from datetime import datetime, timezone
+from typing import List
+
+import numpy as np
+
+
+class BenchmarkReport:
+    FORMAT_VERSION = 1
+
+    @staticmethod
+    def save(results: List[dict], file_path: str) -> None:
+        """
+        Saves benchmark results as a JSON baseline, along with the environment they were measured in.
+
+        :param results: Statistics of the benchmarks, as returned by BenchmarkRunner.
+        :param file_path: Path to the JSON file.
+        """
+        baseline = {
+            'format_version': BenchmarkReport.FORMAT_VERSION,
+            'created': datetime.now(timezone.utc).isoformat(),
+            'machine': {
+                'python': sys.version.split()[0],
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'processor': platform.processor(),
+            },
+            'benchmarks': results,
+        }
+
+        with open(file_path, 'w') as file:
+            json.dump(baseline, file, indent=2)
+
+    @staticmethod
+    def load(file_path: str) -> List[dict]:
+        """
+        Loads benchmark results from a JSON baseline.
+
+        :param file_path: Path to the JSON file.
+
+        :return: Statistics of the benchmarks.
+        """
+        with open(file_path, 'r') as file:
+            baseline = json.load(file)
+
+        if baseline.get('format_version') != BenchmarkReport.FORMAT_VERSION:
+            raise ValueError(f"Unsupported benchmark baseline format: {baseline.get('format_version')}")
+
+        return baseline['benchmarks']
+
+    @staticmethod
+    def compare(baseline: List[dict], current: List[dict], tolerance: float = 0.1) -> List[dict]:
+        """
+        Compares the median times of the benchmarks present in both results.
+
+        :param baseline: Statistics of the benchmarks before a change.
+        :param current: Statistics of the benchmarks after a change.
+        :param tolerance: Relative change of the median time below which a benchmark is considered unchanged.
+
+        :return: A list of comparisons, with the baseline and current median times, their ratio and a status
+        which is one of 'faster', 'slower' and 'unchanged'.
+        """
+        baseline_medians = {(result['name'], result['frames']): result['median'] for result in baseline}
+        comparisons = []
+
+        for result in current:
+            key = (result['name'], result['frames'])
+            if key not in baseline_medians:
+                continue
+
+            baseline_median = baseline_medians[key]
+            ratio = result['median'] / baseline_median if baseline_median > 0 else float('inf')
+
+            if ratio > 1 + tolerance:
+                status = 'slower'
+            elif ratio < 1 - tolerance:
+                status = 'faster'
+            else:
+                status = 'unchanged'
+
+            comparisons.append({
+                'name': result['name'],
+                'frames': result['frames'],
+                'baseline': baseline_median,
+                'current': result['median'],
+                'ratio': ratio,
+                'status': status,
+            })
+
+        return comparisons
+
+    @staticmethod
+    def format_results(results: List[dict]) -> str:
+        """
+        Formats benchmark results as a text table.
+
+        :param results: Statistics of the benchmarks.
+
+        :return: The table.
+        """
+        lines = [f"{'benchmark':<50} {'frames':>9} {'rounds':>6} {'median (ms)':>12} {'stddev (ms)':>12} "
+                 f"{'frames/s':>12}"]
+        for result in results:
+            lines.append(f"{result['name']:<50} {result['frames']:>9} {result['rounds']:>6} "
+                         f"{result['median'] * 1000:>12.3f} {result['stddev'] * 1000:>12.3f} "
+                         f"{result['frames_per_second']:>12.0f}")
+
+        return '\n'.join(lines)
+
+    @staticmethod
+    def format_comparison(comparisons: List[dict]) -> str:
+        """
+        Formats benchmark comparisons as a text table.
+
+        :param comparisons: Comparisons, as returned by compare.
+
+        :return: The table.
+        """
+        lines = [f"{'benchmark':<50} {'frames':>9} {'baseline (ms)':>14} {'current (ms)':>13} {'ratio':>7} status"]
+        for comparison in comparisons:
+            lines.append(f"{comparison['name']:<50} {comparison['frames']:>9} {comparison['baseline'] * 1000:>14.3f} "
+                         f"{comparison['current'] * 1000:>13.3f} {comparison['ratio']:>7.2f} {comparison['status']}")
+
+        return '\n'.join(lines)
@@ -0,0 +1,75 @@
+import gc
+import statistics
+import time
+
+from typing import Callable, List
+
+
+class BenchmarkRunner:
+    def __init__(self, min_rounds: int = 3, max_rounds: int = 1000, min_time: float = 0.5,
+                 max_time: float = 30.0) -> None:
+        """
+        Times functions over repeated rounds, in the style of pytest-benchmark, and collects their statistics.
+        Rounds are repeated until both min_rounds and min_time are reached, but stop at max_rounds or once
+        max_time is exceeded, so that slow benchmarks on large inputs still finish in a reasonable time.
+
+        :param min_rounds: Minimum number of rounds of each benchmark.
+        :param max_rounds: Maximum number of rounds of each benchmark.
+        :param min_time: Minimum total time spent on each benchmark, in seconds.
+        :param max_time: Time after which no new round of a benchmark is started, in seconds.
+        """
+        self._min_rounds = min_rounds
+        self._max_rounds = max_rounds
+        self._min_time = min_time
+        self._max_time = max_time
+        self._results = []
+
+    def get_results(self) -> List[dict]:
+        return self._results
+
+    def run(self, name: str, function: Callable[[], object], frames: int) -> dict:
+        """
+        Times a function and stores its statistics.
+
+        :param name: Name of the benchmark.
+        :param function: Function timed, called without arguments once per round.
+        :param frames: Number of frames processed by a call of the function.
+
+        :return: The statistics of the benchmark, with times in seconds.
+        """
+        timings = []
+        total_time = 0.0
+
+        # garbage collection is disabled while timing, like timeit does, to reduce the variance between rounds
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while len(timings) < self._max_rounds:
+                start = time.perf_counter()
+                function()
+                timings.append(time.perf_counter() - start)
+                total_time += timings[-1]
+
+                if len(timings) >= self._min_rounds and total_time >= self._min_time:
+                    break
+                if total_time >= self._max_time:
+                    break
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        median = statistics.median(timings)
+        result = {
+            'name': name,
+            'frames': frames,
+            'rounds': len(timings),
+            'min': min(timings),
+            'max': max(timings),
+            'mean': statistics.mean(timings),
+            'median': median,
+            'stddev': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            'frames_per_second': frames / median if median > 0 else float('inf'),
+        }
+        self._results.append(result)
+
+        return result
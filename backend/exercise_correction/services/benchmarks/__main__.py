@@ -0,0 +1,49 @@
+"""
+Runs the analysis microbenchmarks from the backend directory:
+
+    python -m exercise_correction.services.benchmarks --sizes 1000 100000 1000000 --save after.json --compare before.json
+"""
+import argparse
+import sys
+
+from .AnalysisBenchmarks import AnalysisBenchmarks
+from .BenchmarkReport import BenchmarkReport
+from .BenchmarkRunner import BenchmarkRunner
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks of the pose and angles analysis.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(AnalysisBenchmarks.DEFAULT_SIZES),
+                        help="numbers of frames of the benchmark inputs")
+    parser.add_argument('--filter', default=None, help="only run the benchmarks whose name contains this string")
+    parser.add_argument('--min-rounds', type=int, default=3, help="minimum number of rounds of each benchmark")
+    parser.add_argument('--max-time', type=float, default=30.0,
+                        help="seconds after which no new round of a benchmark is started")
+    parser.add_argument('--save', default=None, help="save the results as a JSON baseline to this file")
+    parser.add_argument('--compare', default=None, help="compare the results with this JSON baseline")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="relative change of the median time below which a benchmark is unchanged")
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="exit with an error if a benchmark is slower than the baseline")
+    args = parser.parse_args(arguments)
+
+    runner = BenchmarkRunner(min_rounds=args.min_rounds, max_time=args.max_time)
+    results = AnalysisBenchmarks().run(runner, args.sizes, args.filter)
+    print(BenchmarkReport.format_results(results))
+
+    if args.save:
+        BenchmarkReport.save(results, args.save)
+
+    if args.compare:
+        comparisons = BenchmarkReport.compare(BenchmarkReport.load(args.compare), results, args.tolerance)
+        print()
+        print(BenchmarkReport.format_comparison(comparisons))
+
+        if args.fail_on_regression and any(comparison['status'] == 'slower' for comparison in comparisons):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,35 +1,35 @@
-BLAZE_POSE_LANDMARKS = {
-    'nose': 0,
-    'left eye inner': 1,
-    'left eye': 2,
-    'left eye outer': 3,
-    'right eye inner': 4,
-    'right eye': 5,
-    'right eye outer': 6,
-    'left ear': 7,
-    'right ear': 8,
-    'left mouth': 9,
-    'right mouth': 10,
-    'left shoulder': 11,
-    'right shoulder': 12,
-    'left elbow': 13,
-    'right elbow': 14,
-    'left wrist': 15,
-    'right wrist': 16,
-    'left pinky': 17,
-    'right pinky': 18,
-    'left index': 19,
-    'right index': 20,
-    'left thumb': 21,
-    'right thumb': 22,
-    'left hip': 23,
-    'right hip': 24,
-    'left knee': 25,
-    'right knee': 26,
-    'left ankle': 27,
-    'right ankle': 28,
-    'left heel': 29,
-    'right heel': 30,
-    'left foot index': 31,
-    'right foot index': 32
-}
+BLAZE_POSE_LANDMARKS = {
+    'nose': 0,
+    'left eye inner': 1,
+    'left eye': 2,
+    'left eye outer': 3,
+    'right eye inner': 4,
+    'right eye': 5,
+    'right eye outer': 6,
+    'left ear': 7,
+    'right ear': 8,
+    'left mouth': 9,
+    'right mouth': 10,
+    'left shoulder': 11,
+    'right shoulder': 12,
+    'left elbow': 13,
+    'right elbow': 14,
+    'left wrist': 15,
+    'right wrist': 16,
+    'left pinky': 17,
+    'right pinky': 18,
+    'left index': 19,
+    'right index': 20,
+    'left thumb': 21,
+    'right thumb': 22,
+    'left hip': 23,
+    'right hip': 24,
+    'left knee': 25,
+    'right knee': 26,
+    'left ankle': 27,
+    'right ankle': 28,
+    'left heel': 29,
+    'right heel': 30,
+    'left foot index': 31,
+    'right foot index': 32
+}
@@ -1,12 +1,26 @@
-class LandmarkExtractionError(Exception):
-    """Exception raised for errors in the landmark extraction process."""
-    def __init__(self, message="Error extracting landmarks"):
-        self.message = message
-        super().__init__(self.message)
-
-
-class AngleComputationError(Exception):
-    """Exception raised for errors in the angle computation process."""
-    def __init__(self, message="Error computing angles"):
-        self.message = message
-        super().__init__(self.message)
\ No newline at end of file
+class LandmarkExtractionError(Exception):
+    """Exception raised for errors in the landmark extraction process."""
+    def __init__(self, message="Error extracting landmarks"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class AngleComputationError(Exception):
+    """Exception raised for errors in the angle computation process."""
+    def __init__(self, message="Error computing angles"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class RuleSetError(Exception):
+    """Exception raised for invalid correction rule sets."""
+    def __init__(self, message="Invalid correction rule set"):
+        self.message = message
+        super().__init__(self.message)
+
+
+class VideoProbeError(Exception):
+    """Exception raised for videos rejected by their probe before their processing."""
+    def __init__(self, message="The video cannot be processed"):
+        self.message = message
+        super().__init__(self.message)
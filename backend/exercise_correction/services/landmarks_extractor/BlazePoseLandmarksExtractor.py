@@ -1,188 +1,217 @@
-from typing import List
-
-import cv2
-import mediapipe as mp
-import numpy as np
-from scipy.interpolate import interp1d
-
-from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
-
-
-class BlazePoseLandmarksExtractor(LandmarksExtractor):
-    def __init__(self) -> None:
-        super().__init__()
-        self._pose = mp.solutions.pose.Pose(
-            static_image_mode=False,
-            model_complexity=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-
-    def extract_landmarks_from_video(self, video_path: str) -> None:
-        """
-        Extracts pose landmarks from a video and stores them in a dictionary.
-
-        :param video_path: Path to the video file.
-        """
-        self._landmarks_dictionary = dict()
-
-        cap = cv2.VideoCapture(video_path)
-        frame_index = 0
-
-        while cap.isOpened():
-            success, image = cap.read()
-            if not success:
-                break
-
-            # convert the image to RGB as MediaPipe requires RGB images
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            results = self._pose.process(image_rgb)
-
-            # store the landmarks if pose landmarks are detected
-            if results.pose_landmarks:
-                landmarks = [(lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark]
-                self._landmarks_dictionary[frame_index] = landmarks
-
-            frame_index += 1
-
-        self._total_frames = frame_index - 1
-
-        cap.release()
-
-    @staticmethod
-    def extract_landmarks_from_image(image_path: str) -> List[tuple] or None:
-        """
-        Extracts pose landmarks from a single image.
-
-        :param image_path: Path to the image file.
-
-        :return: List of tuples containing the landmarks or None if no landmarks were found.
-        """
-        pose = mp.solutions.pose.Pose(
-            static_image_mode=True,
-            model_complexity=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-
-        image = cv2.imread(image_path)
-        if image is None:
-            raise ValueError("Error loading image.")
-
-        # convert the image to RGB since MediaPipe requires RGB images
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        results = pose.process(image_rgb)
-
-        if results.pose_landmarks:
-            landmarks = [(lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark]
-            return landmarks
-        else:
-            return None
-
-    @staticmethod
-    def filter_low_confidence_keypoints(data, threshold=0.5):
-        """
-        Filters out low confidence keypoints from the data.
-
-        :param data: Dictionary of keypoints.
-        :param threshold: Confidence threshold for filtering.
-
-        :return: Filtered dictionary of keypoints.
-        """
-        filtered_data = {}
-
-        for frame, keypoints in data.items():
-            filtered_keypoints = [
-                np.array(values[:-1]) if values[-1] >= threshold else None for values in keypoints
-            ]
-            filtered_data[frame] = filtered_keypoints
-
-        return filtered_data
-
-    @staticmethod
-    def interpolate_keypoints(data):
-        """
-        Interpolates missing keypoints in the data.
-
-        :param data: Dictionary of keypoints.
-        :return: Dictionary of keypoints with interpolated missing values.
-        """
-        # sort frames and get number of keypoints
-        frames = sorted(data.keys())
-        num_keypoints = len(data[frames[0]])
-
-        # create dictionary to store interpolated data
-        interpolated_data = {frame: [None] * num_keypoints for frame in frames}
-
-        for i in range(num_keypoints):
-            keypoint_values = []
-            valid_frames = []
-
-            # get valid frames and keypoint values for the current keypoint
-            for frame in frames:
-                keypoint = data[frame][i]
-                if keypoint is not None:
-                    keypoint_values.append(keypoint)
-                    valid_frames.append(frame)
-
-            # if there are more than one valid frames, interpolate missing values
-            if len(valid_frames) > 1:
-                # interpolate each dimension of the keypoint
-                keypoint_values = np.array(keypoint_values)
-                interpolated_keypoints = []
-
-                for dim in range(keypoint_values.shape[1]):
-                    dim_values = keypoint_values[:, dim]
-                    interp_func = interp1d(valid_frames, dim_values, bounds_error=False, fill_value="extrapolate")
-                    interpolated_keypoints.append(interp_func(frames))
-
-                interpolated_keypoints = np.array(interpolated_keypoints).T
-
-                # fill in the interpolated values
-                for j, frame in enumerate(frames):
-                    if data[frame][i] is None:
-                        interpolated_data[frame][i] = interpolated_keypoints[j]
-                    else:
-                        interpolated_data[frame][i] = data[frame][i]
-            elif len(valid_frames) == 1:
-                # of there is only one valid frame, use its keypoint to fill in all frames
-                for frame in frames:
-                    interpolated_data[frame][i] = data[valid_frames[0]][i]
-            else:
-                # if no valid frames, set all to None
-                for frame in frames:
-                    interpolated_data[frame][i] = None
-
-        return interpolated_data
-
-    @staticmethod
-    def convert_arrays_to_lists(data):
-        """
-        Converts numpy arrays in the keypoints data to lists.
-
-        :param data: Dictionary of keypoints.
-
-        :return: Dictionary of keypoints with lists instead of numpy arrays.
-        """
-        for frame, keypoints in data.items():
-            for i in range(len(keypoints)):
-                if keypoints[i] is not None:
-                    keypoints[i] = keypoints[i].tolist()
-
-        return data
-
-    def process_keypoints(self, data, threshold=0.5):
-        """
-        Processes keypoints by filtering low confidence points, interpolating missing points,
-        and converting arrays to lists.
-
-        :param data: Dictionary of keypoints.
-        :param threshold: Confidence threshold for filtering.
-
-        :return: Processed dictionary of keypoints.
-        """
-        filtered_data = self.filter_low_confidence_keypoints(data, threshold)
-        interpolated_data = self.interpolate_keypoints(filtered_data)
-        list_converted_data = self.convert_arrays_to_lists(interpolated_data)
-
-        return list_converted_data
+from typing import Iterator, List, Optional, Tuple
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from ..landmarks_extractor.MotionGate import MotionGate
+from ..landmarks_extractor.OpticalFlowLandmarksPropagator import OpticalFlowLandmarksPropagator
+from ..landmarks_extractor.PoseGraphPool import PoseGraphPool
+
+
+class BlazePoseLandmarksExtractor(LandmarksExtractor):
+    def __init__(self, model_complexity: int = 2, graph_pool: PoseGraphPool = None,
+                 motion_gate: MotionGate = None, keyframe_interval: int = 1,
+                 landmarks_propagator: OpticalFlowLandmarksPropagator = None) -> None:
+        """
+        :param model_complexity: Model complexity of the pose estimation graph.
+        :param graph_pool: Pool to borrow the pose estimation graph from while extracting the landmarks of a video,
+        or None to create a graph for this extractor.
+        :param motion_gate: Gate skipping the pose estimation on the frames of the idle stretches of the video, whose
+        landmarks are filled in from the surrounding keyframes, the idle start and end of the video being trimmed.
+        The pose is estimated on every frame if None.
+        :param keyframe_interval: Minimum number of frames between two keyframes, the pose being estimated on every
+        moving frame if 1.
+        :param landmarks_propagator: Propagator tracking the landmarks of the keyframes over the frames skipped after
+        them, which are interpolated between the keyframes if None.
+        """
+        super().__init__()
+        self._model_complexity = model_complexity
+        self._graph_pool = graph_pool
+        self._motion_gate = motion_gate
+        self._keyframe_interval = keyframe_interval
+        self._landmarks_propagator = landmarks_propagator
+        # created on first use, so that an extractor can be sent to another process before it is used
+        self._pose = None
+
+    @staticmethod
+    def create_pose_graph(model_complexity: int):
+        return mp.solutions.pose.Pose(
+            static_image_mode=False,
+            model_complexity=model_complexity,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+    def iter_landmarks_from_video(self, video_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        """
+        Lazily extracts pose landmarks from a video, one frame at a time.
+
+        :param video_path: Path to the video file.
+
+        :return: An iterator of frame indices and their landmarks, for the frames where a pose was detected.
+        """
+        if self._graph_pool is None:
+            if self._pose is None:
+                self._pose = self.create_pose_graph(self._model_complexity)
+            yield from self._iter_landmarks(video_path, self._pose)
+            return
+
+        with self._graph_pool.acquire(self._model_complexity) as pose:
+            yield from self._iter_landmarks(video_path, pose)
+
+    def _iter_landmarks(self, video_path: str, pose) -> Iterator[Tuple[int, List[tuple]]]:
+        cap = cv2.VideoCapture(video_path)
+        frame_index = 0
+        self._frame_timestamps = []
+        if self._motion_gate is not None:
+            self._motion_gate.reset()
+        if self._landmarks_propagator is not None:
+            self._landmarks_propagator.reset()
+        # frames skipped since the last keyframe along with the image of the last one, and the last keyframe where a
+        # pose was detected
+        skipped_frames = []
+        skipped_image = None
+        previous_keyframe = None
+        previous_keyframe_index = None
+
+        try:
+            while cap.isOpened():
+                with self._stage_timer.stage('decoding', traced=False):
+                    success, image = cap.read()
+                if not success:
+                    break
+                self._stage_timer.add('decoding', frames=1)
+                # the presentation time of the frame, which tells the variable frame rate videos apart
+                self._frame_timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC) / 1000)
+
+                keyframe = previous_keyframe_index is None or \
+                    frame_index - previous_keyframe_index >= self._keyframe_interval
+                if keyframe and self._motion_gate is not None:
+                    with self._stage_timer.stage('motion_gating', frames=1, traced=False):
+                        keyframe = self._motion_gate.is_keyframe(image)
+                if not keyframe:
+                    skipped_frames.append(frame_index)
+                    skipped_image = image
+                    if self._landmarks_propagator is not None and previous_keyframe is not None:
+                        with self._stage_timer.stage('landmarks_propagation', frames=1, traced=False):
+                            self._landmarks_propagator.propagate(frame_index, image)
+                    frame_index += 1
+                    continue
+
+                landmarks = self._estimate_pose(pose, image)
+                previous_keyframe_index = frame_index
+
+                # yield the landmarks if pose landmarks are detected, the skipped frames being only interpolated
+                # or propagated between keyframes where a pose was detected
+                if landmarks is not None:
+                    if previous_keyframe is not None and self._landmarks_propagator is not None:
+                        with self._stage_timer.stage('landmarks_propagation', traced=False):
+                            propagated_landmarks = self._landmarks_propagator.reanchor(frame_index, image, landmarks)
+                        yield from propagated_landmarks
+                    elif previous_keyframe is not None:
+                        yield from self._interpolate_skipped_frames(previous_keyframe, (frame_index, landmarks),
+                                                                    skipped_frames)
+                    elif self._landmarks_propagator is not None:
+                        self._landmarks_propagator.anchor(frame_index, image, landmarks)
+                    yield frame_index, landmarks
+                previous_keyframe = (frame_index, landmarks) if landmarks is not None else None
+                skipped_frames = []
+
+                frame_index += 1
+
+            # without any movement, the pose is estimated on the last frame so that the video is not left without
+            # landmarks
+            if self._motion_gate is not None and 0 < len(skipped_frames) == frame_index:
+                landmarks = self._estimate_pose(pose, skipped_image)
+                if landmarks is not None:
+                    yield skipped_frames[-1], landmarks
+
+            self._total_frames = frame_index - 1
+        finally:
+            cap.release()
+
+    def estimate_pose(self, image: np.ndarray) -> Optional[List[tuple]]:
+        """
+        Estimates the pose on a single frame of a video, with the pose estimation graph of the extractor.
+
+        :param image: The BGR image of the frame.
+
+        :return: List of tuples containing the landmarks or None if no landmarks were found.
+        """
+        if self._graph_pool is None:
+            if self._pose is None:
+                self._pose = self.create_pose_graph(self._model_complexity)
+            return self._estimate_pose(self._pose, image)
+
+        with self._graph_pool.acquire(self._model_complexity) as pose:
+            return self._estimate_pose(pose, image)
+
+    def _estimate_pose(self, pose, image) -> Optional[List[tuple]]:
+        with self._stage_timer.stage('inference', frames=1, traced=False):
+            # convert the image to RGB as MediaPipe requires RGB images
+            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            results = pose.process(image_rgb)
+
+        if not results.pose_landmarks:
+            return None
+
+        return [(lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark]
+
+    @staticmethod
+    def _interpolate_skipped_frames(previous_keyframe: Tuple[int, List[tuple]], keyframe: Tuple[int, List[tuple]],
+                                    skipped_frames: List[int]) -> Iterator[Tuple[int, List[tuple]]]:
+        """
+        Linearly interpolates the landmarks of the frames skipped between two keyframes.
+
+        :param previous_keyframe: Frame index and landmarks of the previous keyframe.
+        :param keyframe: Frame index and landmarks of the keyframe.
+        :param skipped_frames: Indices of the skipped frames, between the two keyframes.
+
+        :return: An iterator of the skipped frame indices and their interpolated landmarks.
+        """
+        if not skipped_frames:
+            return
+
+        (previous_frame, previous_landmarks), (frame, landmarks) = previous_keyframe, keyframe
+        previous_values = np.array(previous_landmarks, dtype=np.float64)
+        values = np.array(landmarks, dtype=np.float64)
+
+        for skipped_frame in skipped_frames:
+            weight = (skipped_frame - previous_frame) / (frame - previous_frame)
+            yield skipped_frame, [tuple(keypoint) for keypoint in
+                                  ((1 - weight) * previous_values + weight * values).tolist()]
+
+    def get_model_complexity(self) -> int:
+        return self._model_complexity
+
+    @staticmethod
+    def extract_landmarks_from_image(image_path: str) -> List[tuple] or None:
+        """
+        Extracts pose landmarks from a single image.
+
+        :param image_path: Path to the image file.
+
+        :return: List of tuples containing the landmarks or None if no landmarks were found.
+        """
+        pose = mp.solutions.pose.Pose(
+            static_image_mode=True,
+            model_complexity=2,
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+
+        image = cv2.imread(image_path)
+        if image is None:
+            raise ValueError("Error loading image.")
+
+        # convert the image to RGB since MediaPipe requires RGB images
+        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        results = pose.process(image_rgb)
+
+        if results.pose_landmarks:
+            landmarks = [(lm.x, lm.y, lm.z, lm.visibility) for lm in results.pose_landmarks.landmark]
+            return landmarks
+        else:
+            return None
@@ -1,42 +1,233 @@
-import pickle
-
-from abc import ABC, abstractmethod
-
-
-class LandmarksExtractor(ABC):
-    def __init__(self) -> None:
-        self._landmarks_dictionary = {}
-        self._total_frames = 0
-
-    def get_landmarks_dictionary(self) -> dict:
-        return self._landmarks_dictionary
-
-    def get_total_frames(self) -> int:
-        return self._total_frames
-
-    @abstractmethod
-    def extract_landmarks_from_video(self, video_path: str) -> None:
-        """
-        Extracts landmarks from the video and stores them in a dictionary.
-
-        :param video_path: Path to the video file.
-        """
-        pass
-
-    def save_landmarks(self, file_path: str) -> None:
-        """
-        Saves the extracted landmarks to a pickle file.
-
-        :param file_path: Path to the file where landmarks should be saved.
-        """
-        with open(file_path, 'wb') as file:
-            pickle.dump(self._landmarks_dictionary, file)
-
-    def load_landmarks(self, file_path: str) -> None:
-        """
-        Loads the landmarks from a pickle file.
-
-        :param file_path: Path to the file from which landmarks should be loaded.
-        """
-        with open(file_path, 'rb') as file:
-            self._landmarks_dictionary = pickle.load(file)
+import pickle
+
+import numpy as np
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, List, Tuple
+from scipy.interpolate import interp1d
+
+from ..monitoring.StageTimer import StageTimer
+
+
+class LandmarksExtractor(ABC):
+    DEFAULT_BLOCK_SIZE = 64
+
+    def __init__(self) -> None:
+        self._landmarks_dictionary = {}
+        self._total_frames = 0
+        # timestamps of the decoded frames, in seconds, indexed by frame number
+        self._frame_timestamps = []
+        self._stage_timer = StageTimer()
+
+    def get_landmarks_dictionary(self) -> dict:
+        return self._landmarks_dictionary
+
+    def get_total_frames(self) -> int:
+        return self._total_frames
+
+    def get_frame_timestamps(self) -> List[float]:
+        """
+        Gets the timestamps of the frames decoded so far, which grow along with the extraction.
+
+        :return: List of the timestamps in seconds indexed by frame number, empty if the extractor does not know them.
+        """
+        return self._frame_timestamps
+
+    def get_stage_timer(self) -> StageTimer:
+        return self._stage_timer
+
+    def set_stage_timer(self, stage_timer: StageTimer) -> None:
+        self._stage_timer = stage_timer
+
+    def extract_landmarks_from_video(self, video_path: str) -> None:
+        """
+        Extracts landmarks from the video and stores them in a dictionary.
+
+        :param video_path: Path to the video file.
+        """
+        self._landmarks_dictionary = dict(self.iter_landmarks_from_video(video_path))
+
+    @abstractmethod
+    def iter_landmarks_from_video(self, video_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        """
+        Lazily extracts landmarks from the video, one frame at a time. The total number of frames is
+        available once the iterator is exhausted.
+
+        :param video_path: Path to the video file.
+
+        :return: An iterator of frame indices and their landmarks, for the frames where a pose was detected.
+        """
+        pass
+
+    def iter_landmark_blocks(self, video_path: str, block_size: int = DEFAULT_BLOCK_SIZE) -> \
+            Iterator[Dict[int, List[tuple]]]:
+        """
+        Lazily extracts landmarks from the video in blocks of consecutive detected frames, so that the memory
+        used by the consumers is bounded by the block size.
+
+        :param video_path: Path to the video file.
+        :param block_size: Maximum number of frames in a block.
+
+        :return: An iterator of dictionaries with frame numbers as keys and landmarks as values.
+        """
+        block = {}
+        for frame_index, landmarks in self.iter_landmarks_from_video(video_path):
+            block[frame_index] = landmarks
+
+            if len(block) == block_size:
+                yield block
+                block = {}
+
+        if block:
+            yield block
+
+    @staticmethod
+    def filter_low_confidence_keypoints(data, threshold=0.5, keypoint_indices=None):
+        """
+        Filters out low confidence keypoints from the data.
+
+        :param data: Dictionary of keypoints.
+        :param threshold: Confidence threshold for filtering.
+        :param keypoint_indices: Indices of the keypoints kept, all of them if None.
+
+        :return: Filtered dictionary of keypoints.
+        """
+        filtered_data = {}
+        kept_keypoints = None if keypoint_indices is None else set(keypoint_indices)
+
+        for frame, keypoints in data.items():
+            filtered_keypoints = [
+                np.array(values[:-1]) if values[-1] >= threshold and (kept_keypoints is None or i in kept_keypoints)
+                else None for i, values in enumerate(keypoints)
+            ]
+            filtered_data[frame] = filtered_keypoints
+
+        return filtered_data
+
+    @staticmethod
+    def interpolate_keypoints(data, keypoint_indices=None):
+        """
+        Interpolates missing keypoints in the data.
+
+        :param data: Dictionary of keypoints.
+        :param keypoint_indices: Indices of the keypoints interpolated, the others being left missing, all of them if
+        None.
+        :return: Dictionary of keypoints with interpolated missing values.
+        """
+        # sort frames and get number of keypoints
+        frames = sorted(data.keys())
+        num_keypoints = len(data[frames[0]])
+
+        # create dictionary to store interpolated data
+        interpolated_data = {frame: [None] * num_keypoints for frame in frames}
+
+        for i in range(num_keypoints) if keypoint_indices is None else keypoint_indices:
+            keypoint_values = []
+            valid_frames = []
+
+            # get valid frames and keypoint values for the current keypoint
+            for frame in frames:
+                keypoint = data[frame][i]
+                if keypoint is not None:
+                    keypoint_values.append(keypoint)
+                    valid_frames.append(frame)
+
+            # if there are more than one valid frames, interpolate missing values
+            if len(valid_frames) > 1:
+                # interpolate each dimension of the keypoint
+                keypoint_values = np.array(keypoint_values)
+                interpolated_keypoints = []
+
+                for dim in range(keypoint_values.shape[1]):
+                    dim_values = keypoint_values[:, dim]
+                    interp_func = interp1d(valid_frames, dim_values, bounds_error=False, fill_value="extrapolate")
+                    interpolated_keypoints.append(interp_func(frames))
+
+                interpolated_keypoints = np.array(interpolated_keypoints).T
+
+                # fill in the interpolated values
+                for j, frame in enumerate(frames):
+                    if data[frame][i] is None:
+                        interpolated_data[frame][i] = interpolated_keypoints[j]
+                    else:
+                        interpolated_data[frame][i] = data[frame][i]
+            elif len(valid_frames) == 1:
+                # of there is only one valid frame, use its keypoint to fill in all frames
+                for frame in frames:
+                    interpolated_data[frame][i] = data[valid_frames[0]][i]
+            else:
+                # if no valid frames, set all to None
+                for frame in frames:
+                    interpolated_data[frame][i] = None
+
+        return interpolated_data
+
+    @staticmethod
+    def convert_arrays_to_lists(data):
+        """
+        Converts numpy arrays in the keypoints data to lists.
+
+        :param data: Dictionary of keypoints.
+
+        :return: Dictionary of keypoints with lists instead of numpy arrays.
+        """
+        for frame, keypoints in data.items():
+            for i in range(len(keypoints)):
+                if keypoints[i] is not None:
+                    keypoints[i] = keypoints[i].tolist()
+
+        return data
+
+    def process_keypoints(self, data, threshold=0.5, keypoint_indices=None):
+        """
+        Processes keypoints by filtering low confidence points, interpolating missing points,
+        and converting arrays to lists. The keypoints which are not processed are missing.
+
+        :param data: Dictionary of keypoints.
+        :param threshold: Confidence threshold for filtering.
+        :param keypoint_indices: Indices of the keypoints processed, all of them if None.
+
+        :return: Processed dictionary of keypoints.
+        """
+        filtered_data = self.filter_low_confidence_keypoints(data, threshold, keypoint_indices)
+        interpolated_data = self.interpolate_keypoints(filtered_data, keypoint_indices)
+        list_converted_data = self.convert_arrays_to_lists(interpolated_data)
+
+        return list_converted_data
+
+    @staticmethod
+    def convert_to_array(landmarks: Iterable[list], keypoints_count: int = None) -> np.ndarray:
+        """
+        Gathers the coordinates of the landmarks of a sequence of frames into an array, the missing keypoints being
+        undefined.
+
+        :param landmarks: Landmarks of every frame, each keypoint with (x, y, z) values or more, or None if missing.
+        :param keypoints_count: Number of keypoints of every frame, required without any frame.
+
+        :return: Array of shape (frames, keypoints, 3), NaN for the missing keypoints.
+        """
+        landmarks_array = np.array([[keypoint[:3] if keypoint is not None else (np.nan,) * 3
+                                     for keypoint in frame_landmarks] for frame_landmarks in landmarks],
+                                   dtype=np.float64)
+        if len(landmarks_array) == 0:
+            return np.empty((0, keypoints_count or 0, 3))
+
+        return landmarks_array
+
+    def save_landmarks(self, file_path: str) -> None:
+        """
+        Saves the extracted landmarks to a pickle file.
+
+        :param file_path: Path to the file where landmarks should be saved.
+        """
+        with open(file_path, 'wb') as file:
+            pickle.dump(self._landmarks_dictionary, file)
+
+    def load_landmarks(self, file_path: str) -> None:
+        """
+        Loads the landmarks from a pickle file.
+
+        :param file_path: Path to the file from which landmarks should be loaded.
+        """
+        with open(file_path, 'rb') as file:
+            self._landmarks_dictionary = pickle.load(file)
@@ -0,0 +1,56 @@
+from typing import Dict
+
+
+class ModelComplexityPolicy:
+    # estimated BlazePose inference cost per frame (seconds) for each model complexity on a single CPU core
+    DEFAULT_INFERENCE_SECONDS_PER_FRAME = {0: 0.012, 1: 0.022, 2: 0.075}
+    # estimated decoding and color conversion cost per frame (seconds) for each megapixel of resolution
+    DEFAULT_DECODING_SECONDS_PER_MEGAPIXEL = 0.004
+
+    def __init__(self, latency_slo: float, parallel_workers: int = 1, max_model_complexity: int = 2,
+                 inference_seconds_per_frame: Dict[int, float] = None,
+                 decoding_seconds_per_megapixel: float = DEFAULT_DECODING_SECONDS_PER_MEGAPIXEL) -> None:
+        self._latency_slo = latency_slo
+        self._parallel_workers = max(1, parallel_workers)
+        self._max_model_complexity = max_model_complexity
+        self._inference_seconds_per_frame = inference_seconds_per_frame or self.DEFAULT_INFERENCE_SECONDS_PER_FRAME
+        self._decoding_seconds_per_megapixel = decoding_seconds_per_megapixel
+
+    def estimate_latency(self, model_complexity: int, frame_count: int, width: int, height: int,
+                         queue_depth: int = 0) -> float:
+        """
+        Estimates the time until a job is finished, including the time spent waiting behind the queued jobs.
+
+        :param model_complexity: BlazePose model complexity (0, 1 or 2).
+        :param frame_count: Number of frames in the video.
+        :param width: Width of the video frames.
+        :param height: Height of the video frames.
+        :param queue_depth: Number of jobs currently being processed.
+
+        :return: The estimated latency in seconds.
+        """
+        megapixels = width * height / 1e6
+        seconds_per_frame = (self._inference_seconds_per_frame[model_complexity] +
+                             self._decoding_seconds_per_megapixel * megapixels)
+        processing_time = frame_count * seconds_per_frame
+
+        # the jobs ahead are assumed to be of similar cost and to share the available workers
+        return processing_time * (1 + queue_depth / self._parallel_workers)
+
+    def select(self, frame_count: int, width: int, height: int, queue_depth: int = 0) -> int:
+        """
+        Selects the most precise model complexity whose estimated latency fits the latency SLO.
+
+        :param frame_count: Number of frames in the video.
+        :param width: Width of the video frames.
+        :param height: Height of the video frames.
+        :param queue_depth: Number of jobs currently being processed.
+
+        :return: The selected model complexity, falling back to the fastest one if none fits the SLO.
+        """
+        for model_complexity in range(self._max_model_complexity, 0, -1):
+            latency = self.estimate_latency(model_complexity, frame_count, width, height, queue_depth)
+            if latency <= self._latency_slo:
+                return model_complexity
+
+        return 0
@@ -0,0 +1,72 @@
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    # width the frames are downscaled to before being compared, the height keeping the aspect ratio
+    DOWNSCALED_WIDTH = 64
+    # difference of gray level from which a pixel of the downscaled frames has changed
+    PIXEL_THRESHOLD = 12
+    # fraction of the pixels of the downscaled frames which have to change for the frame to be a keyframe
+    MOTION_THRESHOLD = 0.002
+
+    def __init__(self, downscaled_width: int = DOWNSCALED_WIDTH, pixel_threshold: int = PIXEL_THRESHOLD,
+                 motion_threshold: float = MOTION_THRESHOLD) -> None:
+        """
+        Tells the keyframes of a video, on which the pose is estimated, apart from the frames of its idle stretches,
+        by the differences between downscaled grayscale frames. A frame is a keyframe when it differs enough from the
+        previous keyframe, so that slow movements also add up to keyframes, and the first frame of the video is only
+        the reference of the second keyframe.
+
+        :param downscaled_width: Width the frames are downscaled to.
+        :param pixel_threshold: Difference of gray level from which a pixel has changed.
+        :param motion_threshold: Fraction of the pixels which have to change since the previous keyframe.
+        """
+        self._downscaled_width = downscaled_width
+        self._pixel_threshold = pixel_threshold
+        self._motion_threshold = motion_threshold
+        self._reference = None
+
+    def reset(self) -> None:
+        """
+        Forgets the previous keyframe, before the frames of another video.
+        """
+        self._reference = None
+
+    def is_keyframe(self, image: np.ndarray) -> bool:
+        """
+        Tells whether the pose has to be estimated on a frame, the frame becoming the reference of the next ones if
+        so.
+
+        :param image: The BGR image of the frame.
+
+        :return: True if the frame differs enough from the previous keyframe, False for the first frame.
+        """
+        downscaled_image = self._downscale(image)
+        if self._reference is None:
+            self._reference = downscaled_image
+            return False
+
+        if self.compute_motion(downscaled_image, self._reference) < self._motion_threshold:
+            return False
+
+        self._reference = downscaled_image
+        return True
+
+    def compute_motion(self, downscaled_image: np.ndarray, reference: np.ndarray) -> float:
+        """
+        Computes the motion between two downscaled frames.
+
+        :param downscaled_image: The downscaled grayscale image of the frame.
+        :param reference: The downscaled grayscale image of the frame it is compared with.
+
+        :return: The fraction of the pixels which changed.
+        """
+        return float(np.count_nonzero(cv2.absdiff(downscaled_image, reference) > self._pixel_threshold)) / \
+            downscaled_image.size
+
+    def _downscale(self, image: np.ndarray) -> np.ndarray:
+        height, width = image.shape[:2]
+        downscaled_size = (self._downscaled_width, max(1, round(height * self._downscaled_width / width)))
+        # the area interpolation averages the pixels, which smooths the noise of the encoding out
+        return cv2.cvtColor(cv2.resize(image, downscaled_size, interpolation=cv2.INTER_AREA), cv2.COLOR_BGR2GRAY)
@@ -0,0 +1,119 @@
+import cv2
+import numpy as np
+
+from typing import List, Tuple
+
+
+class OpticalFlowLandmarksPropagator:
+    # size of the search window of each pyramid level, in pixels, and number of pyramid levels above the frame
+    WINDOW_SIZE = (21, 21)
+    PYRAMID_LEVELS = 3
+
+    def __init__(self, window_size: Tuple[int, int] = WINDOW_SIZE, pyramid_levels: int = PYRAMID_LEVELS) -> None:
+        """
+        Propagates the landmarks of a keyframe to the next frames, on which the pose is not estimated, by tracking
+        their pixel positions with the pyramidal Lucas-Kanade optical flow. The propagated landmarks are retained
+        until the next keyframe, where the drift of the tracking is measured and spread over them.
+
+        :param window_size: Size of the search window of each pyramid level, in pixels.
+        :param pyramid_levels: Number of pyramid levels above the frame.
+        """
+        self._window_size = window_size
+        self._pyramid_levels = pyramid_levels
+        self._previous_image = None
+        self._points = None
+        self._values = None
+        self._lost = None
+        self._keyframe = None
+        self._propagated_frames = []
+
+    def reset(self) -> None:
+        """
+        Forgets the keyframe and the propagated landmarks, before the frames of another video.
+        """
+        self._previous_image = None
+        self._points = None
+        self._values = None
+        self._lost = None
+        self._keyframe = None
+        self._propagated_frames = []
+
+    def anchor(self, frame: int, image: np.ndarray, landmarks: List[tuple]) -> None:
+        """
+        Starts the propagation from the landmarks of a keyframe, dropping the landmarks propagated so far.
+
+        :param frame: Frame index of the keyframe.
+        :param image: The BGR image of the keyframe.
+        :param landmarks: Landmarks estimated on the keyframe, as (x, y, z, visibility) values normalized by the
+        size of the image.
+        """
+        self._previous_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        self._values = np.array(landmarks, dtype=np.float32)
+        self._points = self._to_pixels(self._values, self._previous_image.shape)
+        self._lost = np.zeros(len(self._values), dtype=bool)
+        self._keyframe = frame
+        self._propagated_frames = []
+
+    def propagate(self, frame: int, image: np.ndarray) -> None:
+        """
+        Tracks the landmarks to a frame following the keyframe, the keypoints lost by the tracking becoming
+        invisible until the next keyframe.
+
+        :param frame: Frame index.
+        :param image: The BGR image of the frame.
+        """
+        if self._keyframe is None:
+            return
+
+        self._propagated_frames.append((frame, self._track(image)))
+
+    def reanchor(self, frame: int, image: np.ndarray, landmarks: List[tuple]) -> List[Tuple[int, List[tuple]]]:
+        """
+        Ends the propagation at the next keyframe, correcting the propagated landmarks by the drift of the tracking
+        up to the keyframe, linearly over time, and starts the propagation again from the keyframe.
+
+        :param frame: Frame index of the keyframe.
+        :param image: The BGR image of the keyframe.
+        :param landmarks: Landmarks estimated on the keyframe.
+
+        :return: List of the frame indices and their landmarks, for the frames propagated since the previous
+        keyframe.
+        """
+        corrected_landmarks = []
+        if self._keyframe is not None and self._propagated_frames:
+            keyframe_values = np.array(landmarks, dtype=np.float32)
+            drift = keyframe_values - self._track(image)
+
+            for propagated_frame, values in self._propagated_frames:
+                weight = (propagated_frame - self._keyframe) / (frame - self._keyframe)
+                corrected_values = values.copy()
+                corrected_values[:, :3] += weight * drift[:, :3]
+                # the visibilities are interpolated, the keypoints lost by the tracking staying invisible so that
+                # they are filtered out downstream
+                corrected_values[:, 3] = np.where(values[:, 3] == 0, 0,
+                                                  (1 - weight) * self._values[:, 3] + weight * keyframe_values[:, 3])
+                corrected_landmarks.append((propagated_frame, [tuple(keypoint)
+                                                               for keypoint in corrected_values.tolist()]))
+
+        self.anchor(frame, image, landmarks)
+        return corrected_landmarks
+
+    def _track(self, image: np.ndarray) -> np.ndarray:
+        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        points, status, _ = cv2.calcOpticalFlowPyrLK(self._previous_image, gray_image, self._points, None,
+                                                     winSize=self._window_size, maxLevel=self._pyramid_levels)
+
+        # the lost keypoints keep their last tracked position
+        self._lost |= status.ravel() == 0
+        self._points = np.where(self._lost[:, None, None], self._points, points)
+        self._previous_image = gray_image
+
+        values = self._values.copy()
+        values[:, :2] = self._points[:, 0] / np.array(gray_image.shape[1::-1], dtype=np.float32)
+        values[self._lost, 3] = 0
+
+        return values
+
+    @staticmethod
+    def _to_pixels(values: np.ndarray, image_shape: Tuple[int, ...]) -> np.ndarray:
+        return (values[:, :2] * np.array(image_shape[1::-1], dtype=np.float32)).reshape(-1, 1, 2).astype(np.float32)
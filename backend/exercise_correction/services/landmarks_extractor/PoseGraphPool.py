@@ -0,0 +1,115 @@
+import threading
+import time
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Tuple
+
+
+class PoseGraphPool:
+    def __init__(self, graph_factory: Callable[[int], object], max_idle_graphs: int = 4) -> None:
+        """
+        Keeps the pose estimation graphs of the finished jobs to reuse them for the next ones, as loading the model
+        of a graph takes much longer than resetting its tracking state. Graphs are created on demand, so a job never
+        waits for another one to release its graph.
+
+        :param graph_factory: Function creating a graph for a model complexity.
+        :param max_idle_graphs: Maximum number of idle graphs kept per model complexity, the others are closed.
+        """
+        self._graph_factory = graph_factory
+        self._max_idle_graphs = max_idle_graphs
+        self._lock = threading.Lock()
+        self._idle_graphs = defaultdict(list)
+        self._in_use = defaultdict(int)
+        self._acquisitions = defaultdict(int)
+        self._busy_seconds = defaultdict(float)
+
+    @contextmanager
+    def acquire(self, model_complexity: int):
+        """
+        Lends a graph for the duration of the context, resetting it once released so that the next job does not
+        track the pose of the previous video.
+
+        :param model_complexity: Model complexity of the graph.
+        """
+        with self._lock:
+            graphs = self._idle_graphs[model_complexity]
+            graph = graphs.pop() if graphs else None
+            self._in_use[model_complexity] += 1
+            self._acquisitions[(model_complexity, 'reused' if graph is not None else 'created')] += 1
+
+        start = time.perf_counter()
+        try:
+            if graph is None:
+                graph = self._graph_factory(model_complexity)
+
+            yield graph
+        finally:
+            busy_seconds = time.perf_counter() - start
+
+            reusable = graph is not None and self._reset_graph(graph)
+            with self._lock:
+                self._in_use[model_complexity] -= 1
+                self._busy_seconds[model_complexity] += busy_seconds
+
+                if reusable and len(self._idle_graphs[model_complexity]) < self._max_idle_graphs:
+                    self._idle_graphs[model_complexity].append(graph)
+                    graph = None
+
+            if graph is not None:
+                self._close_graph(graph)
+
+    def get_graph_counts(self) -> Dict[Tuple[str, str], int]:
+        """
+        Counts the graphs in use and idle.
+
+        :return: Dictionary with tuples of model complexity and state ('in_use' or 'idle') as keys and the number
+        of graphs as values.
+        """
+        with self._lock:
+            counts = {}
+            for model_complexity in set(self._in_use) | set(self._idle_graphs):
+                counts[(str(model_complexity), 'in_use')] = self._in_use[model_complexity]
+                counts[(str(model_complexity), 'idle')] = len(self._idle_graphs[model_complexity])
+
+            return counts
+
+    def get_acquisitions(self) -> Dict[Tuple[str, str], int]:
+        """
+        Counts the graphs lent since the pool was created.
+
+        :return: Dictionary with tuples of model complexity and result ('reused' or 'created') as keys and the
+        number of acquisitions as values.
+        """
+        with self._lock:
+            return {(str(model_complexity), result): count
+                    for (model_complexity, result), count in self._acquisitions.items()}
+
+    def get_busy_seconds(self) -> Dict[Tuple[str], float]:
+        """
+        Sums the time the graphs were lent for, which divided by the elapsed time gives the average number of graphs
+        in use.
+
+        :return: Dictionary with tuples of model complexity as keys and the seconds as values.
+        """
+        with self._lock:
+            return {(str(model_complexity),): seconds for model_complexity, seconds in self._busy_seconds.items()}
+
+    @staticmethod
+    def _reset_graph(graph) -> bool:
+        reset = getattr(graph, 'reset', None)
+        if reset is None:
+            return False
+
+        try:
+            reset()
+        except Exception:
+            return False
+
+        return True
+
+    @staticmethod
+    def _close_graph(graph) -> None:
+        close = getattr(graph, 'close', None)
+        if close is not None:
+            close()
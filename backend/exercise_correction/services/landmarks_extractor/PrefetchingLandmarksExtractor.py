@@ -0,0 +1,77 @@
+from typing import Dict, Iterator, List, Tuple
+
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from ..monitoring.StageTimer import StageTimer
+
+
+class PrefetchingLandmarksExtractor(LandmarksExtractor):
+    def __init__(self, landmarks_extractor: LandmarksExtractor) -> None:
+        """
+        Extracts the first landmarks of a video ahead, so that they can be looked at before the processing of the
+        video, which then goes on with the same extraction instead of starting it over.
+
+        :param landmarks_extractor: The extractor used for the landmarks of the video.
+        """
+        super().__init__()
+        self._landmarks_extractor = landmarks_extractor
+        self._video_path = None
+        self._prefetched_landmarks = []
+        self._remaining_landmarks = None
+
+    def set_stage_timer(self, stage_timer: StageTimer) -> None:
+        super().set_stage_timer(stage_timer)
+        self._landmarks_extractor.set_stage_timer(stage_timer)
+
+    def get_total_frames(self) -> int:
+        return self._landmarks_extractor.get_total_frames()
+
+    def get_frame_timestamps(self) -> List[float]:
+        return self._landmarks_extractor.get_frame_timestamps()
+
+    def prefetch(self, video_path: str, frames: int) -> Dict[int, List[tuple]]:
+        """
+        Extracts the landmarks of the first frames of a video where a pose is detected.
+
+        :param video_path: Path to the video file.
+        :param frames: Maximum number of frames with landmarks to extract.
+
+        :return: Dictionary with frame numbers as keys and landmarks as values, for the prefetched frames.
+        """
+        if video_path != self._video_path:
+            self._video_path = video_path
+            self._prefetched_landmarks = []
+            self._remaining_landmarks = self._landmarks_extractor.iter_landmarks_from_video(video_path)
+
+        while len(self._prefetched_landmarks) < frames:
+            frame_landmarks = next(self._remaining_landmarks, None)
+            if frame_landmarks is None:
+                break
+
+            self._prefetched_landmarks.append(frame_landmarks)
+
+        return dict(self._prefetched_landmarks[:frames])
+
+    def iter_landmarks_from_video(self, video_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        """
+        Lazily extracts landmarks from the video, one frame at a time, starting with the prefetched ones.
+
+        :param video_path: Path to the video file.
+
+        :return: An iterator of frame indices and their landmarks, for the frames where a pose was detected.
+        """
+        if video_path != self._video_path:
+            return self._landmarks_extractor.iter_landmarks_from_video(video_path)
+
+        # the prefetched landmarks are handed over, and the extraction can only go on once
+        prefetched_landmarks, remaining_landmarks = self._prefetched_landmarks, self._remaining_landmarks
+        self._video_path = None
+        self._prefetched_landmarks = []
+        self._remaining_landmarks = None
+
+        return self._chain(prefetched_landmarks, remaining_landmarks)
+
+    @staticmethod
+    def _chain(prefetched_landmarks: List[Tuple[int, List[tuple]]],
+               remaining_landmarks: Iterator[Tuple[int, List[tuple]]]) -> Iterator[Tuple[int, List[tuple]]]:
+        yield from prefetched_landmarks
+        yield from remaining_landmarks
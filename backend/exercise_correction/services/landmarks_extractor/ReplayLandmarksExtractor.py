@@ -0,0 +1,169 @@
+import hashlib
+import os
+import uuid
+
+import numpy as np
+
+from typing import Callable, Iterator, List, Tuple
+
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+
+
+class ReplayLandmarksExtractor(LandmarksExtractor):
+    RECORDING_FORMAT_VERSION = 1
+    HASH_CHUNK_SIZE = 1 << 20
+    # number of frames whose landmarks are buffered before being written out while recording them
+    RECORDING_CHUNK_SIZE = 256
+
+    def __init__(self, recordings_directory: str, extractor_factory: Callable[[], LandmarksExtractor],
+                 recording_key: str = '') -> None:
+        """
+        Records the landmarks extracted from a video on the first run and replays them for the same video
+        afterwards, so that the processing downstream of the pose estimation can run without it.
+
+        :param recordings_directory: Directory where the recordings are stored.
+        :param extractor_factory: Creates the extractor used when no recording exists for a video.
+        :param recording_key: Distinguishes recordings of the same video made with different extractor settings.
+        """
+        super().__init__()
+        self._recordings_directory = recordings_directory
+        self._extractor_factory = extractor_factory
+        self._recording_key = recording_key
+
+    def iter_landmarks_from_video(self, video_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        """
+        Lazily replays the landmarks recorded for the video, recording them first if needed.
+
+        :param video_path: Path to the video file.
+
+        :return: An iterator of frame indices and their landmarks, for the frames where a pose was detected.
+        """
+        recording_path = self.get_recording_path(video_path)
+
+        if os.path.isfile(recording_path):
+            return self._replay(recording_path)
+
+        return self._record(video_path, recording_path)
+
+    def get_recording_path(self, video_path: str) -> str:
+        """
+        Gets the path of the recording of a video, identified by the hash of its content.
+
+        :param video_path: Path to the video file.
+
+        :return: Path of the recording file.
+        """
+        file_name = self.compute_video_hash(video_path)
+        if self._recording_key:
+            file_name = f'{file_name}_{self._recording_key}'
+
+        return os.path.join(self._recordings_directory, f'{file_name}.v{self.RECORDING_FORMAT_VERSION}.npz')
+
+    @staticmethod
+    def compute_video_hash(video_path: str) -> str:
+        """
+        Computes the SHA-256 hash of the content of a video file.
+
+        :param video_path: Path to the video file.
+
+        :return: The hexadecimal digest of the video content.
+        """
+        video_hash = hashlib.sha256()
+        with open(video_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(ReplayLandmarksExtractor.HASH_CHUNK_SIZE), b''):
+                video_hash.update(chunk)
+
+        return video_hash.hexdigest()
+
+    def _replay(self, recording_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        with self._stage_timer.stage('landmarks_replay'), np.load(recording_path) as recording:
+            frames = recording['frames']
+            landmarks = recording['landmarks']
+            total_frames = int(recording['total_frames'])
+            # the recordings made before the timestamps were recorded have none
+            frame_timestamps = recording['frame_timestamps'].tolist() if 'frame_timestamps' in recording else []
+        self._stage_timer.add('landmarks_replay', frames=len(frames))
+        self._frame_timestamps = frame_timestamps
+
+        for frame_index, frame_landmarks in zip(frames.tolist(), landmarks.tolist()):
+            yield frame_index, [tuple(values) for values in frame_landmarks]
+
+        self._total_frames = total_frames
+
+    def _record(self, video_path: str, recording_path: str) -> Iterator[Tuple[int, List[tuple]]]:
+        landmarks_extractor = self._extractor_factory()
+        landmarks_extractor.set_stage_timer(self._stage_timer)
+
+        # the landmarks are written out in chunks as they are extracted, so that the memory used by the recording
+        # does not grow with the length of the video
+        os.makedirs(self._recordings_directory, exist_ok=True)
+        chunks_path = f'{recording_path}.{uuid.uuid4().hex}'
+        frames_path, landmarks_path = f'{chunks_path}.frames.tmp', f'{chunks_path}.landmarks.tmp'
+        frames_chunk = []
+        landmarks_chunk = []
+        frame_count = 0
+
+        try:
+            with open(frames_path, 'wb') as frames_file, open(landmarks_path, 'wb') as landmarks_file:
+                for frame_index, frame_landmarks in landmarks_extractor.iter_landmarks_from_video(video_path):
+                    frames_chunk.append(frame_index)
+                    landmarks_chunk.append(frame_landmarks)
+                    frame_count += 1
+                    if len(frames_chunk) == self.RECORDING_CHUNK_SIZE:
+                        self._write_chunk(frames_file, landmarks_file, frames_chunk, landmarks_chunk)
+
+                    # the timestamps grow along with the extraction
+                    self._frame_timestamps = landmarks_extractor.get_frame_timestamps()
+                    yield frame_index, frame_landmarks
+
+                self._write_chunk(frames_file, landmarks_file, frames_chunk, landmarks_chunk)
+
+            self._total_frames = landmarks_extractor.get_total_frames()
+            self._frame_timestamps = landmarks_extractor.get_frame_timestamps()
+            with self._stage_timer.stage('landmarks_recording', frames=frame_count):
+                # the chunks are mapped rather than read, so that they are compressed into the recording piecewise
+                frames, landmarks = [], []
+                if frame_count:
+                    frames = np.memmap(frames_path, dtype=np.int32, mode='r')
+                    landmarks = np.memmap(landmarks_path, dtype=np.float32, mode='r').reshape(frame_count, -1, 4)
+                self.save_recording(recording_path, frames, landmarks, self._total_frames, self._frame_timestamps)
+            self._stage_timer.add('landmarks_recording', bytes_written=os.path.getsize(recording_path))
+        finally:
+            for path in (frames_path, landmarks_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def save_recording(self, recording_path: str, frames: List[int], landmarks: List[List[tuple]],
+                       total_frames: int, frame_timestamps: List[float] = None) -> None:
+        """
+        Saves the landmarks of a video as a recording, which is replayed instead of extracting them.
+
+        :param recording_path: Path of the recording file, as returned by get_recording_path.
+        :param frames: Frame indices where a pose was detected.
+        :param landmarks: Landmarks of each of these frames, as (x, y, z, visibility) values.
+        :param total_frames: Total number of frames, as reported by the extractor.
+        :param frame_timestamps: Timestamps of the decoded frames in seconds, indexed by frame number, if known.
+        """
+        # pose estimators output single precision values, so storing them as such is lossless
+        if len(landmarks):
+            landmarks_array = np.asarray(landmarks, dtype=np.float32)
+        else:
+            landmarks_array = np.empty((0, 0, 4), dtype=np.float32)
+
+        # write to a temporary file first so that concurrent jobs never read a partial recording
+        os.makedirs(self._recordings_directory, exist_ok=True)
+        temporary_path = f'{recording_path}.{uuid.uuid4().hex}.tmp.npz'
+        np.savez_compressed(temporary_path, frames=np.asarray(frames, dtype=np.int32), landmarks=landmarks_array,
+                            total_frames=np.array(total_frames),
+                            frame_timestamps=np.array(frame_timestamps or [], dtype=np.float64))
+        os.replace(temporary_path, recording_path)
+
+    @staticmethod
+    def _write_chunk(frames_file, landmarks_file, frames: List[int], landmarks: List[List[tuple]]) -> None:
+        if not frames:
+            return
+
+        np.array(frames, dtype=np.int32).tofile(frames_file)
+        np.array(landmarks, dtype=np.float32).tofile(landmarks_file)
+        frames.clear()
+        landmarks.clear()
@@ -0,0 +1,122 @@
+from collections import deque
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+
+class StreamingKeypointsProcessor:
+    DEFAULT_MAX_GAP = 90
+
+    def __init__(self, threshold: float = 0.5, max_gap: int = DEFAULT_MAX_GAP,
+                 keypoint_indices: Iterable[int] = None) -> None:
+        """
+        Online counterpart of BlazePoseLandmarksExtractor.process_keypoints, which filters low confidence keypoints
+        and linearly interpolates them while retaining only the frames waiting for a missing keypoint.
+
+        :param threshold: Confidence threshold for filtering.
+        :param max_gap: Maximum number of frames retained while waiting for a missing keypoint, after which
+        the last valid value of the keypoint is held instead.
+        :param keypoint_indices: Indices of the keypoints processed, the others being missing, all of them if None.
+        """
+        self._threshold = threshold
+        self._max_gap = max_gap
+        self._keypoint_indices = None if keypoint_indices is None else set(keypoint_indices)
+        # frames waiting for at least one missing keypoint, as [frame, keypoints] pairs
+        self._pending = deque()
+        # last valid (frame, value) pair for each keypoint
+        self._last_valid = []
+        # pending entries missing each keypoint
+        self._missing = []
+
+    def process_block(self, data: Dict[int, list]) -> Dict[int, list]:
+        """
+        Processes a block of consecutive frames.
+
+        :param data: Dictionary of keypoints, with (x, y, z, visibility) values.
+
+        :return: Processed dictionary of keypoints for the frames that could be resolved so far, in frame order.
+        """
+        processed_data = {}
+
+        for frame in sorted(data.keys()):
+            self._push(frame, data[frame])
+            self._pop_resolved(processed_data)
+
+        return processed_data
+
+    def flush(self) -> Dict[int, list]:
+        """
+        Resolves the remaining frames by holding the last valid value of the missing keypoints.
+
+        :return: Processed dictionary of keypoints for the remaining frames.
+        """
+        processed_data = {}
+
+        for keypoint in range(len(self._missing)):
+            self._hold_missing(keypoint, len(self._missing[keypoint]))
+        self._pop_resolved(processed_data)
+
+        return processed_data
+
+    def _push(self, frame: int, keypoints: list) -> None:
+        if not self._last_valid:
+            self._last_valid = [None] * len(keypoints)
+            self._missing = [deque() for _ in keypoints]
+
+        entry = [frame, [None] * len(keypoints)]
+        self._pending.append(entry)
+
+        for i, values in enumerate(keypoints):
+            # the keypoints which are not processed are neither filtered nor waited for
+            if self._keypoint_indices is not None and i not in self._keypoint_indices:
+                continue
+
+            if values[-1] < self._threshold:
+                self._missing[i].append(entry)
+                continue
+
+            value = np.array(values[:-1])
+            entry[1][i] = value
+
+            # fill in the frames waiting for this keypoint
+            if self._missing[i]:
+                self._fill_missing(i, frame, value)
+
+            self._last_valid[i] = (frame, value)
+
+        # bound the retained frames by holding the last valid values for the oldest frame
+        if len(self._pending) > self._max_gap:
+            oldest_entry = self._pending[0]
+            for i in range(len(keypoints)):
+                if self._missing[i] and self._missing[i][0] is oldest_entry:
+                    self._hold_missing(i, 1)
+
+    def _fill_missing(self, keypoint: int, frame: int, value: np.ndarray) -> None:
+        last_valid = self._last_valid[keypoint]
+
+        while self._missing[keypoint]:
+            entry = self._missing[keypoint].popleft()
+
+            if last_valid is None:
+                # no previous valid value, so use the first one
+                entry[1][keypoint] = value
+            else:
+                last_frame, last_value = last_valid
+                weight = (entry[0] - last_frame) / (frame - last_frame)
+                entry[1][keypoint] = last_value + weight * (value - last_value)
+
+    def _hold_missing(self, keypoint: int, count: int) -> None:
+        last_valid = self._last_valid[keypoint]
+
+        for _ in range(count):
+            entry = self._missing[keypoint].popleft()
+            entry[1][keypoint] = None if last_valid is None else last_valid[1]
+
+    def _pop_resolved(self, processed_data: Dict[int, list]) -> None:
+        while self._pending and not any(missing and missing[0] is self._pending[0] for missing in self._missing):
+            frame, keypoints = self._pending.popleft()
+            processed_data[frame] = self._convert_to_lists(keypoints)
+
+    @staticmethod
+    def _convert_to_lists(keypoints: list) -> List[list]:
+        return [keypoint.tolist() if keypoint is not None else None for keypoint in keypoints]
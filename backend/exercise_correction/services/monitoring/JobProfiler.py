@@ -0,0 +1,124 @@
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+from collections import Counter
+from contextlib import contextmanager
+
+
+class JobProfiler:
+    def __init__(self, interval: float = 0.005, memory_frames: int = 1, snapshot_growth: float = 1.1) -> None:
+        """
+        Profiles a job with a statistical profiler, sampling the stack of the thread running the job at a fixed
+        interval, and with tracemalloc to find where the memory was allocated when the traced memory peaked.
+
+        :param interval: Seconds between two samples of the stack.
+        :param memory_frames: Number of frames stored by tracemalloc for each allocation.
+        :param snapshot_growth: Ratio by which the traced memory must grow since the last snapshot of the
+        allocations to take a new one, as a snapshot copies every traced allocation.
+        """
+        self._interval = interval
+        self._memory_frames = memory_frames
+        self._snapshot_growth = snapshot_growth
+        self._stacks = Counter()
+        self._samples = 0
+        self._duration = 0.0
+        self._peak_memory = 0
+        self._snapshot = None
+        self._snapshot_memory = 0
+
+    @contextmanager
+    def profile(self):
+        """
+        Profiles the current thread for the duration of the context.
+        """
+        thread_id = threading.get_ident()
+        stopped = threading.Event()
+        sampler = threading.Thread(target=self._sample, args=(thread_id, stopped), daemon=True)
+
+        tracing_memory = tracemalloc.is_tracing()
+        if not tracing_memory:
+            tracemalloc.start(self._memory_frames)
+        tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            yield self
+        finally:
+            stopped.set()
+            sampler.join()
+            self._duration += time.perf_counter() - start
+            self._peak_memory = max(self._peak_memory, tracemalloc.get_traced_memory()[1])
+
+            if not tracing_memory:
+                tracemalloc.stop()
+
+    def get_samples(self) -> int:
+        return self._samples
+
+    def get_folded_stacks(self) -> Counter:
+        return Counter(self._stacks)
+
+    def save_folded_stacks(self, file_path: str) -> None:
+        """
+        Saves the sampled stacks in the folded format of flamegraph.pl and speedscope, one line per distinct stack
+        with its frames from the outermost to the innermost separated by semicolons, followed by its sample count.
+
+        :param file_path: Path to the profile.
+        """
+        with open(file_path, 'w') as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f'{stack} {count}\n')
+
+    def save_memory_report(self, file_path: str, top: int = 25) -> None:
+        """
+        Saves the peak memory of the job along with the lines which allocated the most memory still in use when the
+        traced memory was the highest.
+
+        :param file_path: Path to the report.
+        :param top: Number of allocation sites reported.
+        """
+        lines = [
+            f"Duration: {self._duration:.3f} s, {self._samples} stack samples",
+            f"Peak traced memory: {self._peak_memory / 2 ** 20:.1f} MiB",
+            # the peak resident set size of the whole process, in kilobytes on Linux
+            f"Peak resident set size: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB",
+        ]
+
+        if self._snapshot is not None:
+            lines.append(f"Top {top} allocation sites at the highest sampled traced memory "
+                         f"({self._snapshot_memory / 2 ** 20:.1f} MiB):")
+
+            snapshot = self._snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+            for statistic in snapshot.statistics('lineno')[:top]:
+                frame = statistic.traceback[0]
+                lines.append(f"  {statistic.size / 2 ** 20:10.3f} MiB {statistic.count:10d} blocks  "
+                             f"{frame.filename}:{frame.lineno}")
+
+        with open(file_path, 'w') as file:
+            file.write('\n'.join(lines) + '\n')
+
+    def _sample(self, thread_id: int, stopped: threading.Event) -> None:
+        while not stopped.wait(self._interval):
+            frame = sys._current_frames().get(thread_id)
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            del frame
+
+            self._stacks[';'.join(reversed(stack))] += 1
+            self._samples += 1
+
+            traced_memory = tracemalloc.get_traced_memory()[0]
+            if traced_memory > self._snapshot_memory * self._snapshot_growth:
+                self._snapshot = tracemalloc.take_snapshot()
+                self._snapshot_memory = traced_memory
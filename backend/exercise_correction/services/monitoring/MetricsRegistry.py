@@ -0,0 +1,341 @@
+import bisect
+import fcntl
+import json
+import math
+import os
+import threading
+import uuid
+
+from typing import Callable, Dict, Sequence
+
+
+class MetricsRegistry:
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+    GAUGE_AGGREGATIONS = ('sum', 'max', 'shared')
+    # file the counters and histograms of the exited worker processes are merged into, and file locked while the
+    # files are merged and read
+    EXITED_PROCESSES_FILE_NAME = 'exited_processes.json'
+    LOCK_FILE_NAME = '.lock'
+
+    def __init__(self, directory: str) -> None:
+        """
+        Collects counters, gauges and histograms in the Prometheus text exposition format. Every worker process
+        writes its own values to a file of a directory shared by the processes, and the values of all the files
+        are merged when rendered, so that any worker can serve the metrics of the whole server.
+
+        Counters and histograms of the worker processes that exited are kept, merged into a single file so that the
+        files do not pile up as the processes are replaced, while their gauges are dropped.
+
+        :param directory: Directory shared by the worker processes to aggregate their metrics.
+        """
+        self._directory = directory
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._pid = None
+        self._file_path = None
+
+    def register_counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self._register(name, 'counter', documentation, labels)
+
+    def register_gauge(self, name: str, documentation: str, labels: Sequence[str] = (),
+                       aggregation: str = 'sum') -> None:
+        """
+        Registers a gauge.
+
+        :param name: Name of the gauge.
+        :param documentation: Help text of the gauge.
+        :param labels: Names of the labels of the gauge.
+        :param aggregation: How the values of the live worker processes are merged, either 'sum', 'max' or
+        'shared' for values read from a state already shared between the processes, which are only taken from the
+        process rendering the metrics.
+        """
+        if aggregation not in self.GAUGE_AGGREGATIONS:
+            raise ValueError(f"Unknown gauge aggregation: {aggregation}")
+
+        self._register(name, 'gauge', documentation, labels, aggregation=aggregation)
+
+    def register_histogram(self, name: str, documentation: str, labels: Sequence[str] = (),
+                           buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._register(name, 'histogram', documentation, labels, buckets=sorted(buckets))
+
+    def set_function(self, name: str, function: Callable[[], object]) -> None:
+        """
+        Computes the values of a counter or gauge with a function whenever the metrics are collected, instead of
+        updating them as they change.
+
+        :param name: Name of the metric.
+        :param function: Function returning the value of a metric without labels, or a dictionary with tuples of
+        label values as keys and values as values.
+        """
+        self._get_metric(name, ('counter', 'gauge'))['function'] = function
+
+    def inc(self, name: str, value: float = 1, labels: Dict[str, str] = None) -> None:
+        metric = self._get_metric(name, ('counter', 'gauge'))
+        if value < 0 and metric['type'] == 'counter':
+            raise ValueError("Counters can only be increased")
+
+        key = self._get_label_values(metric, labels)
+        with self._lock:
+            self._reset_if_forked()
+            metric['samples'][key] = metric['samples'].get(key, 0) + value
+
+    def set(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
+        metric = self._get_metric(name, ('gauge',))
+
+        key = self._get_label_values(metric, labels)
+        with self._lock:
+            self._reset_if_forked()
+            metric['samples'][key] = value
+
+    def observe(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
+        metric = self._get_metric(name, ('histogram',))
+
+        key = self._get_label_values(metric, labels)
+        with self._lock:
+            self._reset_if_forked()
+            sample = metric['samples'].get(key)
+            if sample is None:
+                # observations per bucket, the last one being +Inf, followed by their sum
+                sample = metric['samples'][key] = [0] * (len(metric['buckets']) + 1) + [0.0]
+
+            sample[bisect.bisect_left(metric['buckets'], value)] += 1
+            sample[-1] += value
+
+    def flush(self) -> None:
+        """
+        Writes the values of the current process to the shared directory.
+        """
+        with self._lock:
+            self._reset_if_forked()
+            values = {name: [[list(key), value] for key, value in samples.items()]
+                      for name, samples in self._collect(rendering=False).items()}
+            file_path = self._file_path
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        # write to a temporary file first so that the other processes never read a partial file
+        temporary_path = f'{file_path}.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump({'pid': os.getpid(), 'metrics': values}, file)
+        os.replace(temporary_path, file_path)
+
+    def render(self) -> str:
+        """
+        Merges the values of every worker process and formats them in the Prometheus text exposition format.
+
+        :return: The metrics, in the text exposition format.
+        """
+        with self._lock:
+            self._reset_if_forked()
+            merged = {name: dict(samples) for name, samples in self._collect(rendering=True).items()}
+            own_file_path = self._file_path
+
+        os.makedirs(self._directory, exist_ok=True)
+        with open(os.path.join(self._directory, self.LOCK_FILE_NAME), 'a') as lock_file:
+            # the files of the exited processes are not read while being merged by another process
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            self._merge_exited_processes(own_file_path)
+            process_files = list(self._read_process_files(own_file_path))
+
+        for _, pid, values in process_files:
+            alive = pid is not None and self._is_process_alive(pid)
+
+            for name, samples in values.items():
+                metric = self._metrics.get(name)
+                if metric is None or metric['type'] == 'gauge' and (not alive or metric['aggregation'] == 'shared'):
+                    continue
+
+                for key, value in samples:
+                    key = tuple(key)
+                    if len(key) != len(metric['labels']):
+                        continue
+                    merged[name][key] = self._merge_values(metric, merged[name].get(key), value)
+
+        lines = []
+        for name, metric in self._metrics.items():
+            lines.append(f"# HELP {name} {self._escape(metric['documentation'], help_text=True)}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+
+            for key, value in sorted(merged[name].items()):
+                labels = list(zip(metric['labels'], key))
+                if metric['type'] == 'histogram':
+                    lines.extend(self._format_histogram(name, metric['buckets'], labels, value))
+                else:
+                    lines.append(self._format_sample(name, labels, value))
+
+        return '\n'.join(lines) + '\n'
+
+    def _register(self, name: str, metric_type: str, documentation: str, labels: Sequence[str], **options) -> None:
+        if name in self._metrics:
+            raise ValueError(f"Metric already registered: {name}")
+
+        self._metrics[name] = {'type': metric_type, 'documentation': documentation, 'labels': tuple(labels),
+                               'samples': {}, 'function': None, **options}
+
+    def _get_metric(self, name: str, metric_types: Sequence[str]) -> dict:
+        metric = self._metrics.get(name)
+        if metric is None:
+            raise KeyError(f"Unknown metric: {name}")
+        if metric['type'] not in metric_types:
+            raise TypeError(f"Metric {name} is a {metric['type']}")
+
+        return metric
+
+    @staticmethod
+    def _get_label_values(metric: dict, labels: Dict[str, str] or None) -> tuple:
+        labels = labels or {}
+        if set(labels) != set(metric['labels']):
+            raise ValueError(f"Expected the labels {metric['labels']}, got {tuple(labels)}")
+
+        return tuple(str(labels[label]) for label in metric['labels'])
+
+    def _reset_if_forked(self) -> None:
+        # a process forked from another one starts from empty values, in a file of its own
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._file_path = os.path.join(self._directory, f'{self._pid}_{uuid.uuid4().hex}.json')
+            for metric in self._metrics.values():
+                metric['samples'] = {}
+
+    def _collect(self, rendering: bool) -> Dict[str, dict]:
+        values = {}
+        for name, metric in self._metrics.items():
+            samples = metric['samples']
+
+            if metric['function'] is not None:
+                # shared values are only computed by the process rendering the metrics
+                if metric.get('aggregation') == 'shared' and not rendering:
+                    samples = {}
+                else:
+                    result = metric['function']()
+                    samples = result if isinstance(result, dict) else {(): result}
+                    samples = {tuple(str(label) for label in key): value for key, value in samples.items()}
+
+            if metric['type'] == 'histogram':
+                values[name] = {key: list(sample) for key, sample in samples.items()}
+            else:
+                values[name] = dict(samples)
+
+        return values
+
+    def _merge_exited_processes(self, own_file_path: str) -> None:
+        exited_processes_path = os.path.join(self._directory, self.EXITED_PROCESSES_FILE_NAME)
+        merged = {}
+        exited_file_paths = []
+
+        for file_path, pid, values in self._read_process_files(own_file_path):
+            if pid is not None and self._is_process_alive(pid):
+                continue
+
+            exited_file_paths.append(file_path)
+            for name, samples in values.items():
+                metric = self._metrics.get(name)
+                if metric is None or metric['type'] == 'gauge':
+                    continue
+
+                merged_samples = merged.setdefault(name, {})
+                for key, value in samples:
+                    key = tuple(key)
+                    if len(key) == len(metric['labels']):
+                        merged_samples[key] = self._merge_values(metric, merged_samples.get(key), value)
+
+        if not any(file_path != exited_processes_path for file_path in exited_file_paths):
+            return
+
+        # the merged file replaces the previous one before the files merged into it are removed
+        temporary_path = f'{exited_processes_path}.tmp'
+        with open(temporary_path, 'w') as file:
+            json.dump({'pid': None, 'metrics': {name: [[list(key), value] for key, value in samples.items()]
+                                                for name, samples in merged.items()}}, file)
+        os.replace(temporary_path, exited_processes_path)
+
+        for file_path in exited_file_paths:
+            if file_path != exited_processes_path:
+                os.remove(file_path)
+
+    def _read_process_files(self, own_file_path: str):
+        if not os.path.isdir(self._directory):
+            return
+
+        for file_name in os.listdir(self._directory):
+            file_path = os.path.join(self._directory, file_name)
+            if not file_name.endswith('.json') or file_path == own_file_path:
+                continue
+
+            try:
+                with open(file_path, 'r') as file:
+                    content = json.load(file)
+            except (FileNotFoundError, ValueError):
+                continue
+
+            yield file_path, content['pid'], content['metrics']
+
+    @staticmethod
+    def _merge_values(metric: dict, current, value):
+        if current is None:
+            return value
+        if metric['type'] == 'histogram':
+            return [a + b for a, b in zip(current, value)]
+        if metric['type'] == 'gauge' and metric['aggregation'] == 'max':
+            return max(current, value)
+
+        return current + value
+
+    @staticmethod
+    def _format_histogram(name: str, buckets: Sequence[float], labels: list, sample: list) -> list:
+        lines = []
+        cumulative_count = 0
+        for upper_bound, count in zip(list(buckets) + [math.inf], sample[:-1]):
+            cumulative_count += count
+            lines.append(MetricsRegistry._format_sample(f'{name}_bucket',
+                                                        labels + [('le', MetricsRegistry._format_value(upper_bound))],
+                                                        cumulative_count))
+
+        lines.append(MetricsRegistry._format_sample(f'{name}_sum', labels, sample[-1]))
+        lines.append(MetricsRegistry._format_sample(f'{name}_count', labels, cumulative_count))
+
+        return lines
+
+    @staticmethod
+    def _format_sample(name: str, labels: list, value: float) -> str:
+        if not labels:
+            return f'{name} {MetricsRegistry._format_value(value)}'
+
+        formatted_labels = ','.join(f'{label}="{MetricsRegistry._escape(label_value)}"'
+                                    for label, label_value in labels)
+        return f'{name}{{{formatted_labels}}} {MetricsRegistry._format_value(value)}'
+
+    @staticmethod
+    def _format_value(value: float) -> str:
+        if isinstance(value, float) and math.isnan(value):
+            return 'NaN'
+        if value == math.inf:
+            return '+Inf'
+        if value == -math.inf:
+            return '-Inf'
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+
+        return repr(value)
+
+    @staticmethod
+    def _escape(text: str, help_text: bool = False) -> str:
+        text = text.replace('\\', '\\\\').replace('\n', '\\n')
+        if not help_text:
+            text = text.replace('"', '\\"')
+
+        return text
+
+    @staticmethod
+    def _is_process_alive(pid: int) -> bool:
+        if pid == os.getpid():
+            return True
+
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+        return True
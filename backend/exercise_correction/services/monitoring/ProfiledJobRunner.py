@@ -0,0 +1,62 @@
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, Tuple
+
+from ..monitoring.JobProfiler import JobProfiler
+from ..monitoring.StageTimer import StageTimer
+
+
+class ProfiledJobRunner:
+    def __init__(self, profile_path: str, memory_report_path: str, interval: float = 0.005) -> None:
+        """
+        Runs a job under the JobProfiler in a process of its own, so that neither the sampling nor the memory
+        tracing slow down the other jobs of the worker process, and their allocations are not mixed up with the
+        ones of the job. The process is spawned rather than forked, as the worker process may be running other jobs
+        in its threads.
+
+        :param profile_path: Path to the profile saved in the folded stacks format.
+        :param memory_report_path: Path to the peak memory report.
+        :param interval: Seconds between two samples of the stack.
+        """
+        self._profile_path = profile_path
+        self._memory_report_path = memory_report_path
+        self._interval = interval
+
+    def run(self, job: Callable[..., object], stage_timer: StageTimer = None):
+        """
+        Runs a job in a new process and waits for its result. The exceptions raised by the job are raised again.
+
+        :param job: Picklable function called with the stage timer of the job process as stage_timer keyword
+        argument. A returned iterator is consumed within the job process and returned as a list.
+        :param stage_timer: Timer the stage measurements of the job are added to.
+
+        :return: The result of the job.
+        """
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            result, stages = executor.submit(self._run_profiled, job, self._profile_path, self._memory_report_path,
+                                             self._interval).result()
+
+        if stage_timer is not None:
+            for name, measurements in stages.items():
+                stage_timer.add(name, **measurements)
+
+        return result
+
+    @staticmethod
+    def _run_profiled(job: Callable[..., object], profile_path: str, memory_report_path: str,
+                      interval: float) -> Tuple[object, dict]:
+        stage_timer = StageTimer()
+        profiler = JobProfiler(interval)
+
+        # the profile is saved even when the job fails, as failing jobs are as interesting as slow ones
+        try:
+            with profiler.profile():
+                result = job(stage_timer=stage_timer)
+                if isinstance(result, Iterator):
+                    result = list(result)
+        finally:
+            profiler.save_folded_stacks(profile_path)
+            profiler.save_memory_report(memory_report_path)
+
+        return result, stage_timer.get_stages()
@@ -0,0 +1,83 @@
+import time
+
+from contextlib import contextmanager, nullcontext
+from typing import Dict
+
+from ..monitoring.Tracer import Tracer
+
+
+class StageTimer:
+    def __init__(self, tracer: Tracer = None) -> None:
+        """
+        Accumulates the time spent in each stage of the processing of a video, along with the frames processed and
+        the bytes written by the stage. A stage may be entered any number of times, as in the streaming processing
+        where every block of frames goes through every stage.
+
+        :param tracer: Tracer recording the stages as spans, or None to only accumulate their times.
+        """
+        self._stages = {}
+        self._tracer = tracer
+
+    @contextmanager
+    def stage(self, name: str, frames: int = 0, bytes_written: int = 0, traced: bool = True):
+        """
+        Times the wall and CPU time spent in the context as part of a stage. The CPU time is the one of the whole
+        process, so that the work of the native threads of the pose estimator is included.
+
+        :param name: Name of the stage.
+        :param frames: Number of frames processed in the context.
+        :param bytes_written: Number of bytes written in the context.
+        :param traced: Whether the context is recorded as a span, which is avoided for the stages entered per frame.
+        """
+        with self.span(name, frames=frames, bytes_written=bytes_written) if traced else nullcontext():
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            try:
+                yield
+            finally:
+                self.add(name, time.perf_counter() - wall_start, time.process_time() - cpu_start, frames,
+                         bytes_written)
+
+    def span(self, name: str, **args):
+        """
+        Records the context as a span of the tracer without timing it as a stage, to group stages.
+
+        :param name: Name of the span.
+        :param args: Values attached to the span.
+        """
+        if self._tracer is None:
+            return nullcontext()
+
+        return self._tracer.span(name, **args)
+
+    def add(self, name: str, wall_seconds: float = 0.0, cpu_seconds: float = 0.0, frames: int = 0,
+            bytes_written: int = 0) -> None:
+        """
+        Adds measurements to a stage.
+
+        :param name: Name of the stage.
+        :param wall_seconds: Wall time spent in the stage.
+        :param cpu_seconds: CPU time spent in the stage.
+        :param frames: Number of frames processed by the stage.
+        :param bytes_written: Number of bytes written by the stage.
+        """
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'frames': 0, 'bytes_written': 0}
+
+        stage['wall_seconds'] += wall_seconds
+        stage['cpu_seconds'] += cpu_seconds
+        stage['frames'] += frames
+        stage['bytes_written'] += bytes_written
+
+    def get_stages(self) -> Dict[str, dict]:
+        """
+        Gets the measurements of every stage, in the order the stages were first entered.
+
+        :return: Dictionary with stage names as keys and dictionaries of wall_seconds, cpu_seconds, frames and
+        bytes_written as values.
+        """
+        return {name: dict(stage) for name, stage in self._stages.items()}
+
+    def get_total_wall_seconds(self) -> float:
+        return sum(stage['wall_seconds'] for stage in self._stages.values())
@@ -0,0 +1,134 @@
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from typing import List
+
+
+# innermost span of the current thread, shared by every tracer so that their spans nest
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Tracer:
+    def __init__(self, file_path: str = None) -> None:
+        """
+        Records nested spans, such as the stages of the processing of a video within its HTTP request, sharing the
+        trace id of their outermost span. Once the outermost span ends, its spans are appended to a JSON-lines file
+        as complete events of the Chrome trace event format, one per line.
+
+        :param file_path: Path to the JSON-lines file, or None to disable the tracing.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+
+    def is_enabled(self) -> bool:
+        return self._file_path is not None
+
+    @contextmanager
+    def span(self, name: str, category: str = 'processing', **args):
+        """
+        Records the context as a span, nested in the current span if any, or as the outermost span of a new trace.
+
+        :param name: Name of the span.
+        :param category: Category of the span.
+        :param args: Values attached to the span.
+
+        :return: A context yielding the trace id of the span, or None if the tracing is disabled.
+        """
+        if self._file_path is None:
+            yield None
+            return
+
+        parent = _current_span.get()
+        span = {
+            'trace_id': parent['trace_id'] if parent is not None else uuid.uuid4().hex,
+            'span_id': uuid.uuid4().hex[:16],
+            # the spans of a trace are buffered by its outermost span
+            'events': parent['events'] if parent is not None else [],
+        }
+
+        token = _current_span.set(span)
+        timestamp = time.time()
+        start = time.perf_counter()
+        error = None
+        try:
+            yield span['trace_id']
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            _current_span.reset(token)
+
+            event_args = dict(args, trace_id=span['trace_id'], span_id=span['span_id'],
+                              parent_id=parent['span_id'] if parent is not None else None)
+            if error is not None:
+                event_args['error'] = error
+
+            span['events'].append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                # timestamps and durations in microseconds, as expected by the trace viewers
+                'ts': round(timestamp * 1e6),
+                'dur': round(duration * 1e6),
+                'pid': os.getpid(),
+                'tid': threading.get_native_id(),
+                'args': event_args,
+            })
+
+            if parent is None:
+                self._write_events(span['events'])
+
+    @staticmethod
+    def get_trace_id() -> str or None:
+        span = _current_span.get()
+        return span['trace_id'] if span is not None else None
+
+    @staticmethod
+    def load_trace(file_path: str, trace_id: str) -> List[dict]:
+        """
+        Loads the spans of a trace from a JSON-lines file.
+
+        :param file_path: Path to the JSON-lines file.
+        :param trace_id: Id of the trace.
+
+        :return: The events of the spans of the trace, ordered by start time.
+        """
+        events = []
+        with open(file_path, 'r') as file:
+            for line in file:
+                # the id is searched before decoding so that the other traces are skipped quickly
+                if trace_id not in line:
+                    continue
+
+                event = json.loads(line)
+                if event['args'].get('trace_id') == trace_id:
+                    events.append(event)
+
+        return sorted(events, key=lambda event: event['ts'])
+
+    @staticmethod
+    def save_chrome_trace(events: List[dict], file_path: str) -> None:
+        """
+        Saves events as a JSON file which can be opened in the Chrome or Perfetto trace viewers.
+
+        :param events: Events of the spans.
+        :param file_path: Path to the JSON file.
+        """
+        with open(file_path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, file)
+
+    def _write_events(self, events: List[dict]) -> None:
+        directory = os.path.dirname(self._file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # a single append per trace, so that the lines of concurrent traces are not interleaved
+        lines = ''.join(json.dumps(event) + '\n' for event in events)
+        with self._lock, open(self._file_path, 'a') as file:
+            file.write(lines)
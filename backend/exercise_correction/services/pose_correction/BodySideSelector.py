@@ -0,0 +1,80 @@
+import numpy as np
+
+from typing import Dict, List
+
+from ..constants import BLAZE_POSE_LANDMARKS
+
+
+class BodySideSelector:
+    SIDES = ('left', 'right')
+    # side the angles and the metrics of the correction rules are named after
+    REFERENCE_SIDE = 'right'
+    # landmarks of the face, analyzed whatever the side
+    FACE_LANDMARKS = ('nose', 'eye', 'ear', 'mouth')
+
+    def select(self, landmarks_dictionary: Dict[int, list]) -> str:
+        """
+        Selects the side of the body facing the camera, the one whose landmarks are the most visible on average.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values, with (x, y, z,
+        visibility) values.
+
+        :return: The side, the reference side on a tie or without landmarks.
+        """
+        if not landmarks_dictionary:
+            return self.REFERENCE_SIDE
+
+        visibilities = np.array([[keypoint[-1] for keypoint in landmarks]
+                                 for landmarks in landmarks_dictionary.values()], dtype=np.float64)
+        mean_visibilities = {side: visibilities[:, self.get_body_landmarks(side)].mean() for side in self.SIDES}
+        other_side, = set(self.SIDES) - {self.REFERENCE_SIDE}
+
+        return other_side if mean_visibilities[other_side] > mean_visibilities[self.REFERENCE_SIDE] \
+            else self.REFERENCE_SIDE
+
+    @staticmethod
+    def get_body_landmarks(side: str) -> List[int]:
+        """
+        Gets the landmarks of one side of the body, besides the face.
+
+        :param side: The side of the body.
+
+        :return: List of the indices of the landmarks.
+        """
+        return [index for name, index in BLAZE_POSE_LANDMARKS.items() if name.startswith(f'{side} ')
+                and not any(face_landmark in name for face_landmark in BodySideSelector.FACE_LANDMARKS)]
+
+    @staticmethod
+    def get_analyzed_landmarks(side: str) -> List[int]:
+        """
+        Gets the landmarks analyzed when only one side of the body is seen: the landmarks of the face and of the side.
+
+        :param side: The side of the body.
+
+        :return: Sorted list of the indices of the landmarks.
+        """
+        face_landmarks = [index for name, index in BLAZE_POSE_LANDMARKS.items()
+                          if any(face_landmark in name for face_landmark in BodySideSelector.FACE_LANDMARKS)]
+
+        return sorted(face_landmarks + BodySideSelector.get_body_landmarks(side))
+
+    @staticmethod
+    def resolve_name(name: str, side: str) -> str:
+        """
+        Resolves the name of an angle or of a landmark of the reference side for a side, by swapping the sides.
+
+        :param name: Name of the angle or landmark, such as right_hip_knee_ankle or right hip.
+        :param side: The side of the body.
+
+        :return: The name for the side.
+        """
+        if side == BodySideSelector.REFERENCE_SIDE:
+            return name
+
+        swaps = ((BodySideSelector.REFERENCE_SIDE, side), (side, BodySideSelector.REFERENCE_SIDE))
+        for separator in ('_', ' '):
+            for from_side, to_side in swaps:
+                if name.startswith(f'{from_side}{separator}'):
+                    return f'{to_side}{separator}{name[len(from_side) + 1:]}'
+
+        return name
@@ -0,0 +1,62 @@
+import numpy as np
+
+from typing import Dict, Optional
+
+from ..constants import BLAZE_POSE_LANDMARKS
+from ..pose_correction.KinematicFeatures import KinematicFeatures
+
+
+class CameraViewClassifier:
+    VIEWS = ('front', 'side')
+    # pairs of landmarks whose line is parallel to the image plane when filmed from the front, and perpendicular to it
+    # when filmed from the side
+    BODY_WIDTHS = (('left shoulder', 'right shoulder'), ('left hip', 'right hip'))
+    # angles between the lines of the body widths and the image plane, in degrees, up to which the video is filmed from
+    # the front and from which it is filmed from the side, the views in between being undetermined
+    MAX_FRONT_ANGLE = 30
+    MIN_SIDE_ANGLE = 60
+    # duration of the start of the video looked at, in seconds
+    DETECTION_SECONDS = 1
+
+    def classify(self, landmarks_dictionary: Dict[int, list], fps: float = None) -> Optional[str]:
+        """
+        Detects from which side a video is filmed, from the width of the shoulders and of the hips against their
+        depth over the first second of its landmarks.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+
+        :return: The camera view, 'front' or 'side', or None if it cannot be told.
+        """
+        if not landmarks_dictionary:
+            return None
+
+        last_frame = min(landmarks_dictionary) + self.DETECTION_SECONDS * KinematicFeatures.normalize_fps(fps)
+        angles = [self._compute_width_angle(landmarks) for frame, landmarks in landmarks_dictionary.items()
+                  if frame < last_frame]
+        angles = np.array([angle for angle in angles if angle is not None], dtype=np.float64)
+        if len(angles) == 0:
+            return None
+
+        angle = np.median(angles)
+        if angle <= self.MAX_FRONT_ANGLE:
+            return 'front'
+        if angle >= self.MIN_SIDE_ANGLE:
+            return 'side'
+
+        return None
+
+    def _compute_width_angle(self, landmarks: list) -> Optional[float]:
+        width, depth = 0, 0
+        for left_name, right_name in self.BODY_WIDTHS:
+            left, right = landmarks[BLAZE_POSE_LANDMARKS[left_name]], landmarks[BLAZE_POSE_LANDMARKS[right_name]]
+            if left is None or right is None:
+                return None
+
+            width += abs(left[0] - right[0])
+            depth += abs(left[2] - right[2])
+
+        if width == 0 and depth == 0:
+            return None
+
+        return float(np.degrees(np.arctan2(depth, width)))
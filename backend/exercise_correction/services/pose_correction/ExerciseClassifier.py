@@ -0,0 +1,88 @@
+import numpy as np
+
+from typing import Dict, Optional, Tuple
+
+from ..constants import BLAZE_POSE_LANDMARKS
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from ..pose_correction.PoseAnalyzer import PoseAnalyzer
+
+
+class ExerciseClassifier:
+    # angles whose ranges of motion tell the exercises apart, along with the orientation of the trunk
+    SIGNATURE_ANGLES = ('right_hip_knee_ankle', 'right_shoulder_elbow_wrist', 'right_shoulder_hip_knee')
+    # signature of each exercise: the ranges of motion of the signature angles and the median angle between the
+    # trunk and the vertical axis, all divided by 180 degrees
+    CENTROIDS = {
+        'squat': (0.5, 0.05, 0.45, 0.93),
+        'bicep_curl': (0.02, 0.65, 0.03, 1.0),
+        'pushup': (0.03, 0.45, 0.05, 0.55),
+    }
+    # percentiles of the angles delimiting their range of motion, ignoring the outliers
+    RANGE_PERCENTILES = (5, 95)
+
+    def __init__(self, centroids: Dict[str, Tuple[float, ...]] = None, pose_analyzer: PoseAnalyzer = None) -> None:
+        """
+        Recognizes the exercise performed in a video from its landmarks, by the nearest centroid to the signature of
+        the movement, so that the landmarks extracted for the classification are also the ones corrected.
+
+        :param centroids: Dictionary with exercise types as keys and their signatures as values.
+        :param pose_analyzer: Pose analyzer computing the angles of the landmarks.
+        """
+        centroids = self.CENTROIDS if centroids is None else centroids
+        self._exercise_types = list(centroids)
+        self._centroids = np.array([centroids[exercise_type] for exercise_type in self._exercise_types],
+                                   dtype=np.float64)
+        self._pose_analyzer = pose_analyzer if pose_analyzer is not None else PoseAnalyzer()
+
+    def compute_signature(self, landmarks_dictionary: Dict[int, list]) -> Optional[np.ndarray]:
+        """
+        Computes the signature of the movement of a sequence of landmarks.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values.
+
+        :return: Array of the signature, or None without landmarks.
+        """
+        if not landmarks_dictionary:
+            return None
+
+        # the keypoints which were never detected are left undefined
+        landmarks_array = LandmarksExtractor.convert_to_array(landmarks_dictionary.values())
+
+        signature = []
+        for angle_name in self.SIGNATURE_ANGLES:
+            compute_angle = getattr(self._pose_analyzer, f'compute_{angle_name}_angle')
+            angles = np.array([compute_angle(frame_landmarks) for frame_landmarks in landmarks_array],
+                              dtype=np.float64)
+            signature.append(self._compute_range(angles) / 180)
+
+        trunk_angles = PoseAnalyzer.calculate_vertical_orientation_angles(
+            landmarks_array[:, BLAZE_POSE_LANDMARKS['right shoulder']],
+            landmarks_array[:, BLAZE_POSE_LANDMARKS['right hip']])
+        signature.append(np.median(trunk_angles[~np.isnan(trunk_angles)]) / 180 if not np.isnan(trunk_angles).all()
+                         else np.nan)
+
+        signature = np.array(signature, dtype=np.float64)
+        return None if np.isnan(signature).any() else signature
+
+    def classify(self, landmarks_dictionary: Dict[int, list]) -> Optional[str]:
+        """
+        Recognizes the exercise performed.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values.
+
+        :return: The type of the exercise with the nearest centroid, or None if the movement has no signature.
+        """
+        signature = self.compute_signature(landmarks_dictionary)
+        if signature is None:
+            return None
+
+        distances = np.linalg.norm(self._centroids - signature, axis=1)
+        return self._exercise_types[int(np.argmin(distances))]
+
+    def _compute_range(self, angles: np.ndarray) -> float:
+        angles = angles[~np.isnan(angles)]
+        if len(angles) == 0:
+            return np.nan
+
+        lower, upper = np.percentile(angles, self.RANGE_PERCENTILES)
+        return upper - lower
@@ -0,0 +1,119 @@
+import math
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..pose_correction.KinematicFeatures import KinematicFeatures
+
+
+class FrameResampler:
+    # frame rate the landmarks are analyzed at, the one the per frame thresholds were tuned at
+    ANALYSIS_FPS = KinematicFeatures.REFERENCE_FPS
+    # relative excess of the frame rate of a video over the analysis frame rate below which it is not resampled, so
+    # that the rounding of the frame rates of the containers does not drop frames
+    FRAME_RATE_TOLERANCE = 0.05
+
+    def __init__(self, fps: Optional[float] = None, analysis_fps: float = ANALYSIS_FPS) -> None:
+        """
+        Resamples the landmarks of a video to a fixed analysis frame rate, so that the segmentation and the rules see
+        the same number of frames per second whatever the frame rate of the video. Each analysis frame is the first
+        frame of the video presented in its interval, and the analysis frames keep their source frames so that the
+        repetitions are cut from the video itself.
+
+        The videos whose frame rate is not higher than the analysis frame rate are analyzed at their own frame rate,
+        their frames being kept as they are.
+
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+        :param analysis_fps: Frame rate the landmarks are analyzed at.
+        """
+        self._source_fps = KinematicFeatures.normalize_fps(fps)
+        self._analysis_fps = analysis_fps
+        self._resampled = self._source_fps > analysis_fps * (1 + self.FRAME_RATE_TOLERANCE)
+        # source frame of every analysis frame
+        self._source_frames = dict()
+        self._last_analysis_frame = None
+
+    def get_fps(self) -> float:
+        """
+        Gets the frame rate of the analysis frames.
+
+        :return: The analysis frame rate if the video is resampled, the frame rate of the video otherwise.
+        """
+        return self._analysis_fps if self._resampled else self._source_fps
+
+    def is_resampled(self) -> bool:
+        return self._resampled
+
+    def get_analysis_frame(self, frame: int, timestamps: Sequence[float] = None) -> Optional[int]:
+        """
+        Maps a frame of the video to the analysis frame it is sampled as.
+
+        :param frame: Frame number in the video.
+        :param timestamps: Timestamps of the decoded frames in seconds, indexed by frame number, the frames being
+        evenly spaced at the frame rate of the video where they are unknown.
+
+        :return: The analysis frame number, or None if the frame is skipped.
+        """
+        if not self._resampled:
+            return frame
+
+        previous_timestamp, timestamp = self._get_timestamps(frame, timestamps)
+        analysis_frame = self._get_interval(timestamp)
+        if frame > 0 and self._get_interval(previous_timestamp) >= analysis_frame:
+            return None
+        # the analysis frames follow each other even where the timestamps are unknown for some frames only
+        if self._source_frames and analysis_frame <= self._last_analysis_frame:
+            return None
+
+        self._last_analysis_frame = analysis_frame
+        self._source_frames[analysis_frame] = frame
+        return analysis_frame
+
+    def resample(self, landmarks_dictionary: Dict[int, list], timestamps: Sequence[float] = None) -> Dict[int, list]:
+        """
+        Resamples landmarks to the analysis frame rate.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values.
+        :param timestamps: Timestamps of the decoded frames in seconds, indexed by frame number, if known.
+
+        :return: Dictionary with analysis frame numbers as keys and landmarks as values, the frames without
+        landmarks staying missing.
+        """
+        if not self._resampled:
+            return landmarks_dictionary
+
+        resampled_landmarks = dict()
+        for frame, landmarks in landmarks_dictionary.items():
+            analysis_frame = self.get_analysis_frame(frame, timestamps)
+            if analysis_frame is not None:
+                resampled_landmarks[analysis_frame] = landmarks
+
+        return resampled_landmarks
+
+    def get_source_frame(self, analysis_frame: int) -> int:
+        """
+        Maps an analysis frame back to the frame of the video it was sampled from.
+
+        :param analysis_frame: Analysis frame number, as returned by get_analysis_frame or resample.
+
+        :return: The frame number in the video.
+        """
+        if not self._resampled:
+            return analysis_frame
+
+        return self._source_frames[analysis_frame]
+
+    def get_source_frames(self, analysis_frames: List[int]) -> List[int]:
+        return [self.get_source_frame(analysis_frame) for analysis_frame in analysis_frames]
+
+    def _get_timestamps(self, frame: int, timestamps: Optional[Sequence[float]]) -> Tuple[float, float]:
+        # containers which do not report the presentation times give non increasing timestamps, in which case the
+        # frames are assumed to be evenly spaced
+        if timestamps is not None and frame < len(timestamps) and \
+                (frame == 0 or timestamps[frame] > timestamps[frame - 1]):
+            return timestamps[frame - 1] if frame > 0 else timestamps[frame], timestamps[frame]
+
+        return (frame - 1) / self._source_fps, frame / self._source_fps
+
+    def _get_interval(self, timestamp: float) -> int:
+        # a small margin so that the frames falling exactly on the start of an interval are not off by one
+        return math.floor(timestamp * self._analysis_fps + 1e-6)
@@ -0,0 +1,93 @@
+import numpy as np
+
+from typing import Optional, Tuple
+
+
+class KinematicFeatures:
+    # frame rate the per frame thresholds were tuned at, assumed when the frame rate of a video is unknown
+    REFERENCE_FPS = 30
+
+    def __init__(self, frames: np.ndarray, fps: Optional[float] = None) -> None:
+        """
+        Finite differences of the series of values of a sequence of frames, normalized by the frame rate so that the
+        velocities are per second and the accelerations per second squared, whatever the frame rate of the video.
+
+        The differences are only taken between consecutive frames, and are NaN for the frames whose previous frame is
+        missing. The previous frame of every frame is found once and shared by all the differentiated series.
+
+        :param frames: Array of the frame numbers, in the order of the series.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+        """
+        self._frames = np.asarray(frames, dtype=np.int64)
+        self._fps = self.normalize_fps(fps)
+        self._previous_indices, self._has_previous = self._find_previous_frames(self._frames)
+
+    @staticmethod
+    def normalize_fps(fps: Optional[float]) -> float:
+        """
+        Gets the frame rate used for the differences, the reference frame rate when the frame rate is unknown.
+
+        :param fps: Frame rate of the video, None or not positive when unknown.
+
+        :return: The frame rate.
+        """
+        return float(fps) if fps is not None and fps > 0 else float(KinematicFeatures.REFERENCE_FPS)
+
+    @staticmethod
+    def get_change_per_frame(speed: float, fps: Optional[float] = None) -> float:
+        """
+        Converts a speed into the change between two consecutive frames.
+
+        :param speed: Speed, per second.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+
+        :return: The change per frame.
+        """
+        return speed / KinematicFeatures.normalize_fps(fps)
+
+    def get_frames(self) -> np.ndarray:
+        return self._frames
+
+    def get_fps(self) -> float:
+        return self._fps
+
+    def get_previous_values(self, values: np.ndarray) -> np.ndarray:
+        """
+        Gets the values of the frames preceding every frame.
+
+        :param values: Array of the values of every frame.
+
+        :return: Array of the values of the previous frames, NaN for the frames whose previous frame is missing.
+        """
+        return np.where(self._has_previous, np.asarray(values, dtype=np.float64)[self._previous_indices], np.nan)
+
+    def get_velocities(self, values: np.ndarray) -> np.ndarray:
+        """
+        Computes the first differences of the values, per second.
+
+        :param values: Array of the values of every frame.
+
+        :return: Array of the velocities, NaN for the frames whose previous frame is missing.
+        """
+        return (np.asarray(values, dtype=np.float64) - self.get_previous_values(values)) * self._fps
+
+    def get_accelerations(self, velocities: np.ndarray) -> np.ndarray:
+        """
+        Computes the second differences of the values from their velocities, per second squared.
+
+        :param velocities: Array of the velocities of every frame.
+
+        :return: Array of the accelerations, NaN for the frames whose two previous frames are not both known.
+        """
+        return self.get_velocities(velocities)
+
+    @staticmethod
+    def _find_previous_frames(frames: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(frames) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+        order = np.argsort(frames)
+        positions = np.minimum(np.searchsorted(frames[order], frames - 1), len(frames) - 1)
+        previous_indices = order[positions]
+
+        return previous_indices, frames[previous_indices] == frames - 1
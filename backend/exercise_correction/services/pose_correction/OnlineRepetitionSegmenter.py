@@ -0,0 +1,81 @@
+from typing import Optional
+
+
+class OnlineRepetitionSegmenter:
+    def __init__(self, angle_threshold: float, error_threshold: float = 15, change_threshold: float = 20) -> None:
+        """
+        Online counterpart of AnglesAnalyzer.get_repetition_split_frames, which consumes the flexion angles one
+        frame at a time and reports each split frame as soon as it is known.
+
+        :param angle_threshold: Angle threshold to identify the start and end of repetitions.
+        :param error_threshold: Angle threshold to ignore when identifying repetitions.
+        :param change_threshold: Maximum allowed change between consecutive angles to consider valid.
+        """
+        self._angle_threshold = angle_threshold
+        self._error_threshold = error_threshold
+        self._change_threshold = change_threshold
+        self._in_repetition = False
+        self._has_sequence = False
+        self._previous_angle = None
+        # frame with the maximum angle since the last frame of the last sequence
+        self._max_angle_frame = None
+        self._max_angle = None
+
+    def push(self, frame: int, angle: float) -> Optional[int]:
+        """
+        Consumes the flexion angle of the next frame.
+
+        :param frame: Frame number, greater than the previously pushed ones.
+        :param angle: Flexion angle of the frame.
+
+        :return: The frame where the previous repetition ends, if it became known with this frame, None otherwise.
+        """
+        starts_sequence = not self._in_repetition
+
+        if self._consume(angle):
+            split_frame = None
+
+            # a new sequence starts, so the maximum angle frame since the last one splits the repetitions
+            if starts_sequence and self._has_sequence and self._max_angle_frame is not None:
+                split_frame = self._max_angle_frame
+
+            self._has_sequence = True
+            self._max_angle_frame = None
+            self._max_angle = None
+
+            return split_frame
+
+        if self._has_sequence and (self._max_angle_frame is None or angle > self._max_angle):
+            self._max_angle_frame = frame
+            self._max_angle = angle
+
+        return None
+
+    def _consume(self, angle: float) -> bool:
+        """
+        Applies the rules of AnglesAnalyzer.get_repetition_split_frames to the angle of the next frame.
+
+        :param angle: Flexion angle of the frame.
+
+        :return: True if the frame is added to the current sequence, False otherwise.
+        """
+        # ignore angles smaller than error_threshold
+        if angle < self._error_threshold:
+            return False
+
+        # ignore sudden large changes
+        if self._previous_angle is not None and abs(angle - self._previous_angle) > self._change_threshold:
+            return False
+
+        self._previous_angle = angle
+
+        # check if the angle is below the threshold
+        if angle < self._angle_threshold:
+            self._in_repetition = True
+            return True
+
+        # the current sequence ends once the angle is back above the threshold
+        if angle >= self._angle_threshold:
+            self._in_repetition = False
+
+        return False
@@ -1,71 +1,435 @@
-from ..landmarks_extractor.BlazePoseLandmarksExtractor import BlazePoseLandmarksExtractor
-from ..pose_correction.AnglesAnalyzer import AnglesAnalyzer
-from ..pose_correction.PoseAnalyzer import PoseAnalyzer
-
-
-class PoseCorrection:
-    def __init__(self) -> None:
-        self._angle_names = list()
-        self._segmentation_angle_name = None
-        self._pose_analyzer = PoseAnalyzer()
-        self._REPETITION_START_THRESHOLD = None
-        self._ERROR_THRESHOLD = None
-        self._CHANGE_THRESHOLD = None
-
-    def process_video(self, video_path: str) -> dict:
-        """
-        Processes the video to extract landmarks, compute angles, and provide correction advice.
-
-        :param video_path: Path to the video file.
-        :return: A dictionary with correction advice for each repetition represented by a video segment.
-        """
-        # extract landmarks
-        landmarks_extractor = BlazePoseLandmarksExtractor()
-        landmarks_extractor.extract_landmarks_from_video(video_path)
-        landmarks_dictionary = landmarks_extractor.get_landmarks_dictionary()
-
-        processed_landmarks_dictionary = landmarks_extractor.process_keypoints(landmarks_dictionary)
-
-        # compute angles and metrics
-        angles_analyzer = AnglesAnalyzer(processed_landmarks_dictionary, self._pose_analyzer)
-
-        angles_analyzer.compute_angles(self._angle_names)
-        all_angles = angles_analyzer.get_angles()
-        # print(all_angles)
-
-        # get repetitions delimitation frames from video
-        repetition_frames = angles_analyzer.get_repetition_split_frames(all_angles[self._segmentation_angle_name],
-                                                                        self._REPETITION_START_THRESHOLD,
-                                                                        self._ERROR_THRESHOLD,
-                                                                        self._CHANGE_THRESHOLD)
-
-        # split video into repetitions
-        video_names = angles_analyzer.split_video_into_repetitions(video_path, repetition_frames)
-
-        # split landmarks and angles into repetitions
-        landmarks_on_repetitions = angles_analyzer.split_landmarks_data_into_repetitions(processed_landmarks_dictionary,
-                                                                                         repetition_frames)
-        angles_on_repetitions = angles_analyzer.split_angles_data_into_repetitions(all_angles, repetition_frames)
-
-        # get correction advice for each repetition
-        all_correction_advice = dict()
-        for repetition in range(len(angles_on_repetitions)):
-            if landmarks_on_repetitions[repetition] == [] or angles_on_repetitions[repetition] == []:
-                continue
-
-            correction_advice = self._get_correction_advice(landmarks_on_repetitions[repetition],
-                                                            angles_on_repetitions[repetition])
-            all_correction_advice[video_names[repetition]] = correction_advice
-
-        return all_correction_advice
-
-    def _get_correction_advice(self, landmarks: dict, angles: dict) -> dict:
-        """
-        Provides correction advice based on the given landmarks and angles.
-
-        :param landmarks: A dictionary of body landmarks.
-        :param angles: A dictionary of calculated angles between landmarks.
-
-        :return: A dictionary with repetition videos, correction advice and their correction level.
-        """
-        pass
+import itertools
+import os
+
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..constants import BLAZE_POSE_LANDMARKS
+from ..exception.custom_exceptions import LandmarkExtractionError
+from ..landmarks_extractor.BlazePoseLandmarksExtractor import BlazePoseLandmarksExtractor
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from ..landmarks_extractor.StreamingKeypointsProcessor import StreamingKeypointsProcessor
+from ..monitoring.StageTimer import StageTimer
+from ..pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from ..pose_correction.BodySideSelector import BodySideSelector
+from ..pose_correction.CameraViewClassifier import CameraViewClassifier
+from ..pose_correction.FrameResampler import FrameResampler
+from ..pose_correction.KinematicFeatures import KinematicFeatures
+from ..pose_correction.OnlineRepetitionSegmenter import OnlineRepetitionSegmenter
+from ..pose_correction.PoseAnalyzer import PoseAnalyzer
+from ..pose_correction.RepetitionClipWriter import RepetitionClipWriter
+from ..rules.CorrectionRuleSet import CorrectionRuleSet
+from ..rules.RepetitionMetrics import RepetitionMetrics
+from ..rules.RuleSetRepository import RuleSetRepository
+
+
+class PoseCorrection:
+    def __init__(self, rule_set_repository: RuleSetRepository = None) -> None:
+        self._exercise_type = None
+        self._rule_set_repository = rule_set_repository if rule_set_repository is not None \
+            else RuleSetRepository.get_default()
+        self._segmentation_angle_name = None
+        self._pose_analyzer = PoseAnalyzer()
+        self._camera_view_classifier = CameraViewClassifier()
+        self._body_side_selector = BodySideSelector()
+        self._REPETITION_START_THRESHOLD = None
+        self._ERROR_THRESHOLD = None
+        # maximum speed of the segmentation angle between consecutive frames, in degrees per second
+        self._CHANGE_THRESHOLD = None
+
+    def process_video(self, video_path: str, model_complexity: int = 2,
+                      landmarks_extractor: LandmarksExtractor = None, stage_timer: StageTimer = None,
+                      rule_set: CorrectionRuleSet = None, advice_executor: Executor = None) -> dict:
+        """
+        Processes the video to extract landmarks, compute angles, and provide correction advice.
+
+        :param video_path: Path to the video file.
+        :param model_complexity: BlazePose model complexity used for the landmarks extraction.
+        :param landmarks_extractor: Extractor used instead of BlazePose for the landmarks extraction.
+        :param stage_timer: Timer accumulating the time spent in each processing stage.
+        :param rule_set: Rule set evaluated on every repetition, defaults to the current one.
+        :param advice_executor: Executor evaluating the advice of the repetitions concurrently, sequentially if None.
+        :return: A dictionary with correction advice for each repetition represented by a video segment.
+        """
+        if stage_timer is None:
+            stage_timer = StageTimer()
+
+        # the rule set is pinned so that a reload does not change the rules in the middle of a video
+        if rule_set is None:
+            rule_set = self.get_rule_set()
+
+        # extract landmarks
+        if landmarks_extractor is None:
+            landmarks_extractor = BlazePoseLandmarksExtractor(model_complexity)
+        landmarks_extractor.set_stage_timer(stage_timer)
+        with stage_timer.span('extraction'):
+            landmarks_extractor.extract_landmarks_from_video(video_path)
+        landmarks_dictionary = landmarks_extractor.get_landmarks_dictionary()
+
+        # the landmarks are analyzed at a fixed frame rate, and the repetitions are cut at the frames of the video the
+        # analysis frames were sampled from
+        frame_resampler = FrameResampler(AnglesAnalyzer.get_video_frame_rate(video_path))
+        with stage_timer.stage('resampling', frames=len(landmarks_dictionary)):
+            landmarks_dictionary = frame_resampler.resample(landmarks_dictionary,
+                                                            landmarks_extractor.get_frame_timestamps())
+        frames = len(landmarks_dictionary)
+        fps = frame_resampler.get_fps()
+
+        # the rules which do not apply to the camera view of the video are skipped for all its repetitions, and only
+        # the side of the body facing the camera is analyzed
+        with stage_timer.stage('view_detection', frames=frames):
+            camera_view, side, keypoint_indices = self._detect_view(landmarks_dictionary, fps)
+        segmentation_angle_name = BodySideSelector.resolve_name(self._segmentation_angle_name, side)
+
+        with stage_timer.stage('keypoints_processing', frames=frames):
+            processed_landmarks_dictionary = landmarks_extractor.process_keypoints(
+                landmarks_dictionary, keypoint_indices=keypoint_indices)
+
+        # only the segmentation angle is needed for every frame, the metrics of the rules being computed on demand for
+        # each repetition
+        angles_analyzer = AnglesAnalyzer(processed_landmarks_dictionary, self._pose_analyzer)
+
+        with stage_timer.stage('angles', frames=frames):
+            angles_analyzer.compute_angles([segmentation_angle_name])
+            all_angles = angles_analyzer.get_angles()
+        # print(all_angles)
+
+        # get repetitions delimitation frames from video
+        with stage_timer.stage('segmentation', frames=frames):
+            repetition_frames = angles_analyzer.get_repetition_split_frames(
+                all_angles[segmentation_angle_name], self._REPETITION_START_THRESHOLD, self._ERROR_THRESHOLD,
+                KinematicFeatures.get_change_per_frame(self._CHANGE_THRESHOLD, fps))
+
+        with stage_timer.span('split', repetitions=len(repetition_frames) + 1):
+            # split video into repetitions
+            with stage_timer.stage('clip_encoding'):
+                video_names = angles_analyzer.split_video_into_repetitions(
+                    video_path, frame_resampler.get_source_frames(repetition_frames))
+            stage_timer.add('clip_encoding', bytes_written=self._get_files_size(video_names))
+
+            # split landmarks and angles into repetitions, as views of the arrays of the whole video
+            with stage_timer.stage('segmentation'):
+                video_frames, video_landmarks, segmentation_angles = self._get_video_arrays(
+                    processed_landmarks_dictionary, all_angles[segmentation_angle_name])
+                repetition_slices = angles_analyzer.get_repetition_slices(video_frames, repetition_frames)
+
+        # get correction advice for each repetition
+        with stage_timer.stage('advice', frames=sum(repetition_slice.stop - repetition_slice.start
+                                                    for repetition_slice in repetition_slices)):
+            all_correction_advice = self._evaluate_repetitions(video_frames, video_landmarks, segmentation_angles,
+                                                               repetition_slices, rule_set, fps, advice_executor,
+                                                               camera_view, side)
+
+        # the advice is in the order of the repetitions, whatever the order of their evaluation
+        return dict(zip(video_names, all_correction_advice))
+
+    def process_video_stream(self, video_path: str, model_complexity: int = 2,
+                             landmarks_extractor: LandmarksExtractor = None,
+                             block_size: int = LandmarksExtractor.DEFAULT_BLOCK_SIZE,
+                             stage_timer: StageTimer = None,
+                             rule_set: CorrectionRuleSet = None) -> Iterator[Tuple[str, dict]]:
+        """
+        Processes the video incrementally, yielding the correction advice of each repetition as soon as the
+        repetition ends. Only the frames of the current repetition are retained, so the memory used does not grow
+        with the length of the video.
+
+        :param video_path: Path to the video file.
+        :param model_complexity: BlazePose model complexity used for the landmarks extraction.
+        :param landmarks_extractor: Extractor used instead of BlazePose for the landmarks extraction.
+        :param block_size: Number of frames extracted and processed at once.
+        :param stage_timer: Timer accumulating the time spent in each processing stage.
+        :param rule_set: Rule set evaluated on every repetition, defaults to the current one.
+
+        :return: An iterator of video segments and their correction advice, one for each repetition.
+        """
+        if stage_timer is None:
+            stage_timer = StageTimer()
+
+        # the rule set is pinned so that a reload does not change the rules in the middle of a video
+        if rule_set is None:
+            rule_set = self.get_rule_set()
+
+        if landmarks_extractor is None:
+            landmarks_extractor = BlazePoseLandmarksExtractor(model_complexity)
+        landmarks_extractor.set_stage_timer(stage_timer)
+        angles_analyzer = AnglesAnalyzer(dict(), self._pose_analyzer)
+        clip_writer = RepetitionClipWriter(video_path)
+        # the landmarks are analyzed at a fixed frame rate, and the clips are cut at the frames of the video the
+        # analysis frames were sampled from
+        frame_resampler = FrameResampler(clip_writer.get_frame_rate())
+        fps = frame_resampler.get_fps()
+        repetition_segmenter = OnlineRepetitionSegmenter(
+            self._REPETITION_START_THRESHOLD, self._ERROR_THRESHOLD,
+            KinematicFeatures.get_change_per_frame(self._CHANGE_THRESHOLD, fps))
+
+        try:
+            landmark_blocks = self._iter_resampled_blocks(
+                landmarks_extractor.iter_landmark_blocks(video_path, block_size), frame_resampler, landmarks_extractor,
+                stage_timer)
+            with stage_timer.span('extraction'):
+                first_landmarks_block = next(landmark_blocks, dict())
+
+            # the camera view and the side of the body facing the camera are detected from the first block
+            with stage_timer.stage('view_detection', frames=len(first_landmarks_block)):
+                camera_view, side, keypoint_indices = self._detect_view(first_landmarks_block, fps)
+            segmentation_angle_name = BodySideSelector.resolve_name(self._segmentation_angle_name, side)
+            keypoints_processor = StreamingKeypointsProcessor(keypoint_indices=keypoint_indices)
+
+            # landmarks and angles of the current repetition, from its first frame up to the last processed frame
+            repetition_landmarks = dict()
+            repetition_angles = {segmentation_angle_name: dict()}
+
+            processed_blocks = self._iter_processed_blocks(itertools.chain([first_landmarks_block], landmark_blocks),
+                                                           keypoints_processor, stage_timer)
+            for processed_landmarks in processed_blocks:
+                with stage_timer.stage('angles', frames=len(processed_landmarks)):
+                    angles = angles_analyzer.compute_angles_for_landmarks(processed_landmarks,
+                                                                          [segmentation_angle_name])
+
+                for frame, landmarks in processed_landmarks.items():
+                    # the stages are closed before yielding, so that the time spent by the consumer is not included
+                    with stage_timer.stage('segmentation', frames=1, traced=False):
+                        repetition_landmarks[frame] = landmarks
+                        segmentation_angle = angles[segmentation_angle_name][frame]
+                        repetition_angles[segmentation_angle_name][frame] = segmentation_angle
+
+                        split_frame = repetition_segmenter.push(frame, segmentation_angle)
+                    if split_frame is None:
+                        continue
+
+                    with stage_timer.span('split', frame=split_frame):
+                        with stage_timer.stage('segmentation'):
+                            # the repetition ends at the split frame, which is also the first frame of the next one
+                            landmarks_segment = {f: v for f, v in repetition_landmarks.items() if f <= split_frame}
+                            angles_segment = {angle_name: {f: v for f, v in angle_values.items() if f <= split_frame}
+                                              for angle_name, angle_values in repetition_angles.items()}
+                            repetition_landmarks = {f: v for f, v in repetition_landmarks.items()
+                                                    if f >= split_frame}
+                            repetition_angles = {angle_name: {f: v for f, v in angle_values.items()
+                                                              if f >= split_frame}
+                                                 for angle_name, angle_values in repetition_angles.items()}
+
+                        with stage_timer.stage('clip_encoding'):
+                            video_name = clip_writer.write_clip(frame_resampler.get_source_frame(split_frame))
+                        stage_timer.add('clip_encoding', bytes_written=self._get_files_size([video_name]))
+
+                    with stage_timer.stage('advice', frames=len(landmarks_segment)):
+                        correction_advice = self._get_correction_advice(landmarks_segment, angles_segment, rule_set,
+                                                                        fps, camera_view, side)
+                    yield video_name, correction_advice
+
+            if not repetition_landmarks:
+                raise LandmarkExtractionError("No pose was detected in the video")
+
+            with stage_timer.stage('clip_encoding'):
+                video_name = clip_writer.write_last_clip()
+            stage_timer.add('clip_encoding', bytes_written=self._get_files_size([video_name]))
+
+            with stage_timer.stage('advice', frames=len(repetition_landmarks)):
+                correction_advice = self._get_correction_advice(repetition_landmarks, repetition_angles, rule_set,
+                                                                fps, camera_view, side)
+            yield video_name, correction_advice
+        finally:
+            clip_writer.release()
+
+    def _detect_view(self, landmarks_dictionary: Dict[int, list],
+                     fps: float) -> Tuple[Optional[str], str, Optional[List[int]]]:
+        """
+        Detects the camera view of a video and the side of the body facing the camera from its unprocessed landmarks.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values, with (x, y, z,
+        visibility) values.
+        :param fps: Frame rate of the video.
+
+        :return: A tuple containing the camera view, None if unknown, the side of the body analyzed and the indices of
+        the keypoints analyzed, all of them if None.
+        """
+        camera_view = self._camera_view_classifier.classify(landmarks_dictionary, fps)
+        side = self._body_side_selector.select(landmarks_dictionary)
+
+        # filmed from the side, the far side of the body is occluded and no applicable rule looks at it
+        keypoint_indices = BodySideSelector.get_analyzed_landmarks(side) if camera_view == 'side' else None
+
+        return camera_view, side, keypoint_indices
+
+    @staticmethod
+    def _iter_resampled_blocks(landmark_blocks: Iterator[Dict[int, list]], frame_resampler: FrameResampler,
+                               landmarks_extractor: LandmarksExtractor,
+                               stage_timer: StageTimer) -> Iterator[Dict[int, list]]:
+        """
+        Lazily resamples the landmarks of the video to the analysis frame rate, block by block.
+
+        :param landmark_blocks: An iterator of the blocks of the landmarks of the video, extracted on demand.
+        :param frame_resampler: The resampler of the video.
+        :param landmarks_extractor: The extractor of the landmarks, giving the timestamps of the decoded frames.
+        :param stage_timer: Timer accumulating the time spent in each processing stage.
+
+        :return: An iterator of dictionaries with analysis frame numbers as keys and landmarks as values.
+        """
+        for landmarks_block in landmark_blocks:
+            with stage_timer.stage('resampling', frames=len(landmarks_block)):
+                resampled_block = frame_resampler.resample(landmarks_block, landmarks_extractor.get_frame_timestamps())
+            yield resampled_block
+
+    @staticmethod
+    def _iter_processed_blocks(landmark_blocks: Iterator[Dict[int, list]],
+                               keypoints_processor: StreamingKeypointsProcessor,
+                               stage_timer: StageTimer) -> Iterator[Dict[int, list]]:
+        """
+        Lazily filters and interpolates the landmarks of the video, block by block.
+
+        :param landmark_blocks: An iterator of the blocks of the landmarks of the video, extracted on demand.
+        :param keypoints_processor: The processor used for the extracted landmarks.
+        :param stage_timer: Timer accumulating the time spent in each processing stage.
+
+        :return: An iterator of processed dictionaries of keypoints.
+        """
+        while True:
+            # the landmarks are extracted lazily, when the next block is requested
+            with stage_timer.span('extraction'):
+                landmarks_block = next(landmark_blocks, None)
+            if landmarks_block is None:
+                break
+            if not landmarks_block:
+                continue
+
+            with stage_timer.stage('keypoints_processing', frames=len(landmarks_block)):
+                processed_block = keypoints_processor.process_block(landmarks_block)
+            if processed_block:
+                yield processed_block
+
+        with stage_timer.stage('keypoints_processing'):
+            processed_block = keypoints_processor.flush()
+        if processed_block:
+            yield processed_block
+
+    def _get_video_arrays(self, landmarks_dictionary: Dict[int, list],
+                          segmentation_angles: Dict[int, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gathers the landmarks and segmentation angles of the whole video into arrays sorted by frame.
+
+        :param landmarks_dictionary: Dictionary with frame numbers as keys and landmarks as values.
+        :param segmentation_angles: Dictionary with frame numbers as keys and segmentation angles as values.
+
+        :return: A tuple containing the frame numbers, the landmarks and the segmentation angles of every frame.
+        """
+        frames = sorted(landmarks_dictionary)
+
+        # the keypoints which are not analyzed are undefined
+        landmarks = LandmarksExtractor.convert_to_array([landmarks_dictionary[frame] for frame in frames],
+                                                        len(BLAZE_POSE_LANDMARKS))
+        angles = np.array([segmentation_angles[frame] for frame in frames], dtype=np.float64)
+
+        return np.array(frames, dtype=np.int64), landmarks, angles
+
+    def _evaluate_repetitions(self, frames: np.ndarray, landmarks: np.ndarray, segmentation_angles: np.ndarray,
+                              repetition_slices: List[slice], rule_set: CorrectionRuleSet, fps: float,
+                              advice_executor: Executor = None, camera_view: Optional[str] = None,
+                              side: str = BodySideSelector.REFERENCE_SIDE) -> List[dict]:
+        """
+        Evaluates the rule set on every repetition, each one reading its views of the arrays of the whole video.
+
+        :param frames: Array of the frame numbers of the video.
+        :param landmarks: Array of the landmarks of every frame of the video.
+        :param segmentation_angles: Array of the segmentation angles of every frame of the video.
+        :param repetition_slices: List of slices of the frames of each repetition.
+        :param rule_set: Rule set evaluated.
+        :param fps: Frame rate of the video.
+        :param advice_executor: Executor evaluating the repetitions concurrently, sequentially if None.
+        :param camera_view: Camera view of the video, every rule being evaluated if None.
+        :param side: Side of the body analyzed.
+
+        :return: A list of dictionaries with correction advice, in the order of the repetitions.
+        """
+        def evaluate(repetition_slice: slice) -> dict:
+            metrics = RepetitionMetrics(frames[repetition_slice], landmarks[repetition_slice],
+                                        {BodySideSelector.resolve_name(self._segmentation_angle_name, side):
+                                            segmentation_angles[repetition_slice]},
+                                        self._pose_analyzer, self._segmentation_angle_name,
+                                        self._REPETITION_START_THRESHOLD, self._ERROR_THRESHOLD, fps, side)
+            return rule_set.evaluate(self._exercise_type, metrics, camera_view)
+
+        if advice_executor is None:
+            return [evaluate(repetition_slice) for repetition_slice in repetition_slices]
+
+        futures = [advice_executor.submit(evaluate, repetition_slice) for repetition_slice in repetition_slices]
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _get_files_size(file_paths: List[str]) -> int:
+        return sum(os.path.getsize(file_path) for file_path in file_paths if os.path.isfile(file_path))
+
+    def get_rule_set(self) -> CorrectionRuleSet:
+        """
+        Gets the current correction rule set, which is reloaded when its file changes.
+
+        :return: The compiled rule set.
+        """
+        return self._rule_set_repository.get_rule_set()
+
+    def _get_correction_advice(self, landmarks: dict, angles: dict, rule_set: CorrectionRuleSet = None,
+                               fps: float = None, camera_view: Optional[str] = None,
+                               side: str = BodySideSelector.REFERENCE_SIDE) -> dict:
+        """
+        Provides correction advice based on the given landmarks and angles.
+
+        :param landmarks: A dictionary of body landmarks.
+        :param angles: A dictionary of calculated angles between landmarks, the other angles required by the rules
+        being computed from the landmarks.
+        :param rule_set: Rule set evaluated, defaults to the current one.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+        :param camera_view: Camera view of the video, every rule being evaluated if None.
+        :param side: Side of the body analyzed, after which the angles are named.
+
+        :return: A dictionary with correction advice.
+        """
+        if rule_set is None:
+            rule_set = self.get_rule_set()
+
+        return rule_set.evaluate(self._exercise_type, self._create_repetition_metrics(landmarks, angles, fps, side),
+                                 camera_view)
+
+    def _create_repetition_metrics(self, landmarks: dict, angles: dict, fps: float = None,
+                                   side: str = BodySideSelector.REFERENCE_SIDE) -> RepetitionMetrics:
+        return RepetitionMetrics.from_dictionaries(landmarks, angles, self._pose_analyzer,
+                                                   self._segmentation_angle_name, self._REPETITION_START_THRESHOLD,
+                                                   self._ERROR_THRESHOLD, fps, side)
+
+    def _evaluate_value(self, category: str, value: float) -> tuple:
+        """
+        Evaluates a rule of the current rule set on an already reduced value.
+
+        :param category: Category of the rule.
+        :param value: The reduced value.
+
+        :return: A tuple containing the correction advice and the correction level.
+        """
+        return self.get_rule_set().get_rule(self._exercise_type, category).classify_value(value)
+
+    def _evaluate_frame(self, category: str, landmarks: list) -> tuple:
+        """
+        Evaluates a rule of the current rule set on the landmark metric of a single frame.
+
+        :param category: Category of the rule.
+        :param landmarks: Landmarks of the frame.
+
+        :return: A tuple containing the correction advice and the correction level.
+        """
+        rule = self.get_rule_set().get_rule(self._exercise_type, category)
+        value = self._create_repetition_metrics({0: landmarks}, dict()).get_metric(rule.get_metric())[0]
+
+        return rule.classify_value(value)
+
+    def _evaluate_eccentric_concentric_ratio(self, angles: dict) -> tuple:
+        """
+        Evaluates the eccentric-concentric ratio rule of the current rule set.
+
+        :param angles: Dictionary with frame numbers as keys and segmentation angles as values.
+
+        :return: A tuple containing the correction advice and the correction level.
+        """
+        metrics = self._create_repetition_metrics(dict(), {self._segmentation_angle_name: angles})
+
+        return self._evaluate_value('eccentric_concentric_ratio', metrics.get_metric('eccentric_concentric_ratio'))
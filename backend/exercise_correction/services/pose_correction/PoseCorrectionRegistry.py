@@ -0,0 +1,97 @@
+import threading
+
+from importlib.metadata import entry_points
+from typing import Callable, Dict, List, Optional
+
+from ..pose_correction.BicepCurlPoseCorrection import BicepCurlPoseCorrection
+from ..pose_correction.PoseCorrection import PoseCorrection
+from ..pose_correction.PushupPoseCorrection import PushUpPoseCorrection
+from ..pose_correction.SquatPoseCorrection import SquatPoseCorrection
+from ..rules.RuleSetRepository import RuleSetRepository
+
+
+class PoseCorrectionRegistry:
+    # group of the entry points of the installed packages adding exercises, each one named after its exercise type
+    # and referring to a PoseCorrection subclass, or any callable creating it from a rule set repository
+    ENTRY_POINT_GROUP = 'fitness_virtual_trainer.pose_corrections'
+
+    def __init__(self, rule_set_repository: RuleSetRepository = None, load_entry_points: bool = True) -> None:
+        """
+        Maps the exercise types to their pose corrections, each one created on first use and then reused by all the
+        jobs of the process. The pose corrections keep no state of their jobs, so a single instance serves the
+        concurrent jobs, along with its pose analyzer and the rule sets compiled by the repository.
+
+        Besides the built-in exercises, the exercises of the entry points of the ENTRY_POINT_GROUP group are
+        registered, overriding the built-in ones with the same exercise type.
+
+        :param rule_set_repository: Repository of the correction rules of the pose corrections.
+        :param load_entry_points: Whether to register the exercises of the entry points.
+        """
+        self._rule_set_repository = rule_set_repository
+        self._lock = threading.Lock()
+        self._factories = dict()
+        self._pose_corrections = dict()
+        self._load_errors = dict()
+
+        self.register('squat', SquatPoseCorrection)
+        self.register('bicep_curl', BicepCurlPoseCorrection)
+        self.register('pushup', PushUpPoseCorrection)
+
+        if load_entry_points:
+            self.load_entry_points()
+
+    def register(self, exercise_type: str, factory: Callable[[RuleSetRepository], PoseCorrection]) -> None:
+        """
+        Registers the pose correction of an exercise, replacing the previous one if any.
+
+        :param exercise_type: Type of the exercise.
+        :param factory: PoseCorrection subclass, or any callable creating the pose correction from a rule set
+        repository.
+        """
+        with self._lock:
+            self._factories[exercise_type] = factory
+            self._pose_corrections.pop(exercise_type, None)
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """
+        Registers the exercises of the entry points of a group. The entry points which fail to load are skipped, and
+        their errors are kept.
+
+        :param group: Group of the entry points.
+        """
+        for entry_point in entry_points(group=group):
+            try:
+                factory = entry_point.load()
+            except Exception as e:
+                self._load_errors[entry_point.name] = str(e)
+                continue
+
+            self.register(entry_point.name, factory)
+            self._load_errors.pop(entry_point.name, None)
+
+    def get_exercise_types(self) -> List[str]:
+        with self._lock:
+            return list(self._factories)
+
+    def get_load_errors(self) -> Dict[str, str]:
+        return dict(self._load_errors)
+
+    def get(self, exercise_type: str) -> Optional[PoseCorrection]:
+        """
+        Gets the pose correction of an exercise, creating it on first use.
+
+        :param exercise_type: Type of the exercise.
+
+        :return: The pose correction, or None if the exercise is not registered.
+        """
+        with self._lock:
+            pose_correction = self._pose_corrections.get(exercise_type)
+            if pose_correction is None:
+                factory = self._factories.get(exercise_type)
+                if factory is None:
+                    return None
+
+                pose_correction = factory(self._rule_set_repository)
+                self._pose_corrections[exercise_type] = pose_correction
+
+            return pose_correction
@@ -0,0 +1,89 @@
+import uuid
+
+from collections import deque
+from typing import Optional
+
+import cv2
+
+
+class RepetitionClipWriter:
+    # the next clip starts one frame before the end of the previous one, so only the last two frames are retained
+    RETAINED_FRAMES = 2
+
+    def __init__(self, video_path: str, output_directory: str = './media/processed_videos/') -> None:
+        """
+        Writes the repetition clips of a video while reading it only once, front to back, with the same
+        boundaries as AnglesAnalyzer.split_video_into_repetitions.
+
+        :param video_path: The path to the video file.
+        :param output_directory: Directory where the clips are saved.
+        """
+        self._cap = cv2.VideoCapture(video_path)
+        if not self._cap.isOpened():
+            raise FileNotFoundError("Could not open video file.")
+
+        self._output_directory = output_directory
+        self._frame_rate = self._cap.get(cv2.CAP_PROP_FPS)
+        self._frame_size = (int(self._cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                            int(self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        self._fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        self._next_frame_index = 0
+        self._retained_frames = deque(maxlen=self.RETAINED_FRAMES)
+        self._start_frame = 0
+
+    def get_frame_rate(self) -> float:
+        return self._frame_rate
+
+    def write_clip(self, end_frame: Optional[int]) -> str:
+        """
+        Writes the clip from the end of the previous clip up to the given frame.
+
+        :param end_frame: Last frame of the clip, or None to write up to the end of the video.
+
+        :return: Path of the written clip.
+        """
+        video_name = f'{self._output_directory}s{uuid.uuid4().hex}.mp4'
+        out = cv2.VideoWriter(video_name, self._fourcc, self._frame_rate, self._frame_size)
+
+        frame_index = self._start_frame
+        while end_frame is None or frame_index <= end_frame:
+            frame = self._read_frame(frame_index)
+            if frame is None:
+                break
+            out.write(frame)
+            frame_index += 1
+
+        out.release()
+
+        # next segment starts at the end of the previous
+        if end_frame is not None:
+            self._start_frame = max(0, end_frame - 1)
+
+        return video_name
+
+    def write_last_clip(self) -> str:
+        """
+        Writes the clip from the end of the previous clip up to the end of the video.
+
+        :return: Path of the written clip.
+        """
+        return self.write_clip(None)
+
+    def release(self) -> None:
+        self._cap.release()
+        self._retained_frames.clear()
+
+    def _read_frame(self, frame_index: int):
+        # read forward up to the requested frame, the frames shared with the previous clip are already retained
+        while self._next_frame_index <= frame_index:
+            ret, frame = self._cap.read()
+            if not ret:
+                return None
+            self._retained_frames.append((self._next_frame_index, frame))
+            self._next_frame_index += 1
+
+        for retained_index, retained_frame in self._retained_frames:
+            if retained_index == frame_index:
+                return retained_frame
+
+        return None
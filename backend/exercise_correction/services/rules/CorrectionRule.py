@@ -0,0 +1,215 @@
+import math
+
+import numpy as np
+
+from typing import Optional, Tuple, Union
+
+from ..exception.custom_exceptions import RuleSetError
+from ..pose_correction.CameraViewClassifier import CameraViewClassifier
+from ..rules.RepetitionMetrics import RepetitionMetrics
+
+
+class CorrectionRule:
+    REDUCTIONS = ('min', 'max', 'first', 'at_bottom', 'worst', 'value')
+    # bounds of a band, along with whether they are inclusive
+    BOUNDS = {'above': False, 'at_least': True, 'below': False, 'at_most': True}
+
+    def __init__(self, definition: dict) -> None:
+        """
+        Compiles the definition of a correction rule into a vectorized evaluator. A rule reduces a metric over the
+        selected frames of a repetition and gives the advice of the first band containing the reduced value, or its
+        otherwise advice. A reduced value outside every band, such as NaN, gets the otherwise advice.
+
+        Reductions:
+            - 'min' and 'max' of the selected frames, starting from the optional initial value.
+            - 'first' selected frame.
+            - 'at_bottom', the frame with the minimum segmentation angle above the error threshold.
+            - 'worst', the most severe advice of the selected frames, or the least severe advice when no frame is
+              selected.
+            - 'value' of a repetition metric.
+
+        The frames where the metric changes faster than the optional max_speed, per second, are ignored as detection
+        errors. A rule with views only applies to the videos filmed from one of them, or whose view is unknown.
+
+        :param definition: Dictionary with the category, metric, frames, reduction, initial, max_speed, bands,
+        otherwise, stop_at_correction_level, group and views of the rule.
+        """
+        if not isinstance(definition, dict):
+            raise RuleSetError(f"Expected a dictionary as rule definition, got {definition}")
+
+        self._category = self._require(definition, 'category', str)
+        self._metric = self._require(definition, 'metric', str)
+        self._frames = self._optional(definition, 'frames', str, 'under_tension')
+        self._reduction = self._optional(definition, 'reduction', str,
+                                         'value' if self._metric in RepetitionMetrics.REPETITION_METRICS else 'min')
+        self._initial = self._optional(definition, 'initial', (int, float))
+        self._max_speed = self._optional(definition, 'max_speed', (int, float))
+        self._stop_at_correction_level = self._optional(definition, 'stop_at_correction_level', int)
+        self._group = self._optional(definition, 'group', str)
+        self._views = definition.get('views')
+
+        if not RepetitionMetrics.is_metric(self._metric):
+            raise RuleSetError(f"Unknown metric of rule {self._category}: {self._metric}")
+        if self._frames not in RepetitionMetrics.FRAME_SELECTIONS:
+            raise RuleSetError(f"Unknown frames of rule {self._category}: {self._frames}")
+        if self._reduction not in self.REDUCTIONS:
+            raise RuleSetError(f"Unknown reduction of rule {self._category}: {self._reduction}")
+        if (self._reduction == 'value') != (self._metric in RepetitionMetrics.REPETITION_METRICS):
+            raise RuleSetError(f"Rule {self._category} must reduce frame metrics and only take repetition metric "
+                               f"values")
+        if self._max_speed is not None and not RepetitionMetrics.is_frame_metric(self._metric):
+            raise RuleSetError(f"Rule {self._category} can only limit the speed of a frame metric")
+        if self._views is not None and (not isinstance(self._views, list) or not self._views
+                                        or not all(isinstance(view, str) and view in CameraViewClassifier.VIEWS
+                                                   for view in self._views)):
+            raise RuleSetError(f"Expected a list of camera views among {CameraViewClassifier.VIEWS} in rule "
+                               f"{self._category}")
+
+        bands = definition.get('bands', [])
+        if not isinstance(bands, list) or not all(isinstance(band, dict) for band in bands):
+            raise RuleSetError(f"Expected a list of bands in rule {self._category}")
+        otherwise = self._require(definition, 'otherwise', dict)
+
+        # one column per band, the last outcome being the otherwise advice
+        lower_bounds, lower_inclusive, upper_bounds, upper_inclusive = [], [], [], []
+        self._advice, levels = [], []
+        for band in bands + [otherwise]:
+            self._advice.append(self._require(band, 'advice', str))
+            levels.append(self._require(band, 'correction_level', int))
+            if band is otherwise:
+                continue
+
+            unknown_keys = set(band) - set(self.BOUNDS) - {'advice', 'correction_level'}
+            if unknown_keys:
+                raise RuleSetError(f"Unknown keys in a band of rule {self._category}: {sorted(unknown_keys)}")
+            if 'above' in band and 'at_least' in band or 'below' in band and 'at_most' in band:
+                raise RuleSetError(f"A band of rule {self._category} has two bounds on the same side")
+            for bound in set(band) & set(self.BOUNDS):
+                self._require(band, bound, (int, float))
+
+            lower_key = 'above' if 'above' in band else 'at_least'
+            upper_key = 'below' if 'below' in band else 'at_most'
+            lower_bounds.append(float(band.get(lower_key, -math.inf)))
+            lower_inclusive.append(self.BOUNDS[lower_key])
+            upper_bounds.append(float(band.get(upper_key, math.inf)))
+            upper_inclusive.append(self.BOUNDS[upper_key])
+
+        self._lower_bounds = np.array(lower_bounds, dtype=np.float64)
+        self._lower_inclusive = np.array(lower_inclusive, dtype=bool)
+        self._upper_bounds = np.array(upper_bounds, dtype=np.float64)
+        self._upper_inclusive = np.array(upper_inclusive, dtype=bool)
+        self._levels = np.array(levels, dtype=np.int64)
+
+    def get_category(self) -> str:
+        return self._category
+
+    def get_metric(self) -> str:
+        return self._metric
+
+    def get_group(self) -> Optional[str]:
+        return self._group
+
+    def get_stop_at_correction_level(self) -> Optional[int]:
+        return self._stop_at_correction_level
+
+    def is_applicable(self, camera_view: Optional[str]) -> bool:
+        """
+        Checks whether the rule applies to a video filmed from a camera view.
+
+        :param camera_view: The camera view of the video, None if unknown.
+
+        :return: True if the rule has no views, the camera view is unknown or among them, False otherwise.
+        """
+        return self._views is None or camera_view is None or camera_view in self._views
+
+    def classify(self, values) -> np.ndarray:
+        """
+        Finds the outcome of every value, the index of the first band containing it or the number of bands for the
+        otherwise advice.
+
+        :param values: Array of values.
+
+        :return: Array of the indices of the outcomes.
+        """
+        values = np.asarray(values, dtype=np.float64)[..., np.newaxis]
+
+        above_lower = (values > self._lower_bounds) | (self._lower_inclusive & (values == self._lower_bounds))
+        below_upper = (values < self._upper_bounds) | (self._upper_inclusive & (values == self._upper_bounds))
+        in_bands = above_lower & below_upper
+
+        return np.where(in_bands.any(axis=-1), in_bands.argmax(axis=-1), len(self._lower_bounds))
+
+    def classify_value(self, value: Optional[float]) -> Tuple[str, int]:
+        """
+        Gives the advice of a single reduced value.
+
+        :param value: The reduced value, None being outside every band.
+
+        :return: A tuple containing the correction advice and the correction level.
+        """
+        outcome = int(self.classify(math.nan if value is None else value))
+        return self._advice[outcome], int(self._levels[outcome])
+
+    def evaluate(self, metrics: RepetitionMetrics) -> Tuple[str, int, int]:
+        """
+        Evaluates the rule on a repetition.
+
+        :param metrics: Metrics of the repetition.
+
+        :return: A tuple containing the correction advice, the correction level and the index of the first frame with
+        this advice, 0 for the rules not reducing to the worst frame.
+        """
+        if self._reduction == 'value':
+            return self.classify_value(metrics.get_metric(self._metric)) + (0,)
+
+        if self._reduction == 'at_bottom':
+            return self.classify_value(metrics.get_metric(self._metric)[metrics.get_bottom_index()]) + (0,)
+
+        values = metrics.get_metric(self._metric)
+        selected = metrics.get_frame_selection(self._frames)
+        if self._max_speed is not None:
+            # the values which jumped since the previous frame are ignored as detection errors
+            selected = selected & (metrics.get_metric(f'{self._metric}_speed') < self._max_speed)
+
+        if self._reduction == 'worst':
+            return self._evaluate_worst(values, selected)
+
+        if self._reduction == 'first':
+            return self.classify_value(values[np.argmax(selected)] if selected.any() else None) + (0,)
+
+        selected_values = values[selected & ~np.isnan(values)]
+        if self._initial is None and len(selected_values) == 0:
+            raise ValueError(f"No frame selected by rule {self._category}")
+
+        reduction = np.min if self._reduction == 'min' else np.max
+        initial = {} if self._initial is None else {'initial': self._initial}
+        return self.classify_value(float(reduction(selected_values, **initial))) + (0,)
+
+    def _evaluate_worst(self, values: np.ndarray, selected: np.ndarray) -> Tuple[str, int, int]:
+        indices = np.flatnonzero(selected)
+        if len(indices) == 0:
+            outcome = int(np.argmin(self._levels))
+            return self._advice[outcome], int(self._levels[outcome]), 0
+
+        levels = self._levels[self.classify(values[indices])]
+        worst = int(np.argmax(levels))
+        outcome = int(self.classify(values[indices[worst]]))
+
+        return self._advice[outcome], int(self._levels[outcome]), int(indices[worst])
+
+    @staticmethod
+    def _require(definition: dict, key: str, value_type: Union[type, Tuple[type, ...]]):
+        value = definition.get(key)
+        if not isinstance(value, value_type) or isinstance(value, bool):
+            type_names = ' or '.join(value_type.__name__ for value_type in
+                                     (value_type if isinstance(value_type, tuple) else (value_type,)))
+            raise RuleSetError(f"Expected {key} of type {type_names} in rule definition {definition}")
+
+        return value
+
+    @staticmethod
+    def _optional(definition: dict, key: str, value_type: Union[type, Tuple[type, ...]], default=None):
+        if definition.get(key) is None:
+            return default
+
+        return CorrectionRule._require(definition, key, value_type)
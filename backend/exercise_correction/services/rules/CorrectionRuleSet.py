@@ -0,0 +1,104 @@
+from typing import Dict, List, Optional
+
+from ..exception.custom_exceptions import RuleSetError
+from ..rules.CorrectionRule import CorrectionRule
+from ..rules.RepetitionMetrics import RepetitionMetrics
+
+
+class CorrectionRuleSet:
+    def __init__(self, definition: dict) -> None:
+        """
+        Compiles a versioned set of correction rules, listed per exercise type in the order their advice is given.
+
+        The advice of consecutive rules of the same group is given with the failed rules first, in the order of the
+        frames where they first failed, followed by the passed ones. The evaluation stops after a rule whose correction
+        level reaches its stop_at_correction_level. The rules which do not apply to the camera view of a video are
+        neither evaluated nor reported.
+
+        :param definition: Dictionary with the version of the rule set and, for each exercise type, the list of the
+        definitions of its rules.
+        """
+        if not isinstance(definition, dict):
+            raise RuleSetError("Expected a dictionary as rule set")
+
+        version = definition.get('version')
+        if not isinstance(version, str) or not version:
+            raise RuleSetError("Expected a version in the rule set")
+
+        exercises = definition.get('exercises')
+        if not isinstance(exercises, dict) or not all(isinstance(rules, list) for rules in exercises.values()):
+            raise RuleSetError("Expected a list of rules for each exercise type in the rule set")
+
+        self._version = version
+        self._rules = {exercise_type: [CorrectionRule(rule) for rule in rules]
+                       for exercise_type, rules in exercises.items()}
+
+    def get_version(self) -> str:
+        return self._version
+
+    def get_exercise_types(self) -> List[str]:
+        return list(self._rules)
+
+    def get_rule(self, exercise_type: str, category: str) -> CorrectionRule:
+        for rule in self._get_rules(exercise_type):
+            if rule.get_category() == category:
+                return rule
+
+        raise KeyError(f"No {category} rule for {exercise_type}")
+
+    def evaluate(self, exercise_type: str, metrics: RepetitionMetrics,
+                 camera_view: Optional[str] = None) -> Dict[str, tuple]:
+        """
+        Evaluates the rules of an exercise on a repetition.
+
+        :param exercise_type: Type of the exercise.
+        :param metrics: Metrics of the repetition.
+        :param camera_view: Camera view of the video, every rule being evaluated if None.
+
+        :return: A dictionary with categories as keys and tuples of correction advice and correction level as values.
+        """
+        correction_advice = dict()
+        group_results = []
+
+        for rule in self._get_rules(exercise_type):
+            # the metrics of the inapplicable rules are not even computed
+            if not rule.is_applicable(camera_view):
+                continue
+
+            if group_results and rule.get_group() != group_results[0][0]:
+                self._add_group_advice(correction_advice, group_results)
+
+            advice, correction_level, first_frame_index = rule.evaluate(metrics)
+            if rule.get_group() is None:
+                correction_advice[rule.get_category()] = advice, correction_level
+            else:
+                group_results.append((rule.get_group(), rule.get_category(), advice, correction_level,
+                                      first_frame_index))
+
+            stop_at_correction_level = rule.get_stop_at_correction_level()
+            if stop_at_correction_level is not None and correction_level >= stop_at_correction_level:
+                break
+
+        self._add_group_advice(correction_advice, group_results)
+
+        return correction_advice
+
+    def _get_rules(self, exercise_type: str) -> List[CorrectionRule]:
+        rules = self._rules.get(exercise_type)
+        if rules is None:
+            raise KeyError(f"No rules for {exercise_type} in rule set {self._version}")
+
+        return rules
+
+    @staticmethod
+    def _add_group_advice(correction_advice: dict, group_results: list) -> None:
+        # the failed rules first, by their first failed frame and then in order, followed by the passed ones in order
+        def sort_key(order: int) -> tuple:
+            _, _, _, correction_level, first_frame_index = group_results[order]
+            return (0, first_frame_index, order) if correction_level > 1 else (1, 0, order)
+
+        for order in sorted(range(len(group_results)), key=sort_key):
+            _, category, advice, correction_level, _ = group_results[order]
+            correction_advice[category] = advice, correction_level
+
+        group_results.clear()
@@ -0,0 +1,262 @@
+import numpy as np
+
+from typing import Dict, List, Optional, Tuple
+
+from ..constants import BLAZE_POSE_LANDMARKS
+from ..landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from ..pose_correction.BodySideSelector import BodySideSelector
+from ..pose_correction.KinematicFeatures import KinematicFeatures
+from ..pose_correction.PoseAnalyzer import PoseAnalyzer
+
+
+class RepetitionMetrics:
+    # metrics computed from the landmarks of every frame
+    LANDMARK_METRICS = ('head_pitch', 'trunk_vertical_angle', 'tibia_vertical_angle', 'hip_slope',
+                        'knee_toe_distance_difference', 'heel_height', 'trunk_tibia_angle_difference')
+    # metrics with a single value for the whole repetition
+    REPETITION_METRICS = ('eccentric_concentric_ratio',)
+    # suffixes of the metrics derived from the finite differences of a frame metric
+    DERIVED_METRICS = ('_velocity', '_speed', '_acceleration')
+    FRAME_SELECTIONS = ('all', 'under_tension', 'above_error_threshold')
+
+    def __init__(self, frames: np.ndarray, landmarks: np.ndarray, angles: Dict[str, np.ndarray],
+                 pose_analyzer: PoseAnalyzer, segmentation_angle_name: str, repetition_start_threshold: float,
+                 error_threshold: float, fps: Optional[float] = None,
+                 side: str = BodySideSelector.REFERENCE_SIDE) -> None:
+        """
+        Metrics of a repetition over all its frames at once, which the correction rules reduce to their advice.
+
+        The metrics form a graph of features computed on demand: a metric is only computed when a rule first asks for
+        it, along with the features it depends on, and is kept for the other rules. The angles which were not already
+        computed are computed from the landmarks, so a repetition whose evaluation stops early never computes the
+        features of the remaining rules.
+
+        Every frame metric has derived metrics from its finite differences, normalized by the frame rate: its
+        velocity with the _velocity suffix, the absolute value of its velocity with the _speed suffix and its
+        acceleration with the _acceleration suffix.
+
+        The metrics and the segmentation angle name are named after the reference side of the body, and computed from
+        the landmarks of the analyzed side, while the angles already computed are named after the analyzed side.
+
+        The arrays may be views of the arrays of the whole video, which are only read.
+
+        :param frames: Array of the frame numbers.
+        :param landmarks: Array of the landmarks of every frame, of shape (frames, landmarks, 3).
+        :param angles: Dictionary with angle names as keys and arrays of the angles of every frame as values, for the
+        angles already computed.
+        :param pose_analyzer: Pose analyzer computing the metrics of the landmarks.
+        :param segmentation_angle_name: Name of the angle delimiting the repetitions.
+        :param repetition_start_threshold: Segmentation angle below which the frames are under tension.
+        :param error_threshold: Segmentation angle below which the frames are considered as detection errors.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+        :param side: Side of the body analyzed.
+        """
+        self._frames = frames
+        self._landmarks = landmarks
+        self._angles = angles
+        self._pose_analyzer = pose_analyzer
+        self._segmentation_angle_name = segmentation_angle_name
+        self._repetition_start_threshold = repetition_start_threshold
+        self._error_threshold = error_threshold
+        self._landmarks_dictionary = BLAZE_POSE_LANDMARKS
+        self._kinematics = KinematicFeatures(self._frames, fps)
+        self._side = side
+        # features computed so far, by name
+        self._features = dict()
+
+    @classmethod
+    def from_dictionaries(cls, landmarks: Dict[int, list], angles: Dict[str, Dict[int, float]],
+                          pose_analyzer: PoseAnalyzer, segmentation_angle_name: str, repetition_start_threshold: float,
+                          error_threshold: float, fps: Optional[float] = None,
+                          side: str = BodySideSelector.REFERENCE_SIDE) -> 'RepetitionMetrics':
+        """
+        Creates the metrics of a repetition from dictionaries, keeping the frames in the order of the landmarks, or of
+        the segmentation angles without landmarks.
+
+        :param landmarks: Dictionary with frame numbers as keys and landmarks as values.
+        :param angles: Dictionary with angle names as keys and dictionaries of frame numbers and angles as values,
+        for the angles already computed.
+        :param pose_analyzer: Pose analyzer computing the metrics of the landmarks.
+        :param segmentation_angle_name: Name of the angle delimiting the repetitions.
+        :param repetition_start_threshold: Segmentation angle below which the frames are under tension.
+        :param error_threshold: Segmentation angle below which the frames are considered as detection errors.
+        :param fps: Frame rate of the video, the reference frame rate when unknown.
+        :param side: Side of the body analyzed.
+
+        :return: The metrics of the repetition.
+        """
+        segmentation_angles = angles.get(BodySideSelector.resolve_name(segmentation_angle_name, side), dict())
+        frames = list(landmarks.keys()) if landmarks else list(segmentation_angles.keys())
+        landmarks_array = LandmarksExtractor.convert_to_array(landmarks.values(), len(BLAZE_POSE_LANDMARKS)) \
+            if landmarks else np.full((len(frames), len(BLAZE_POSE_LANDMARKS), 3), np.nan)
+        angle_arrays = {angle_name: np.array([angle_values[frame] for frame in frames], dtype=np.float64)
+                        for angle_name, angle_values in angles.items()}
+
+        return cls(np.array(frames, dtype=np.int64), landmarks_array, angle_arrays, pose_analyzer,
+                   segmentation_angle_name, repetition_start_threshold, error_threshold, fps, side)
+
+    @staticmethod
+    def is_metric(name: str) -> bool:
+        """
+        Checks if a metric can be computed, either from the landmarks, for the whole repetition, as an angle or as
+        derived from a frame metric.
+
+        :param name: Name of the metric.
+
+        :return: True if the metric is known, False otherwise.
+        """
+        return RepetitionMetrics.is_frame_metric(name) or name in RepetitionMetrics.REPETITION_METRICS
+
+    @staticmethod
+    def is_frame_metric(name: str) -> bool:
+        """
+        Checks if a metric has a value in every frame.
+
+        :param name: Name of the metric.
+
+        :return: True if the metric is a known frame metric, False otherwise.
+        """
+        base_name, derivation = RepetitionMetrics._split_derived_metric(name)
+        if derivation is not None:
+            return RepetitionMetrics.is_frame_metric(base_name)
+
+        return name in RepetitionMetrics.LANDMARK_METRICS or hasattr(PoseAnalyzer, f'compute_{name}_angle')
+
+    def get_frames(self) -> np.ndarray:
+        return self._frames
+
+    def get_side(self) -> str:
+        return self._side
+
+    def get_kinematics(self) -> KinematicFeatures:
+        return self._kinematics
+
+    def get_computed_features(self) -> List[str]:
+        return list(self._features)
+
+    def get_metric(self, name: str) -> np.ndarray or float:
+        """
+        Gets a metric of the repetition, computing it on the first access.
+
+        :param name: Name of the metric.
+
+        :return: Array of the metric in every frame, NaN where undefined, or the value of a repetition metric.
+        """
+        base_name, derivation = self._split_derived_metric(name)
+        if derivation is not None:
+            return self._get_feature(name, lambda: self._compute_derived_metric(base_name, derivation))
+
+        if name in self.REPETITION_METRICS or name in self.LANDMARK_METRICS:
+            return self._get_feature(name, getattr(self, f'_compute_{name}'))
+
+        return self._get_feature(name, lambda: self._compute_angle(name))
+
+    def get_frame_selection(self, selection: str) -> np.ndarray:
+        """
+        Selects the frames a rule applies to.
+
+        :param selection: 'all', 'under_tension' for the frames whose segmentation angle is below the repetition start
+        threshold, or 'above_error_threshold' for the frames whose segmentation angle is above the error threshold.
+
+        :return: Boolean array of the selected frames.
+        """
+        return self._get_feature(f'frames:{selection}', lambda: self._compute_frame_selection(selection))
+
+    def get_bottom_index(self) -> int:
+        """
+        Gets the index of the bottom of the repetition, the first frame with the minimum segmentation angle above the
+        error threshold.
+
+        :return: The index of the frame.
+        """
+        return self._get_feature('bottom_index', self._compute_bottom_index)
+
+    @staticmethod
+    def _split_derived_metric(name: str) -> Tuple[str, Optional[str]]:
+        for suffix in RepetitionMetrics.DERIVED_METRICS:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                return name[:-len(suffix)], suffix[1:]
+
+        return name, None
+
+    def _get_feature(self, name: str, compute):
+        if name not in self._features:
+            self._features[name] = compute()
+
+        return self._features[name]
+
+    def _get_points(self, name: str) -> np.ndarray:
+        return self._landmarks[:, self._landmarks_dictionary[BodySideSelector.resolve_name(name, self._side)]]
+
+    def _compute_angle(self, name: str) -> np.ndarray:
+        name = BodySideSelector.resolve_name(name, self._side)
+        angles = self._angles.get(name)
+        if angles is not None:
+            return angles
+
+        # the angles which were not computed beforehand are computed from the landmarks of the repetition
+        compute_angle = getattr(self._pose_analyzer, f'compute_{name}_angle')
+        return np.array([compute_angle(landmarks) for landmarks in self._landmarks], dtype=np.float64)
+
+    def _compute_frame_selection(self, selection: str) -> np.ndarray:
+        if selection == 'all':
+            return np.ones(len(self._frames), dtype=bool)
+
+        segmentation_angles = self.get_metric(self._segmentation_angle_name)
+        if selection == 'under_tension':
+            return segmentation_angles < self._repetition_start_threshold
+
+        return segmentation_angles > self._error_threshold
+
+    def _compute_derived_metric(self, base_name: str, derivation: str) -> np.ndarray:
+        if derivation == 'speed':
+            return np.abs(self.get_metric(f'{base_name}_velocity'))
+        if derivation == 'acceleration':
+            return self._kinematics.get_accelerations(self.get_metric(f'{base_name}_velocity'))
+
+        return self._kinematics.get_velocities(self.get_metric(base_name))
+
+    def _compute_bottom_index(self) -> int:
+        segmentation_angles = self.get_metric(self._segmentation_angle_name)
+
+        candidates = np.flatnonzero(segmentation_angles > self._error_threshold)
+        if len(candidates) == 0:
+            raise ValueError(f"No angle above {self._error_threshold} degrees")
+
+        return int(candidates[np.argmin(segmentation_angles[candidates])])
+
+    def _compute_head_pitch(self) -> np.ndarray:
+        return self._pose_analyzer.compute_head_pitch_angles(self._landmarks)
+
+    def _compute_trunk_vertical_angle(self) -> np.ndarray:
+        return PoseAnalyzer.calculate_vertical_orientation_angles(self._get_points('right shoulder'),
+                                                                  self._get_points('right hip'))
+
+    def _compute_tibia_vertical_angle(self) -> np.ndarray:
+        return PoseAnalyzer.calculate_vertical_orientation_angles(self._get_points('right knee'),
+                                                                  self._get_points('right ankle'))
+
+    def _compute_hip_slope(self) -> np.ndarray:
+        left_hip = self._get_points('left hip')
+        right_hip = self._get_points('right hip')
+
+        # the slope is infinite or undefined for vertically aligned hips
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.abs((right_hip[:, 1] - left_hip[:, 1]) / (right_hip[:, 0] - left_hip[:, 0]))
+
+    def _compute_knee_toe_distance_difference(self) -> np.ndarray:
+        distance_between_knees = np.abs(self._get_points('right knee')[:, 0] - self._get_points('left knee')[:, 0])
+        distance_between_toes = np.abs(self._get_points('right foot index')[:, 0]
+                                       - self._get_points('left foot index')[:, 0])
+
+        return np.abs(distance_between_knees - distance_between_toes)
+
+    def _compute_heel_height(self) -> np.ndarray:
+        return self._get_points('right heel')[:, 1]
+
+    def _compute_trunk_tibia_angle_difference(self) -> np.ndarray:
+        return np.abs(self.get_metric('trunk_vertical_angle') - self.get_metric('tibia_vertical_angle'))
+
+    def _compute_eccentric_concentric_ratio(self) -> float:
+        return self._pose_analyzer.compute_eccentric_concentric_ratio_from_angles(
+            self._frames, self.get_metric(self._segmentation_angle_name), self._repetition_start_threshold)
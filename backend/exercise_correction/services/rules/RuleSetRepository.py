@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+
+from typing import Optional
+
+from ..exception.custom_exceptions import RuleSetError
+from ..rules.CorrectionRuleSet import CorrectionRuleSet
+
+
+class RuleSetRepository:
+    DEFAULT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'correction_rules.json')
+
+    _default_repository = None
+    _default_repository_lock = threading.Lock()
+
+    def __init__(self, file_path: str = DEFAULT_FILE) -> None:
+        """
+        Loads the correction rule set from a JSON file and reloads it whenever the file changes, so that the rules
+        can be tuned without restarting the worker processes. The rule sets are compiled once per version and kept,
+        so a change of the rules must come with a new version, and going back to a previous version does not compile
+        it again.
+
+        While the file fails to load, or changes the rules of a version already loaded, the previous rule set stays in
+        use and the reason is given by get_load_error.
+
+        :param file_path: Path to the JSON file of the rule set.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._rule_sets = {}
+        self._current_rule_set = None
+        self._file_signature = ()
+        self._load_error = None
+
+    @classmethod
+    def get_default(cls) -> 'RuleSetRepository':
+        """
+        Gets the repository of the rule set shipped with the application, shared by the whole process.
+
+        :return: The repository.
+        """
+        with cls._default_repository_lock:
+            if cls._default_repository is None:
+                cls._default_repository = cls()
+
+            return cls._default_repository
+
+    def get_rule_set(self) -> CorrectionRuleSet:
+        """
+        Gets the current rule set, reloading the file if it changed since the last call.
+
+        :return: The compiled rule set.
+        """
+        # the file is only read again when its modification time or size changed
+        try:
+            stat = os.stat(self._file_path)
+            file_signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            file_signature = None
+
+        with self._lock:
+            if file_signature != self._file_signature or self._current_rule_set is None:
+                self._file_signature = file_signature
+                self._reload()
+
+            if self._current_rule_set is None:
+                raise RuleSetError(f"Could not load the rule set {self._file_path}: {self._load_error}")
+
+            return self._current_rule_set
+
+    def get_load_error(self) -> Optional[str]:
+        return self._load_error
+
+    def __getstate__(self) -> dict:
+        # the repository is sent along with the corrections to the processes of the profiled jobs
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _reload(self) -> None:
+        try:
+            with open(self._file_path, 'r') as file:
+                definition = json.load(file)
+
+            version = definition.get('version') if isinstance(definition, dict) else None
+            compiled_definition, rule_set = self._rule_sets.get(version, (None, None))
+            if rule_set is None:
+                rule_set = CorrectionRuleSet(definition)
+                self._rule_sets[version] = definition, rule_set
+            elif definition != compiled_definition:
+                # the advice is recorded along with the version of its rules, which would not tell them apart
+                raise RuleSetError(f"The rules of version {version} changed without a new version")
+        except Exception as e:
+            # whatever is wrong with the file, the requests keep being served with the previous rule set
+            self._load_error = str(e)
+            return
+
+        self._current_rule_set = rule_set
+        self._load_error = None
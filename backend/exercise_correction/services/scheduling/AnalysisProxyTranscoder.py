@@ -0,0 +1,112 @@
+import cv2
+
+from typing import Tuple
+
+from ..pose_correction.FrameResampler import FrameResampler
+
+
+class AnalysisProxyTranscoder:
+    # largest resolution and frame rate of the proxies, the resolution either way round
+    MAX_RESOLUTION = (1280, 720)
+    MAX_FPS = FrameResampler.ANALYSIS_FPS
+
+    def __init__(self, max_resolution: Tuple[int, int] = MAX_RESOLUTION, max_fps: float = MAX_FPS) -> None:
+        """
+        Transcodes the submitted videos into analysis proxies of bounded resolution and frame rate, decoded by every
+        processing pass instead of the originals. The proxies are encoded with short groups of pictures, so that
+        seeking in them is cheap, the original videos being kept for archival only.
+
+        :param max_resolution: Largest width and height of the proxies, either way round.
+        :param max_fps: Largest frame rate of the proxies.
+        """
+        self._max_resolution = (max(max_resolution), min(max_resolution))
+        self._max_fps = max_fps
+
+    def needs_proxy(self, video_properties: dict) -> bool:
+        """
+        Tells whether a video exceeds the bounds of the proxies.
+
+        :param video_properties: Probed container metadata of the video, with its frame rate, width and height.
+
+        :return: True if the video is transcoded into a proxy, False if it is analyzed as it is, as when its size is
+        unknown.
+        """
+        if video_properties['width'] <= 0 or video_properties['height'] <= 0:
+            return False
+
+        proxy_size = self.get_proxy_size(video_properties['width'], video_properties['height'])
+        return proxy_size != (video_properties['width'], video_properties['height']) or \
+            FrameResampler(video_properties['fps'], self._max_fps).is_resampled()
+
+    def get_proxy_size(self, width: int, height: int) -> Tuple[int, int]:
+        """
+        Gets the size of the proxy of a video, scaled down to fit the largest resolution, keeping its aspect ratio.
+
+        :param width: Width of the video.
+        :param height: Height of the video.
+
+        :return: The width and height of the proxy, even as required by the encoders.
+        """
+        if width <= 0 or height <= 0:
+            return width, height
+
+        scale = min(self._max_resolution[0] / max(width, height), self._max_resolution[1] / min(width, height))
+        if scale >= 1:
+            return width, height
+
+        return max(2, int(width * scale) // 2 * 2), max(2, int(height * scale) // 2 * 2)
+
+    def transcode(self, video_path: str, proxy_path: str, video_properties: dict) -> dict:
+        """
+        Transcodes a video into its analysis proxy, keeping the frame of the video presented first in every interval
+        of the proxy frame rate.
+
+        :param video_path: Path to the video file.
+        :param proxy_path: Path of the proxy file.
+        :param video_properties: Probed container metadata of the video, with its frame rate, width and height.
+
+        :return: A dictionary with the frame rate, the frame count, the width, the height and the duration in seconds
+        of the proxy.
+
+        :raises IOError: If the proxy cannot be written.
+        """
+        frame_resampler = FrameResampler(video_properties['fps'], self._max_fps)
+        proxy_size = self.get_proxy_size(video_properties['width'], video_properties['height'])
+        fps = frame_resampler.get_fps()
+
+        # the writer starts a group of pictures every twelve frames
+        out = cv2.VideoWriter(proxy_path, cv2.VideoWriter_fourcc(*'mp4v'), fps, proxy_size)
+        if not out.isOpened():
+            raise IOError(f"Could not open video writer for {proxy_path}")
+
+        cap = cv2.VideoCapture(video_path)
+        frame_index = 0
+        frame_count = 0
+        timestamps = []
+
+        try:
+            while cap.isOpened():
+                success, image = cap.read()
+                if not success:
+                    break
+                timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC) / 1000)
+
+                if frame_resampler.get_analysis_frame(frame_index, timestamps) is not None:
+                    if image.shape[1::-1] != proxy_size:
+                        # the area interpolation averages the pixels, which avoids the aliasing of the downscaling
+                        image = cv2.resize(image, proxy_size, interpolation=cv2.INTER_AREA)
+                    out.write(image)
+                    frame_count += 1
+
+                frame_index += 1
+        finally:
+            cap.release()
+            out.release()
+
+        return {
+            'fps': fps,
+            'frame_count': frame_count,
+            'width': proxy_size[0],
+            'height': proxy_size[1],
+            'duration': frame_count / fps,
+        }
@@ -0,0 +1,66 @@
+import os
+import uuid
+
+from contextlib import contextmanager
+
+
+class ProcessingQueue:
+    def __init__(self, directory: str) -> None:
+        self._directory = directory
+
+    def get_depth(self) -> int:
+        """
+        Counts the jobs currently being processed by any worker process sharing the queue directory.
+
+        :return: The number of jobs in progress.
+        """
+        if not os.path.isdir(self._directory):
+            return 0
+
+        depth = 0
+        for file_name in os.listdir(self._directory):
+            # ignore the files which are not job markers
+            pid = file_name.split('_')[0]
+            if not file_name.endswith('.job') or not pid.isdigit():
+                continue
+
+            # ignore the markers left behind by worker processes that died in the middle of a job
+            pid = int(pid)
+            if self._is_process_alive(pid):
+                depth += 1
+            else:
+                self._remove_marker(os.path.join(self._directory, file_name))
+
+        return depth
+
+    @contextmanager
+    def track_job(self):
+        """
+        Marks a job as in progress for the duration of the context.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        marker_path = os.path.join(self._directory, f'{os.getpid()}_{uuid.uuid4().hex}.job')
+        open(marker_path, 'w').close()
+
+        try:
+            yield
+        finally:
+            self._remove_marker(marker_path)
+
+    @staticmethod
+    def _is_process_alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+        return True
+
+    @staticmethod
+    def _remove_marker(marker_path: str) -> None:
+        try:
+            os.remove(marker_path)
+        except FileNotFoundError:
+            pass
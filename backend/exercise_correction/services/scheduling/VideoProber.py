@@ -0,0 +1,126 @@
+import cv2
+import numpy as np
+
+from typing import Callable, List, Tuple
+
+from ..exception.custom_exceptions import VideoProbeError
+
+
+class VideoProber:
+    # number of frames sampled across the video, on which a pose has to be detected
+    SAMPLED_FRAMES = 5
+
+    def __init__(self, max_duration_seconds: float, max_resolution: Tuple[int, int],
+                 sampled_frames: int = SAMPLED_FRAMES, pose_detector: Callable[[np.ndarray], bool] = None) -> None:
+        """
+        Probes a submitted video before its processing, from its container metadata and from a few frames sampled
+        across it, so that the videos which cannot be processed are rejected up front.
+
+        :param max_duration_seconds: Duration from which the videos are rejected.
+        :param max_resolution: Largest width and height of the videos, either way round.
+        :param sampled_frames: Number of frames sampled across the video.
+        :param pose_detector: Tells whether a pose is detected on a BGR image, the pose detection being skipped if
+        None.
+        """
+        self._max_duration_seconds = max_duration_seconds
+        self._max_resolution = (max(max_resolution), min(max_resolution))
+        self._sampled_frames = sampled_frames
+        self._pose_detector = pose_detector
+
+    def probe(self, video_path: str) -> dict:
+        """
+        Probes a video, raising a VideoProbeError if it cannot be processed.
+
+        :param video_path: Path to the video file.
+
+        :return: A dictionary with the frame rate, the frame count, the width, the height and the duration in seconds
+        of the video, the frame rate and size missing from the container metadata being 0. Without a frame count in
+        the container metadata, the frames are counted by reading the video, up to the maximum duration.
+        """
+        cap = cv2.VideoCapture(video_path)
+        try:
+            if not cap.isOpened():
+                raise VideoProbeError("The video format is not supported")
+
+            video_properties = {
+                'fps': cap.get(cv2.CAP_PROP_FPS),
+                'frame_count': max(0, int(cap.get(cv2.CAP_PROP_FRAME_COUNT))),
+                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            }
+            seekable = video_properties['frame_count'] > 0
+            if seekable:
+                video_properties['duration'] = video_properties['frame_count'] / video_properties['fps'] \
+                    if video_properties['fps'] > 0 else 0
+            else:
+                video_properties['frame_count'], video_properties['duration'] = self._measure_length(
+                    cap, video_properties['fps'])
+                # the videos without a frame count may not be seekable, so their frames are sampled by reading them
+                # again from the start
+                cap.release()
+                cap = cv2.VideoCapture(video_path)
+
+            # a video of unknown duration could be arbitrarily long
+            if video_properties['frame_count'] > 1 and video_properties['duration'] <= 0:
+                raise VideoProbeError("The duration of the video is unknown")
+
+            if video_properties['duration'] > self._max_duration_seconds:
+                raise VideoProbeError(f"The video lasts {video_properties['duration']:.0f} seconds, longer than the "
+                                      f"maximum of {self._max_duration_seconds:g} seconds")
+
+            resolution = (max(video_properties['width'], video_properties['height']),
+                          min(video_properties['width'], video_properties['height']))
+            if resolution[0] > self._max_resolution[0] or resolution[1] > self._max_resolution[1]:
+                raise VideoProbeError(f"The video resolution of {video_properties['width']}x"
+                                      f"{video_properties['height']} is higher than the maximum of "
+                                      f"{self._max_resolution[0]}x{self._max_resolution[1]}")
+
+            images = self._sample_frames(cap, video_properties['frame_count'], seekable)
+        finally:
+            cap.release()
+
+        if not images:
+            raise VideoProbeError("The video has no decodable frames")
+
+        if self._pose_detector is not None and not any(self._pose_detector(image) for image in images):
+            raise VideoProbeError("No person was detected in the video")
+
+        return video_properties
+
+    def _measure_length(self, cap: cv2.VideoCapture, fps: float) -> Tuple[int, float]:
+        frame_count = 0
+        duration = 0.0
+
+        # the frames are only grabbed, without being converted, and the reading stops once too long
+        while duration <= self._max_duration_seconds and cap.grab():
+            frame_count += 1
+            # the presentation time of the end of the frame
+            duration = frame_count / fps if fps > 0 else cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+
+        return frame_count, duration
+
+    def _sample_frames(self, cap: cv2.VideoCapture, frame_count: int, seekable: bool = True) -> List[np.ndarray]:
+        frame_indices = np.unique(np.linspace(0, max(0, frame_count - 1), self._sampled_frames).round().astype(int))
+
+        images = []
+        if not seekable:
+            # the frames up to the last sampled one are read in order, only the sampled ones being decoded
+            for frame_index in range(frame_indices[-1] + 1):
+                if not cap.grab():
+                    break
+                if frame_index in frame_indices:
+                    success, image = cap.retrieve()
+                    if success:
+                        images.append(image)
+
+            return images
+
+        for frame_index in frame_indices:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, int(frame_index))
+
+            # the frames which cannot be decoded are skipped, the video being rejected if none can
+            success, image = cap.read()
+            if success:
+                images.append(image)
+
+        return images
@@ -0,0 +1,89 @@
+import cv2
+import numpy as np
+
+from typing import Tuple
+
+from ..constants import BLAZE_POSE_LANDMARKS
+from ..synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class StickFigureVideoRenderer:
+    # pairs of landmarks joined by a limb
+    CONNECTIONS = [
+        ('right shoulder', 'left shoulder'), ('right hip', 'left hip'),
+        ('right shoulder', 'right hip'), ('left shoulder', 'left hip'),
+        ('right shoulder', 'right elbow'), ('right elbow', 'right wrist'), ('right wrist', 'right index'),
+        ('left shoulder', 'left elbow'), ('left elbow', 'left wrist'), ('left wrist', 'left index'),
+        ('right hip', 'right knee'), ('right knee', 'right ankle'), ('right ankle', 'right heel'),
+        ('right heel', 'right foot index'), ('right ankle', 'right foot index'),
+        ('left hip', 'left knee'), ('left knee', 'left ankle'), ('left ankle', 'left heel'),
+        ('left heel', 'left foot index'), ('left ankle', 'left foot index'),
+    ]
+    BACKGROUND_COLOR = (235, 235, 235)
+    NEAR_SIDE_COLOR = (40, 40, 200)
+    FAR_SIDE_COLOR = (160, 120, 80)
+
+    def __init__(self, width: int, height: int, fps: float = 30) -> None:
+        """
+        Renders synthetic landmark sequences as stick-figure videos, to exercise the whole video pipeline without
+        recorded footage.
+
+        :param width: Width of the rendered videos, in pixels.
+        :param height: Height of the rendered videos, in pixels.
+        :param fps: Frame rate of the rendered videos.
+        """
+        self._width = width
+        self._height = height
+        self._fps = fps
+        self._connections = [(BLAZE_POSE_LANDMARKS[start], BLAZE_POSE_LANDMARKS[end], start.startswith('left'))
+                             for start, end in self.CONNECTIONS]
+
+    def get_frame_size(self) -> Tuple[int, int]:
+        return self._width, self._height
+
+    def render(self, generator: SyntheticPoseGenerator, video_path: str, block_size: int = 256) -> int:
+        """
+        Renders the landmarks synthesized by a generator as an mp4 video. Normalized coordinates are scaled by the
+        width and height of the video, like the pose estimators report them, so the rendered figure is stretched
+        on non-square videos.
+
+        :param generator: Generator of the landmarks rendered.
+        :param video_path: Path of the rendered video.
+        :param block_size: Number of frames synthesized at once.
+
+        :return: The number of frames rendered.
+        """
+        out = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'mp4v'), self._fps, (self._width, self._height))
+        if not out.isOpened():
+            raise IOError(f"Could not open video writer for {video_path}")
+
+        frame_count = 0
+        thickness = max(2, self._height // 120)
+
+        try:
+            for _, landmarks in generator.iter_landmark_arrays(block_size):
+                points = np.rint(landmarks[:, :, :2] * (self._width, self._height)).astype(np.int32)
+
+                for frame_points in points:
+                    out.write(self._draw_frame(frame_points, thickness))
+                    frame_count += 1
+        finally:
+            out.release()
+
+        return frame_count
+
+    def _draw_frame(self, points: np.ndarray, thickness: int) -> np.ndarray:
+        image = np.full((self._height, self._width, 3), self.BACKGROUND_COLOR, dtype=np.uint8)
+
+        # draw the far side first so that the near side is drawn over it
+        for far_side in (True, False):
+            color = self.FAR_SIDE_COLOR if far_side else self.NEAR_SIDE_COLOR
+            for start, end, is_far_side in self._connections:
+                if is_far_side == far_side:
+                    cv2.line(image, tuple(points[start]), tuple(points[end]), color, thickness, cv2.LINE_AA)
+
+        head_radius = max(3, self._height // 25)
+        cv2.circle(image, tuple(points[BLAZE_POSE_LANDMARKS['nose']]), head_radius, self.NEAR_SIDE_COLOR, -1,
+                   cv2.LINE_AA)
+
+        return image
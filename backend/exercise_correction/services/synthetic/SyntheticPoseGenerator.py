@@ -0,0 +1,275 @@
+import numpy as np
+
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..constants import BLAZE_POSE_LANDMARKS
+
+
+class SyntheticPoseGenerator:
+    # joint angle at the top of the movement and at the bottom of a repetition of each exercise, in degrees
+    EXERCISE_ANGLES = {
+        'squat': (175, 85),
+        'bicep_curl': (170, 45),
+        'pushup': (170, 80),
+    }
+    # segment lengths, in normalized image coordinates
+    SHIN_LENGTH = 0.22
+    THIGH_LENGTH = 0.22
+    TRUNK_LENGTH = 0.3
+    UPPER_ARM_LENGTH = 0.15
+    FOREARM_LENGTH = 0.14
+    HAND_LENGTH = 0.05
+    HEAD_HEIGHT = 0.1
+    # offset of the landmarks of the far side of the body, which is seen from the side
+    FAR_SIDE_OFFSET = (-0.01, 0.0, 0.1)
+    # visibility of the landmarks which are dropped out is below this value
+    DROPOUT_VISIBILITY = 0.5
+
+    def __init__(self, exercise_type: str, repetitions: int = 10, eccentric_seconds: float = 2.0,
+                 concentric_seconds: float = 1.0, pause_seconds: float = 0.5, depth: Optional[float] = None,
+                 noise: float = 0.0, dropout: float = 0.0, fps: float = 30, seed: Optional[int] = None) -> None:
+        """
+        Synthesizes BlazePose-shaped landmark sequences of an exercise seen from its right side, from parametric
+        joint trajectories. Each repetition is a pause at the top of the movement followed by the eccentric phase,
+        where the main joint angle decreases, and the concentric phase, where it increases back.
+
+        :param exercise_type: One of 'squat', 'bicep_curl' and 'pushup'.
+        :param repetitions: Number of repetitions.
+        :param eccentric_seconds: Duration of the eccentric phase of a repetition.
+        :param concentric_seconds: Duration of the concentric phase of a repetition.
+        :param pause_seconds: Duration of the pause at the top of the movement, before each repetition and at the end.
+        :param depth: Main joint angle at the bottom of a repetition, in degrees, defaults to a correct execution.
+        :param noise: Standard deviation of the gaussian noise added to the landmark coordinates.
+        :param dropout: Probability of a landmark having a low visibility on a frame.
+        :param fps: Frame rate of the synthesized sequences.
+        :param seed: Seed of the random noise and dropout, for reproducible sequences.
+        """
+        if exercise_type not in self.EXERCISE_ANGLES:
+            raise ValueError(f"Unknown exercise type: {exercise_type}")
+
+        self._exercise_type = exercise_type
+        self._repetitions = repetitions
+        self._top_angle, default_depth = self.EXERCISE_ANGLES[exercise_type]
+        self._depth = default_depth if depth is None else depth
+        self._noise = noise
+        self._dropout = dropout
+        self._seed = seed
+
+        self._pause_frames = max(1, round(pause_seconds * fps))
+        self._eccentric_frames = max(1, round(eccentric_seconds * fps))
+        self._concentric_frames = max(1, round(concentric_seconds * fps))
+        self._repetition_frames = self._pause_frames + self._eccentric_frames + self._concentric_frames
+
+    @classmethod
+    def for_frame_count(cls, exercise_type: str, frame_count: int, **kwargs) -> 'SyntheticPoseGenerator':
+        """
+        Creates a generator with enough repetitions to synthesize at least the given number of frames.
+
+        :param exercise_type: One of 'squat', 'bicep_curl' and 'pushup'.
+        :param frame_count: Minimum number of frames.
+        :param kwargs: Other parameters of the generator.
+
+        :return: The generator.
+        """
+        generator = cls(exercise_type, repetitions=1, **kwargs)
+        generator._repetitions = max(1, -(-(frame_count - generator._pause_frames) // generator._repetition_frames))
+
+        return generator
+
+    def get_total_frames(self) -> int:
+        # every repetition is followed by a final pause so that the last one returns above the start threshold
+        return self._repetitions * self._repetition_frames + self._pause_frames
+
+    def get_repetition_count(self) -> int:
+        return self._repetitions
+
+    def compute_joint_angles(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Computes the main joint angle of the exercise on the given frames.
+
+        :param frames: Array of frame numbers.
+
+        :return: Array of joint angles, in degrees.
+        """
+        phase = frames % self._repetition_frames
+        repetition = frames // self._repetition_frames
+
+        eccentric_progress = np.clip((phase - self._pause_frames) / self._eccentric_frames, 0, 1)
+        concentric_progress = np.clip((phase - self._pause_frames - self._eccentric_frames) /
+                                      self._concentric_frames, 0, 1)
+
+        # smooth acceleration and deceleration in each phase
+        flexion = (1 - np.cos(np.pi * eccentric_progress)) / 2 - (1 - np.cos(np.pi * concentric_progress)) / 2
+        flexion[repetition >= self._repetitions] = 0
+
+        return self._top_angle - (self._top_angle - self._depth) * flexion
+
+    def generate_array(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Synthesizes the landmarks of a range of frames, without noise or dropout.
+
+        :param start: First frame.
+        :param stop: Frame after the last one, defaults to the total number of frames.
+
+        :return: Array of shape (frames, 33, 4) with (x, y, z, visibility) values.
+        """
+        stop = self.get_total_frames() if stop is None else stop
+        landmarks = self._compute_landmarks(np.arange(start, stop))
+        landmarks[:, :, 3] = 1.0
+
+        return landmarks
+
+    def iter_landmark_arrays(self, block_size: int = 4096) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Lazily synthesizes all the frames in blocks, so that arbitrarily long sequences fit in memory. The sequence
+        is the same for any block size.
+
+        :param block_size: Maximum number of frames in a block.
+
+        :return: An iterator of the first frame of each block and an array of shape (frames, 33, 4) with its
+        (x, y, z, visibility) values.
+        """
+        noise_generator, visibility_generator = [np.random.default_rng(seed_sequence) for seed_sequence in
+                                                 np.random.SeedSequence(self._seed).spawn(2)]
+        total_frames = self.get_total_frames()
+
+        for start in range(0, total_frames, block_size):
+            landmarks = self._compute_landmarks(np.arange(start, min(start + block_size, total_frames)))
+
+            if self._noise:
+                landmarks[:, :, :3] += noise_generator.normal(0, self._noise, landmarks[:, :, :3].shape)
+
+            # visible landmarks have a high visibility, dropped out ones a visibility below the dropout threshold
+            visibility = visibility_generator.random(landmarks.shape[:2] + (2,))
+            dropped_out = visibility[:, :, 0] < self._dropout
+            landmarks[:, :, 3] = np.where(dropped_out, visibility[:, :, 1] * self.DROPOUT_VISIBILITY,
+                                          0.9 + 0.1 * visibility[:, :, 1])
+
+            yield start, landmarks
+
+    def iter_landmark_blocks(self, block_size: int = 4096) -> Iterator[Dict[int, List[tuple]]]:
+        """
+        Lazily synthesizes all the frames in blocks shaped like the output of LandmarksExtractor.iter_landmark_blocks.
+
+        :param block_size: Maximum number of frames in a block.
+
+        :return: An iterator of dictionaries with frame numbers as keys and landmarks as values.
+        """
+        for start, landmarks in self.iter_landmark_arrays(block_size):
+            yield {start + i: [tuple(values) for values in frame_landmarks]
+                   for i, frame_landmarks in enumerate(landmarks.tolist())}
+
+    def generate_landmarks_dictionary(self) -> Dict[int, List[tuple]]:
+        """
+        Synthesizes all the frames at once, shaped like LandmarksExtractor.get_landmarks_dictionary.
+
+        :return: Dictionary with frame numbers as keys and landmarks as values.
+        """
+        landmarks_dictionary = {}
+        for block in self.iter_landmark_blocks():
+            landmarks_dictionary.update(block)
+
+        return landmarks_dictionary
+
+    def _compute_landmarks(self, frames: np.ndarray) -> np.ndarray:
+        angles = self.compute_joint_angles(frames)
+
+        if self._exercise_type == 'squat':
+            points = self._compute_squat_points(angles)
+        elif self._exercise_type == 'bicep_curl':
+            points = self._compute_bicep_curl_points(angles)
+        else:
+            points = self._compute_pushup_points(angles)
+
+        return self._assemble_landmarks(points, len(frames))
+
+    @staticmethod
+    def _segment(origin: np.ndarray, length: float, direction: np.ndarray) -> np.ndarray:
+        # point at the given length from the origin, with the direction in degrees counterclockwise from the x-axis
+        radians = np.radians(direction)
+        return origin + length * np.stack([np.cos(radians), np.sin(radians)], axis=-1)
+
+    @staticmethod
+    def _fixed_point(x: float, y: float, count: int) -> np.ndarray:
+        return np.tile(np.array([x, y]), (count, 1))
+
+    def _compute_squat_points(self, knee_angles: np.ndarray) -> Dict[str, np.ndarray]:
+        # the knees move forward as they flex and the trunk stays parallel to the tibia
+        lean = (180 - knee_angles) * 0.35
+        ankle = self._fixed_point(0.5, 0.1, len(knee_angles))
+        knee = self._segment(ankle, self.SHIN_LENGTH, 90 - lean)
+        hip = self._segment(knee, self.THIGH_LENGTH, 270 - lean - knee_angles)
+        shoulder = self._segment(hip, self.TRUNK_LENGTH, 90 - lean)
+        # arms held forward for balance
+        elbow = self._segment(shoulder, self.UPPER_ARM_LENGTH, np.full_like(lean, -10))
+        wrist = self._segment(elbow, self.FOREARM_LENGTH, np.full_like(lean, -10))
+
+        return {'ankle': ankle, 'knee': knee, 'hip': hip, 'shoulder': shoulder, 'elbow': elbow, 'wrist': wrist,
+                'hand_direction': np.full_like(lean, -10), 'head_direction': 90 - lean / 2}
+
+    def _compute_bicep_curl_points(self, elbow_angles: np.ndarray) -> Dict[str, np.ndarray]:
+        # upright stance with the upper arm along the trunk and the forearm rotating forward
+        upright = np.full_like(elbow_angles, 90)
+        ankle = self._fixed_point(0.5, 0.05, len(elbow_angles))
+        knee = self._segment(ankle, self.SHIN_LENGTH, upright)
+        hip = self._segment(knee, self.THIGH_LENGTH, upright)
+        shoulder = self._segment(hip, self.TRUNK_LENGTH, upright)
+        elbow = self._segment(shoulder, self.UPPER_ARM_LENGTH, upright + 180)
+        wrist = self._segment(elbow, self.FOREARM_LENGTH, 90 - elbow_angles)
+
+        return {'ankle': ankle, 'knee': knee, 'hip': hip, 'shoulder': shoulder, 'elbow': elbow, 'wrist': wrist,
+                'hand_direction': 80 - elbow_angles, 'head_direction': upright}
+
+    def _compute_pushup_points(self, elbow_angles: np.ndarray) -> Dict[str, np.ndarray]:
+        # hands and feet on the ground, the forearm leans back as the elbow flexes and the body stays straight
+        lean = (180 - elbow_angles) * 0.3
+        wrist = self._fixed_point(0.75, 0.05, len(elbow_angles))
+        elbow = self._segment(wrist, self.FOREARM_LENGTH, 90 + lean)
+        shoulder = self._segment(elbow, self.UPPER_ARM_LENGTH, 270 + lean + elbow_angles)
+        ankle = self._fixed_point(0.1, 0.05, len(elbow_angles))
+        hip = shoulder + 0.45 * (ankle - shoulder)
+        knee = shoulder + 0.72 * (ankle - shoulder)
+
+        return {'ankle': ankle, 'knee': knee, 'hip': hip, 'shoulder': shoulder, 'elbow': elbow, 'wrist': wrist,
+                'hand_direction': np.zeros_like(lean), 'head_direction': np.degrees(
+                    np.arctan2(shoulder[:, 1] - ankle[:, 1], shoulder[:, 0] - ankle[:, 0]))}
+
+    def _assemble_landmarks(self, points: Dict[str, np.ndarray], count: int) -> np.ndarray:
+        landmarks = np.zeros((count, len(BLAZE_POSE_LANDMARKS), 4))
+        right_side = {}
+
+        for name in ['shoulder', 'elbow', 'wrist', 'hip', 'knee', 'ankle']:
+            right_side[name] = points[name]
+
+        # hand, pointing along the hand direction
+        hand_direction = points['hand_direction']
+        right_side['index'] = self._segment(points['wrist'], self.HAND_LENGTH, hand_direction)
+        right_side['pinky'] = self._segment(points['wrist'], self.HAND_LENGTH * 0.8, hand_direction - 15)
+        right_side['thumb'] = self._segment(points['wrist'], self.HAND_LENGTH * 0.6, hand_direction + 25)
+
+        # foot, flat on the ground
+        right_side['heel'] = points['ankle'] + np.array([-0.04, -0.03])
+        right_side['foot index'] = points['ankle'] + np.array([0.1, -0.03])
+
+        # face, looking forward along the head direction
+        head_direction = points['head_direction']
+        ear = self._segment(points['shoulder'], self.HEAD_HEIGHT, head_direction)
+        right_side['ear'] = ear
+        right_side['eye'] = self._segment(ear, 0.035, head_direction - 80)
+        right_side['eye inner'] = self._segment(ear, 0.04, head_direction - 80)
+        right_side['eye outer'] = self._segment(ear, 0.03, head_direction - 80)
+        right_side['mouth'] = self._segment(ear, 0.04, head_direction - 120)
+        nose = self._segment(ear, 0.05, head_direction - 90)
+
+        far_side_offset = np.array(self.FAR_SIDE_OFFSET)
+        for name, point in right_side.items():
+            landmarks[:, BLAZE_POSE_LANDMARKS[f'right {name}'], :2] = point
+            landmarks[:, BLAZE_POSE_LANDMARKS[f'left {name}'], :2] = point + far_side_offset[:2]
+            landmarks[:, BLAZE_POSE_LANDMARKS[f'left {name}'], 2] = far_side_offset[2]
+        landmarks[:, BLAZE_POSE_LANDMARKS['nose'], :2] = nose
+        landmarks[:, BLAZE_POSE_LANDMARKS['nose'], 2] = -0.05
+
+        # the points are computed with the y-axis pointing up, while images have it pointing down
+        landmarks[:, :, 1] = 1 - landmarks[:, :, 1]
+
+        return landmarks
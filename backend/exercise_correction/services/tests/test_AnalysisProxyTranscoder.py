@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from exercise_correction.services.scheduling.AnalysisProxyTranscoder import AnalysisProxyTranscoder
+from exercise_correction.services.scheduling.VideoProber import VideoProber
+
+
+class TestAnalysisProxyTranscoder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.transcoder = AnalysisProxyTranscoder((320, 240), 30)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_video(self, fps, size, frame_count):
+        video_path = os.path.join(self.directory, 'video.mp4')
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+        for frame in range(frame_count):
+            # a square moving by 8 pixels a frame tells which frames are kept
+            image = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+            cv2.rectangle(image, (frame * 8, 200), (frame * 8 + 40, 280), (255, 255, 255), -1)
+            writer.write(image)
+        writer.release()
+
+        return video_path
+
+    def test_get_proxy_size(self):
+        self.assertEqual(self.transcoder.get_proxy_size(640, 480), (320, 240))
+        self.assertEqual(self.transcoder.get_proxy_size(160, 120), (160, 120))
+        # the largest resolution applies either way round
+        self.assertEqual(self.transcoder.get_proxy_size(480, 640), (240, 320))
+        # the aspect ratio is kept, with even dimensions
+        self.assertEqual(self.transcoder.get_proxy_size(1000, 250), (320, 80))
+        self.assertEqual(self.transcoder.get_proxy_size(650, 400), (320, 196))
+
+    def test_needs_proxy(self):
+        self.assertFalse(self.transcoder.needs_proxy({'fps': 30, 'width': 320, 'height': 240}))
+        self.assertTrue(self.transcoder.needs_proxy({'fps': 30, 'width': 640, 'height': 480}))
+        self.assertTrue(self.transcoder.needs_proxy({'fps': 60, 'width': 320, 'height': 240}))
+        # the videos of unknown size are analyzed as they are
+        self.assertFalse(self.transcoder.needs_proxy({'fps': 60, 'width': 0, 'height': 0}))
+
+    def test_transcode(self):
+        video_path = self.write_video(60, (640, 480), 60)
+        video_properties = VideoProber(60, (1920, 1080)).probe(video_path)
+
+        proxy_path = os.path.join(self.directory, 'video.proxy.mp4')
+        proxy_properties = self.transcoder.transcode(video_path, proxy_path, video_properties)
+
+        self.assertEqual(proxy_properties, {'fps': 30, 'frame_count': 30, 'width': 320, 'height': 240,
+                                            'duration': 1})
+        self.assertEqual(VideoProber(60, (1920, 1080)).probe(proxy_path), proxy_properties)
+
+        # every other frame of the video is kept, at half its size
+        cap = cv2.VideoCapture(proxy_path)
+        square_positions = []
+        while True:
+            success, image = cap.read()
+            if not success:
+                break
+            square_positions.append(int(np.argmax(image[120, :, 0] > 128)))
+        cap.release()
+        self.assertEqual(square_positions, list(range(0, 240, 8)))
+
+    def test_unwritable_proxy(self):
+        video_path = self.write_video(60, (640, 480), 10)
+        proxy_path = os.path.join(self.directory, 'missing', 'video.proxy.mp4')
+
+        with self.assertRaises(IOError):
+            self.transcoder.transcode(video_path, proxy_path, {'fps': 60, 'width': 640, 'height': 480})
+
+
+if __name__ == "__main__":
+    unittest.main()
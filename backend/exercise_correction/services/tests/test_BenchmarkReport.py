@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from exercise_correction.services.benchmarks.BenchmarkReport import BenchmarkReport
+
+
+class TestBenchmarkReport(unittest.TestCase):
+    def setUp(self):
+        self.baseline = [
+            {'name': 'a', 'frames': 1000, 'rounds': 3, 'min': 1.0, 'max': 1.0, 'mean': 1.0, 'median': 1.0,
+             'stddev': 0.0, 'frames_per_second': 1000.0},
+            {'name': 'b', 'frames': 1000, 'rounds': 3, 'min': 1.0, 'max': 1.0, 'mean': 1.0, 'median': 1.0,
+             'stddev': 0.0, 'frames_per_second': 1000.0},
+            {'name': 'c', 'frames': 1000, 'rounds': 3, 'min': 1.0, 'max': 1.0, 'mean': 1.0, 'median': 1.0,
+             'stddev': 0.0, 'frames_per_second': 1000.0},
+        ]
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'baseline.json')
+            BenchmarkReport.save(self.baseline, file_path)
+            self.assertEqual(BenchmarkReport.load(file_path), self.baseline)
+
+    def test_compare(self):
+        current = [dict(result) for result in self.baseline]
+        current[0]['median'] = 0.5
+        current[1]['median'] = 1.05
+        current[2]['median'] = 2.0
+        current.append(dict(current[2], name='d'))
+
+        comparisons = BenchmarkReport.compare(self.baseline, current)
+
+        self.assertEqual([comparison['status'] for comparison in comparisons], ['faster', 'unchanged', 'slower'])
+        self.assertAlmostEqual(comparisons[2]['ratio'], 2.0)
+        self.assertIn('slower', BenchmarkReport.format_comparison(comparisons))
+
+    def test_compare_different_sizes(self):
+        current = [dict(self.baseline[0], frames=100000)]
+        self.assertEqual(BenchmarkReport.compare(self.baseline, current), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from exercise_correction.services.benchmarks.AnalysisBenchmarks import AnalysisBenchmarks
+from exercise_correction.services.benchmarks.BenchmarkRunner import BenchmarkRunner
+
+
+class TestBenchmarkRunner(unittest.TestCase):
+    def test_run(self):
+        runner = BenchmarkRunner(min_rounds=3, min_time=0)
+        calls = []
+
+        result = runner.run('append', lambda: calls.append(1), 10)
+
+        self.assertEqual(result['rounds'], 3)
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(result['frames'], 10)
+        self.assertLessEqual(result['min'], result['median'])
+        self.assertLessEqual(result['median'], result['max'])
+        self.assertEqual(runner.get_results(), [result])
+
+    def test_max_rounds(self):
+        runner = BenchmarkRunner(min_rounds=1, max_rounds=5, min_time=60)
+        self.assertEqual(runner.run('noop', lambda: None, 1)['rounds'], 5)
+
+    def test_max_time(self):
+        runner = BenchmarkRunner(min_rounds=100, max_time=0)
+        self.assertEqual(runner.run('noop', lambda: None, 1)['rounds'], 1)
+
+    def test_analysis_benchmarks(self):
+        benchmarks = AnalysisBenchmarks()
+        self.assertIn('compute_right_hip_knee_ankle_angle', benchmarks.get_frame_method_names())
+        self.assertIn('right_hip_knee_ankle', benchmarks.get_angle_names())
+
+        results = benchmarks.run(BenchmarkRunner(min_rounds=1, min_time=0), sizes=[200])
+        names = [result['name'] for result in results]
+        self.assertIn('AnglesAnalyzer.compute_angles', names)
+        self.assertIn('AnglesAnalyzer.get_repetition_split_frames', names)
+        self.assertTrue(all(result['frames'] == 200 for result in results))
+
+    def test_analysis_benchmarks_filter(self):
+        results = AnalysisBenchmarks().run(BenchmarkRunner(min_rounds=1, min_time=0), sizes=[50], name_filter='split')
+        self.assertEqual(len(results), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
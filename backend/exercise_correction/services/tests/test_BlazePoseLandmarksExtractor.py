@@ -1,89 +1,231 @@
-import unittest
-import numpy as np
-from landmarks_extractor.BlazePoseLandmarksExtractor import BlazePoseLandmarksExtractor
-
-
-class TestBlazePoseLandmarksExtractor(unittest.TestCase):
-    def setUp(self):
-        self.extractor = BlazePoseLandmarksExtractor()
-
-    def test_filter_low_confidence_keypoints(self):
-        data = {
-            0: [(1, 2, 3, 0.4), (4, 5, 6, 0.6)],
-            1: [(7, 8, 9, 0.3), (10, 11, 12, 0.7)]
-        }
-        expected_output = {
-            0: [None, np.array([4, 5, 6])],
-            1: [None, np.array([10, 11, 12])]
-        }
-
-        filtered_data = self.extractor.filter_low_confidence_keypoints(data, 0.5)
-
-        self.assertEqual(len(filtered_data), len(expected_output))
-
-        for frame in expected_output:
-            for expected, actual in zip(expected_output[frame], filtered_data[frame]):
-                if expected is None:
-                    self.assertIsNone(actual)
-                else:
-                    np.testing.assert_array_equal(expected, actual)
-
-    def test_interpolate_keypoints(self):
-        data = {
-            0: [np.array([1, 2, 3]), None],
-            1: [np.array([4, 5, 6]), np.array([7, 8, 9])],
-            2: [None, np.array([10, 11, 12])]
-        }
-        expected_output = {
-            0: [np.array([1, 2, 3]), np.array([4, 5, 6])],
-            1: [np.array([4, 5, 6]), np.array([7, 8, 9])],
-            2: [np.array([7, 8, 9]), np.array([10, 11, 12])]
-        }
-
-        interpolated_data = self.extractor.interpolate_keypoints(data)
-
-        self.assertEqual(len(interpolated_data), len(expected_output))
-
-        for frame in expected_output:
-            for expected, actual in zip(expected_output[frame], interpolated_data[frame]):
-                if expected is None:
-                    self.assertIsNone(actual)
-                else:
-                    np.testing.assert_array_equal(expected, actual)
-
-    def test_convert_arrays_to_lists(self):
-        data = {
-            0: [np.array([1, 2, 3]), None],
-            1: [np.array([4, 5, 6]), np.array([7, 8, 9])]
-        }
-        expected_output = {
-            0: [[1, 2, 3], None],
-            1: [[4, 5, 6], [7, 8, 9]]
-        }
-
-        list_converted_data = self.extractor.convert_arrays_to_lists(data)
-
-        self.assertEqual(list_converted_data, expected_output)
-
-    def test_process_keypoints(self):
-        data = {
-            0: [(1, 2, 3, 0.4), (4, 5, 6, 0.6)],
-            1: [(7, 8, 9, 0.3), (10, 11, 12, 0.7)],
-            2: [(13, 14, 15, 0.9), (25, 14, 1, 0.2)]
-        }
-        expected_output = {
-            0: [[13, 14, 15], [4, 5, 6]],
-            1: [[13, 14, 15], [10, 11, 12]],
-            2: [[13, 14, 15], [16, 17, 18]]
-        }
-
-        processed_data = self.extractor.process_keypoints(data, 0.5)
-
-        self.assertEqual(len(processed_data), len(expected_output))
-
-        for frame in expected_output:
-            for expected, actual in zip(expected_output[frame], processed_data[frame]):
-                if expected is None:
-                    self.assertIsNone(actual)
-                else:
-                    self.assertEqual(expected, actual)
+import os
+import shutil
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from types import SimpleNamespace
+
+from exercise_correction.services.constants import BLAZE_POSE_LANDMARKS
+from exercise_correction.services.landmarks_extractor.BlazePoseLandmarksExtractor import BlazePoseLandmarksExtractor
+from exercise_correction.services.landmarks_extractor.MotionGate import MotionGate
+from exercise_correction.services.landmarks_extractor.OpticalFlowLandmarksPropagator import \
+    OpticalFlowLandmarksPropagator
+from exercise_correction.services.synthetic.StickFigureVideoRenderer import StickFigureVideoRenderer
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class StubPoseGraph:
+    def __init__(self, estimate_landmarks):
+        # stands in for the pose estimation graph, the landmarks of each estimation being given by its number
+        self.estimations = 0
+        self._estimate_landmarks = estimate_landmarks
+
+    def process(self, image):
+        landmarks = self._estimate_landmarks(self.estimations)
+        self.estimations += 1
+
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=[
+            SimpleNamespace(x=x, y=y, z=z, visibility=visibility) for x, y, z, visibility in landmarks]))
+
+
+class TestBlazePoseLandmarksExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = BlazePoseLandmarksExtractor()
+
+    def test_filter_low_confidence_keypoints(self):
+        data = {
+            0: [(1, 2, 3, 0.4), (4, 5, 6, 0.6)],
+            1: [(7, 8, 9, 0.3), (10, 11, 12, 0.7)]
+        }
+        expected_output = {
+            0: [None, np.array([4, 5, 6])],
+            1: [None, np.array([10, 11, 12])]
+        }
+
+        filtered_data = self.extractor.filter_low_confidence_keypoints(data, 0.5)
+
+        self.assertEqual(len(filtered_data), len(expected_output))
+
+        for frame in expected_output:
+            for expected, actual in zip(expected_output[frame], filtered_data[frame]):
+                if expected is None:
+                    self.assertIsNone(actual)
+                else:
+                    np.testing.assert_array_equal(expected, actual)
+
+    def test_interpolate_keypoints(self):
+        data = {
+            0: [np.array([1, 2, 3]), None],
+            1: [np.array([4, 5, 6]), np.array([7, 8, 9])],
+            2: [None, np.array([10, 11, 12])]
+        }
+        expected_output = {
+            0: [np.array([1, 2, 3]), np.array([4, 5, 6])],
+            1: [np.array([4, 5, 6]), np.array([7, 8, 9])],
+            2: [np.array([7, 8, 9]), np.array([10, 11, 12])]
+        }
+
+        interpolated_data = self.extractor.interpolate_keypoints(data)
+
+        self.assertEqual(len(interpolated_data), len(expected_output))
+
+        for frame in expected_output:
+            for expected, actual in zip(expected_output[frame], interpolated_data[frame]):
+                if expected is None:
+                    self.assertIsNone(actual)
+                else:
+                    np.testing.assert_array_equal(expected, actual)
+
+    def test_convert_arrays_to_lists(self):
+        data = {
+            0: [np.array([1, 2, 3]), None],
+            1: [np.array([4, 5, 6]), np.array([7, 8, 9])]
+        }
+        expected_output = {
+            0: [[1, 2, 3], None],
+            1: [[4, 5, 6], [7, 8, 9]]
+        }
+
+        list_converted_data = self.extractor.convert_arrays_to_lists(data)
+
+        self.assertEqual(list_converted_data, expected_output)
+
+    def test_process_keypoints(self):
+        data = {
+            0: [(1, 2, 3, 0.4), (4, 5, 6, 0.6)],
+            1: [(7, 8, 9, 0.3), (10, 11, 12, 0.7)],
+            2: [(13, 14, 15, 0.9), (25, 14, 1, 0.2)]
+        }
+        expected_output = {
+            0: [[13, 14, 15], [4, 5, 6]],
+            1: [[13, 14, 15], [10, 11, 12]],
+            2: [[13, 14, 15], [16, 17, 18]]
+        }
+
+        processed_data = self.extractor.process_keypoints(data, 0.5)
+
+        self.assertEqual(len(processed_data), len(expected_output))
+
+        for frame in expected_output:
+            for expected, actual in zip(expected_output[frame], processed_data[frame]):
+                if expected is None:
+                    self.assertIsNone(actual)
+                else:
+                    self.assertEqual(expected, actual)
+
+
+class TestBlazePoseLandmarksExtractorKeyframes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.video_path = os.path.join(cls.directory, 'squat.mp4')
+        # a repetition between pauses of 15 frames, 90 frames in all
+        cls.generator = SyntheticPoseGenerator('squat', repetitions=1, eccentric_seconds=1, concentric_seconds=1,
+                                               pause_seconds=0.5)
+        cls.frame_count = StickFigureVideoRenderer(320, 240).render(cls.generator, cls.video_path)
+        cls.true_landmarks = np.concatenate([block for _, block in cls.generator.iter_landmark_arrays()])
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def extract_landmarks(self, motion_gate=None, keyframe_interval=1):
+        extractor = BlazePoseLandmarksExtractor(motion_gate=motion_gate, keyframe_interval=keyframe_interval)
+        # the landmarks of the n-th estimation all have the coordinates n, which the interpolated ones fall between
+        extractor._pose = StubPoseGraph(lambda estimation: [(estimation, estimation, 0.0, 1.0)] * 33)
+        landmarks = dict(extractor.iter_landmarks_from_video(self.video_path))
+
+        estimated_frames = [frame for frame, frame_landmarks in landmarks.items()
+                            if float(frame_landmarks[0][0]).is_integer()]
+        self.assertEqual(len(estimated_frames), extractor._pose.estimations)
+        self.assertEqual(extractor.get_total_frames(), self.frame_count - 1)
+        # the frames between the first and the last estimation are all given landmarks
+        self.assertEqual(list(landmarks), list(range(estimated_frames[0], estimated_frames[-1] + 1)))
+
+        return landmarks, estimated_frames
+
+    def test_keyframe_interval(self):
+        landmarks, estimated_frames = self.extract_landmarks(keyframe_interval=3)
+
+        # the frames after the last keyframe are dropped
+        self.assertEqual(estimated_frames, list(range(0, self.frame_count - 2, 3)))
+        self.assertEqual(landmarks[1][0], (1 / 3, 1 / 3, 0.0, 1.0))
+        self.assertEqual(landmarks[2][0], (2 / 3, 2 / 3, 0.0, 1.0))
+
+    def test_motion_gate(self):
+        landmarks, estimated_frames = self.extract_landmarks(MotionGate())
+
+        # the pauses at the start and the end of the video are trimmed
+        self.assertGreaterEqual(estimated_frames[0], 15)
+        self.assertLessEqual(estimated_frames[-1], self.frame_count - 15)
+        self.assertLess(len(estimated_frames), self.frame_count - 30)
+
+        # the frames skipped between two keyframes are interpolated between them
+        for previous_frame, frame in zip(estimated_frames, estimated_frames[1:]):
+            previous_value, value = landmarks[previous_frame][0][0], landmarks[frame][0][0]
+            for skipped_frame in range(previous_frame + 1, frame):
+                weight = (skipped_frame - previous_frame) / (frame - previous_frame)
+                self.assertAlmostEqual(landmarks[skipped_frame][0][0],
+                                       previous_value + weight * (value - previous_value))
+
+    def test_motion_gate_with_keyframe_interval(self):
+        _, gated_frames = self.extract_landmarks(MotionGate())
+        _, estimated_frames = self.extract_landmarks(MotionGate(), keyframe_interval=4)
+
+        self.assertTrue(all(frame - previous_frame >= 4
+                            for previous_frame, frame in zip(estimated_frames, estimated_frames[1:])))
+        self.assertLess(len(estimated_frames), len(gated_frames))
+
+    def propagate_landmarks(self, video_path, keyframe_interval=5):
+        extractor = BlazePoseLandmarksExtractor(keyframe_interval=keyframe_interval,
+                                                landmarks_propagator=OpticalFlowLandmarksPropagator())
+        # without motion gating, the n-th estimation is the one of the n-th keyframe
+        extractor._pose = StubPoseGraph(lambda estimation: self.true_landmarks[estimation * keyframe_interval].tolist())
+        landmarks = dict(extractor.iter_landmarks_from_video(video_path))
+
+        # the pose is estimated on every keyframe, the landmarks being propagated up to the last one
+        keyframes = list(range(0, self.frame_count, keyframe_interval))
+        self.assertEqual(extractor._pose.estimations, len(keyframes))
+        self.assertEqual(list(landmarks), list(range(keyframes[-1] + 1)))
+        for keyframe in keyframes:
+            np.testing.assert_allclose(landmarks[keyframe], self.true_landmarks[keyframe], atol=1e-6)
+
+        return landmarks
+
+    def test_optical_flow_propagation(self):
+        landmarks = self.propagate_landmarks(self.video_path)
+
+        # the joints of the legs, which move the most, follow the figure within a pixel or so
+        legs = [BLAZE_POSE_LANDMARKS[name] for name in ('right hip', 'left hip', 'right knee', 'left knee',
+                                                         'right ankle', 'left ankle')]
+        for frame, frame_landmarks in landmarks.items():
+            values = np.array(frame_landmarks)[legs]
+            self.assertTrue((values[:, 3] > 0).all())
+            error = np.abs(values[:, :2] - self.true_landmarks[frame, legs, :2]) * (320, 240)
+            self.assertLess(error.max(), 1.5, f"frame {frame}")
+
+    def test_optical_flow_lost_tracking(self):
+        # the figure disappears for the frames 41 and 42, between the keyframes 40 and 45
+        video_path = os.path.join(self.directory, 'squat_with_gap.mp4')
+        cap = cv2.VideoCapture(self.video_path)
+        writer = cv2.VideoWriter(video_path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (320, 240))
+        frame = 0
+        while True:
+            success, image = cap.read()
+            if not success:
+                break
+            writer.write(np.full_like(image, StickFigureVideoRenderer.BACKGROUND_COLOR) if frame in (41, 42) else image)
+            frame += 1
+        cap.release()
+        writer.release()
+
+        landmarks = self.propagate_landmarks(video_path)
+
+        # the keypoints lost by the tracking stay invisible until the estimation of the next keyframe re-anchors them
+        for frame in (42, 43, 44):
+            self.assertTrue(all(keypoint[3] == 0 for keypoint in landmarks[frame]))
+        for frame in range(45, 50):
+            self.assertTrue(all(keypoint[3] > 0 for keypoint in landmarks[frame]))
@@ -0,0 +1,37 @@
+import unittest
+
+from exercise_correction.services.constants import BLAZE_POSE_LANDMARKS
+from exercise_correction.services.pose_correction.BodySideSelector import BodySideSelector
+
+
+def create_landmarks(left_visibility, right_visibility):
+    return [(0.5, 0.5, 0.0, left_visibility if name.startswith('left') else right_visibility if
+             name.startswith('right') else 1.0) for name in BLAZE_POSE_LANDMARKS]
+
+
+class TestBodySideSelector(unittest.TestCase):
+    def setUp(self):
+        self.body_side_selector = BodySideSelector()
+
+    def test_select(self):
+        self.assertEqual(self.body_side_selector.select({0: create_landmarks(0.9, 0.2)}), 'left')
+        self.assertEqual(self.body_side_selector.select({0: create_landmarks(0.2, 0.9)}), 'right')
+        self.assertEqual(self.body_side_selector.select({0: create_landmarks(0.9, 0.9)}), 'right')
+        self.assertEqual(self.body_side_selector.select(dict()), 'right')
+
+    def test_analyzed_landmarks(self):
+        landmarks = BodySideSelector.get_analyzed_landmarks('left')
+        self.assertEqual(len(landmarks), 22)
+        self.assertIn(BLAZE_POSE_LANDMARKS['right eye'], landmarks)
+        self.assertIn(BLAZE_POSE_LANDMARKS['left hip'], landmarks)
+        self.assertNotIn(BLAZE_POSE_LANDMARKS['right hip'], landmarks)
+
+    def test_resolve_name(self):
+        self.assertEqual(BodySideSelector.resolve_name('right_hip_knee_ankle', 'left'), 'left_hip_knee_ankle')
+        self.assertEqual(BodySideSelector.resolve_name('left hip', 'left'), 'right hip')
+        self.assertEqual(BodySideSelector.resolve_name('right foot index', 'right'), 'right foot index')
+        self.assertEqual(BodySideSelector.resolve_name('head_pitch', 'left'), 'head_pitch')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from exercise_correction.services.constants import BLAZE_POSE_LANDMARKS
+from exercise_correction.services.pose_correction.CameraViewClassifier import CameraViewClassifier
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+def create_landmarks(width, depth):
+    landmarks = [(0.5, 0.5, 0.0)] * len(BLAZE_POSE_LANDMARKS)
+    for name in ('shoulder', 'hip'):
+        landmarks[BLAZE_POSE_LANDMARKS[f'left {name}']] = (0.5 + width / 2, 0.5, depth / 2)
+        landmarks[BLAZE_POSE_LANDMARKS[f'right {name}']] = (0.5 - width / 2, 0.5, -depth / 2)
+
+    return landmarks
+
+
+class TestCameraViewClassifier(unittest.TestCase):
+    def setUp(self):
+        self.camera_view_classifier = CameraViewClassifier()
+
+    def test_classify(self):
+        for width, depth, camera_view in ((0.2, 0.02, 'front'), (0.02, 0.2, 'side'), (0.1, 0.1, None)):
+            landmarks = {frame: create_landmarks(width, depth) for frame in range(30)}
+            self.assertEqual(self.camera_view_classifier.classify(landmarks, 30), camera_view)
+
+    def test_classify_synthetic_video(self):
+        landmarks = SyntheticPoseGenerator('squat', repetitions=1, noise=0.01, seed=0).generate_landmarks_dictionary()
+        self.assertEqual(self.camera_view_classifier.classify(landmarks), 'side')
+
+    def test_only_first_second_is_looked_at(self):
+        landmarks = {frame: create_landmarks(0.2, 0.02) for frame in range(10, 40)}
+        landmarks.update({frame: create_landmarks(0.02, 0.2) for frame in range(40, 200)})
+        self.assertEqual(self.camera_view_classifier.classify(landmarks, 30), 'front')
+        self.assertEqual(self.camera_view_classifier.classify(landmarks, 120), 'side')
+
+    def test_undetected_landmarks(self):
+        self.assertIsNone(self.camera_view_classifier.classify(dict()))
+        self.assertIsNone(self.camera_view_classifier.classify({0: [None] * len(BLAZE_POSE_LANDMARKS)}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.exception.custom_exceptions import RuleSetError
+from exercise_correction.services.pose_correction.PoseAnalyzer import PoseAnalyzer
+from exercise_correction.services.rules.CorrectionRule import CorrectionRule
+from exercise_correction.services.rules.RepetitionMetrics import RepetitionMetrics
+
+
+def create_metrics(angles, fps=None):
+    landmarks = {frame: [(0, 0, 0)] * 33 for frame in angles}
+    return RepetitionMetrics.from_dictionaries(landmarks, {'right_hip_knee_ankle': angles}, PoseAnalyzer(),
+                                               'right_hip_knee_ankle', 135, 15, fps)
+
+
+class TestCorrectionRule(unittest.TestCase):
+    def setUp(self):
+        self.rule = CorrectionRule({
+            'category': 'squat_depth',
+            'metric': 'right_hip_knee_ankle',
+            'frames': 'above_error_threshold',
+            'reduction': 'min',
+            'bands': [
+                {'above': 135, 'advice': 'bad', 'correction_level': 3},
+                {'above': 90, 'below': 135, 'advice': 'deeper', 'correction_level': 2},
+            ],
+            'otherwise': {'advice': 'good', 'correction_level': 1},
+        })
+
+    def test_classify(self):
+        outcomes = self.rule.classify([140, 135, 100, 90, 45, np.nan])
+        np.testing.assert_array_equal(outcomes, [0, 2, 1, 2, 2, 2])
+
+    def test_classify_value(self):
+        self.assertEqual(self.rule.classify_value(136), ('bad', 3))
+        self.assertEqual(self.rule.classify_value(91), ('deeper', 2))
+        self.assertEqual(self.rule.classify_value(None), ('good', 1))
+
+    def test_evaluate_min_of_selected_frames(self):
+        metrics = create_metrics({0: 170, 1: 10, 2: 100, 3: 150})
+        self.assertEqual(self.rule.evaluate(metrics), ('deeper', 2, 0))
+
+    def test_evaluate_min_without_selected_frame(self):
+        with self.assertRaises(ValueError):
+            self.rule.evaluate(create_metrics({0: 10, 1: 5}))
+
+    def test_evaluate_min_with_initial_value(self):
+        rule = CorrectionRule({
+            'category': 'back_arching_momentum',
+            'metric': 'right_hip_knee_ankle',
+            'initial': 180,
+            'bands': [{'at_least': 170, 'advice': 'good', 'correction_level': 1}],
+            'otherwise': {'advice': 'bad', 'correction_level': 3},
+        })
+        self.assertEqual(rule.evaluate(create_metrics({0: 170, 1: 150})), ('good', 1, 0))
+
+    def test_evaluate_worst_frame(self):
+        rule = CorrectionRule({
+            'category': 'depth_band',
+            'metric': 'right_hip_knee_ankle',
+            'reduction': 'worst',
+            'bands': [{'below': 100, 'advice': 'good', 'correction_level': 1}],
+            'otherwise': {'advice': 'bad', 'correction_level': 3},
+        })
+        self.assertEqual(rule.evaluate(create_metrics({0: 170, 1: 90, 2: 120, 3: 110})), ('bad', 3, 2))
+        self.assertEqual(rule.evaluate(create_metrics({0: 170, 1: 90})), ('good', 1, 1))
+        # without any frame under tension, the least severe advice is given
+        self.assertEqual(rule.evaluate(create_metrics({0: 170, 1: 160})), ('good', 1, 0))
+
+    def test_evaluate_ignores_speeds_above_maximum(self):
+        rule = CorrectionRule({
+            'category': 'steady_depth',
+            'metric': 'right_hip_knee_ankle',
+            'max_speed': 450,
+            'initial': 180,
+            'bands': [{'above': 100, 'advice': 'good', 'correction_level': 1}],
+            'otherwise': {'advice': 'bad', 'correction_level': 3},
+        })
+        self.assertEqual(rule.evaluate(create_metrics({0: 130, 1: 50, 2: 120, 3: 110})), ('good', 1, 0))
+        # the same changes are slow enough at a lower frame rate
+        self.assertEqual(rule.evaluate(create_metrics({0: 130, 1: 50, 2: 120, 3: 110}, fps=5)), ('bad', 3, 0))
+
+    def test_invalid_definitions(self):
+        definition = {
+            'category': 'squat_depth',
+            'metric': 'right_hip_knee_ankle',
+            'otherwise': {'advice': 'good', 'correction_level': 1},
+        }
+        for invalid_definition in (dict(definition, metric='unknown'), dict(definition, frames='unknown'),
+                                   dict(definition, reduction='mean'), dict(definition, reduction='value'),
+                                   dict(definition, otherwise={'advice': 'good'}),
+                                   dict(definition, bands=[{'above': 1, 'at_least': 2, 'advice': 'bad',
+                                                            'correction_level': 3}]),
+                                   dict(definition, bands=[{'over': 1, 'advice': 'bad', 'correction_level': 3}]),
+                                   dict(definition, metric='eccentric_concentric_ratio', reduction='value',
+                                        max_speed=1),
+                                   dict(definition, views='side'), dict(definition, views=[]),
+                                   dict(definition, views=['top']), dict(definition, views=[['side']]),
+                                   dict(definition, bands=[{'above': None, 'advice': 'bad', 'correction_level': 3}]),
+                                   dict(definition, bands=[{'below': '90', 'advice': 'bad', 'correction_level': 3}]),
+                                   dict(definition, initial='0'), dict(definition, max_speed=[1]),
+                                   dict(definition, stop_at_correction_level=2.5), dict(definition, group=1),
+                                   dict(definition, frames=['under_tension']), 'squat_depth'):
+            with self.assertRaises(RuleSetError):
+                CorrectionRule(invalid_definition)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+
+from exercise_correction.services.exception.custom_exceptions import RuleSetError
+from exercise_correction.services.pose_correction.PoseAnalyzer import PoseAnalyzer
+from exercise_correction.services.rules.CorrectionRuleSet import CorrectionRuleSet
+from exercise_correction.services.rules.RepetitionMetrics import RepetitionMetrics
+from exercise_correction.services.rules.RuleSetRepository import RuleSetRepository
+
+
+def create_rule(category, above, correction_level=3, **options):
+    return dict({
+        'category': category,
+        'metric': 'right_hip_knee_ankle',
+        'reduction': 'worst',
+        'bands': [{'above': above, 'advice': f'bad {category}', 'correction_level': correction_level}],
+        'otherwise': {'advice': f'good {category}', 'correction_level': 1},
+    }, **options)
+
+
+class TestCorrectionRuleSet(unittest.TestCase):
+    def setUp(self):
+        angles = {0: 100, 1: 110, 2: 120, 3: 130}
+        landmarks = {frame: [(0, 0, 0)] * 33 for frame in angles}
+        self.metrics = RepetitionMetrics.from_dictionaries(landmarks, {'right_hip_knee_ankle': angles}, PoseAnalyzer(),
+                                                           'right_hip_knee_ankle', 135, 15)
+
+    def test_group_gives_failed_rules_first_by_first_failed_frame(self):
+        rule_set = CorrectionRuleSet({'version': '1', 'exercises': {'squat': [
+            create_rule('first', 200),
+            create_rule('a', 200, group='position'),
+            create_rule('b', 115, group='position'),
+            create_rule('c', 200, group='position'),
+            create_rule('d', 105, group='position'),
+            create_rule('last', 200),
+        ]}})
+
+        advice = rule_set.evaluate('squat', self.metrics)
+        self.assertEqual(list(advice), ['first', 'd', 'b', 'a', 'c', 'last'])
+        self.assertEqual(advice['d'], ('bad d', 3))
+        self.assertEqual(advice['a'], ('good a', 1))
+
+    def test_stops_at_correction_level(self):
+        rule_set = CorrectionRuleSet({'version': '1', 'exercises': {'squat': [
+            create_rule('depth', 90, stop_at_correction_level=3),
+            create_rule('other', 200),
+        ]}})
+        self.assertEqual(rule_set.evaluate('squat', self.metrics), {'depth': ('bad depth', 3)})
+
+        rule_set = CorrectionRuleSet({'version': '1', 'exercises': {'squat': [
+            create_rule('depth', 90, correction_level=2, stop_at_correction_level=3),
+            create_rule('other', 200),
+        ]}})
+        self.assertEqual(list(rule_set.evaluate('squat', self.metrics)), ['depth', 'other'])
+
+    def test_skips_rules_of_other_camera_views(self):
+        rule_set = CorrectionRuleSet({'version': '1', 'exercises': {'squat': [
+            create_rule('depth', 90),
+            create_rule('trunk', 200, views=['side']),
+            create_rule('hip', 200, views=['front']),
+        ]}})
+        self.assertEqual(list(rule_set.evaluate('squat', self.metrics, 'side')), ['depth', 'trunk'])
+        self.assertEqual(list(rule_set.evaluate('squat', self.metrics, 'front')), ['depth', 'hip'])
+        self.assertEqual(list(rule_set.evaluate('squat', self.metrics)), ['depth', 'trunk', 'hip'])
+
+    def test_invalid_rule_sets(self):
+        for definition in ([], {'exercises': {}}, {'version': '1'}, {'version': '1', 'exercises': {'squat': {}}}):
+            with self.assertRaises(RuleSetError):
+                CorrectionRuleSet(definition)
+
+    def test_default_rule_set(self):
+        rule_set = RuleSetRepository().get_rule_set()
+        self.assertEqual(sorted(rule_set.get_exercise_types()), ['bicep_curl', 'pushup', 'squat'])
+        self.assertEqual(rule_set.get_rule('squat', 'squat_depth').classify_value(95),
+                         ("You need to go deeper in depth.", 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from exercise_correction.services.pose_correction.ExerciseClassifier import ExerciseClassifier
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class TestExerciseClassifier(unittest.TestCase):
+    def setUp(self):
+        self.exercise_classifier = ExerciseClassifier()
+
+    def test_classify_synthetic_exercises(self):
+        for exercise_type in ExerciseClassifier.CENTROIDS:
+            for seed in range(3):
+                landmarks = SyntheticPoseGenerator(exercise_type, repetitions=2, noise=0.02, dropout=0.1,
+                                                   seed=seed).generate_landmarks_dictionary()
+                self.assertEqual(self.exercise_classifier.classify(landmarks), exercise_type)
+
+    def test_undetected_keypoints(self):
+        landmarks = SyntheticPoseGenerator('squat', repetitions=1).generate_landmarks_dictionary()
+        landmarks = {frame: [None] * len(frame_landmarks) for frame, frame_landmarks in landmarks.items()}
+        self.assertIsNone(self.exercise_classifier.compute_signature(landmarks))
+        self.assertIsNone(self.exercise_classifier.classify(landmarks))
+
+    def test_no_landmarks(self):
+        self.assertIsNone(self.exercise_classifier.classify(dict()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from exercise_correction.services.pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from exercise_correction.services.pose_correction.FrameResampler import FrameResampler
+from exercise_correction.services.pose_correction.KinematicFeatures import KinematicFeatures
+from exercise_correction.services.pose_correction.SquatPoseCorrection import SquatPoseCorrection
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class TestFrameResampler(unittest.TestCase):
+    def test_videos_up_to_the_analysis_frame_rate_are_kept(self):
+        for fps in (None, 24, 30, 31):
+            with self.subTest(fps=fps):
+                frame_resampler = FrameResampler(fps)
+                landmarks = {0: 'a', 1: 'b', 3: 'c'}
+
+                self.assertFalse(frame_resampler.is_resampled())
+                self.assertEqual(frame_resampler.resample(landmarks), landmarks)
+                self.assertEqual(frame_resampler.get_fps(), KinematicFeatures.normalize_fps(fps))
+                self.assertEqual(frame_resampler.get_source_frame(3), 3)
+
+    def test_resample_evenly_spaced_frames(self):
+        frame_resampler = FrameResampler(120)
+        resampled_landmarks = frame_resampler.resample({frame: frame for frame in range(120)})
+
+        self.assertEqual(frame_resampler.get_fps(), 30)
+        self.assertEqual(resampled_landmarks, {analysis_frame: 4 * analysis_frame for analysis_frame in range(30)})
+        self.assertEqual(frame_resampler.get_source_frames([0, 7, 29]), [0, 28, 116])
+
+    def test_frames_without_landmarks_stay_missing(self):
+        frame_resampler = FrameResampler(60)
+        resampled_landmarks = frame_resampler.resample({0: 'a', 1: 'b', 3: 'c', 4: 'd', 7: 'e'})
+
+        # the frames 2 and 6 are sampled, but no pose was detected in them
+        self.assertEqual(resampled_landmarks, {0: 'a', 2: 'd'})
+
+    def test_resample_variable_frame_rate(self):
+        frame_resampler = FrameResampler(60)
+        timestamps = [0.0, 0.01, 0.02, 0.04, 0.07, 0.08, 0.1, 0.13]
+
+        resampled_landmarks = frame_resampler.resample({frame: frame for frame in range(len(timestamps))},
+                                                       timestamps)
+        self.assertEqual(resampled_landmarks, {0: 0, 1: 3, 2: 4, 3: 6})
+
+    def test_non_increasing_timestamps_are_ignored(self):
+        frame_resampler = FrameResampler(60)
+        resampled_landmarks = frame_resampler.resample({frame: frame for frame in range(8)}, [0.0] * 8)
+
+        self.assertEqual(resampled_landmarks, {0: 0, 1: 2, 2: 4, 3: 6})
+
+    def test_repetitions_are_segmented_alike_whatever_the_frame_rate(self):
+        correction = SquatPoseCorrection()
+
+        repetition_counts = []
+        for fps in (30, 120):
+            landmarks = SyntheticPoseGenerator('squat', repetitions=3, fps=fps).generate_landmarks_dictionary()
+            frame_resampler = FrameResampler(fps)
+            resampled_landmarks = frame_resampler.resample(landmarks)
+            angles = AnglesAnalyzer(resampled_landmarks, correction._pose_analyzer).compute_angles_for_landmarks(
+                resampled_landmarks, [correction._segmentation_angle_name])
+
+            split_frames = AnglesAnalyzer.get_repetition_split_frames(
+                angles[correction._segmentation_angle_name], correction._REPETITION_START_THRESHOLD,
+                correction._ERROR_THRESHOLD,
+                KinematicFeatures.get_change_per_frame(correction._CHANGE_THRESHOLD, frame_resampler.get_fps()))
+            self.assertTrue(all(source_frame in landmarks
+                                for source_frame in frame_resampler.get_source_frames(split_frames)))
+            repetition_counts.append(len(split_frames))
+
+        self.assertGreater(repetition_counts[0], 0)
+        self.assertEqual(repetition_counts[1], repetition_counts[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+
+from exercise_correction.services.monitoring.JobProfiler import JobProfiler
+
+
+def allocate_and_compute():
+    # a loop rather than a comprehension, whose frame would be sampled inside the function
+    blocks = []
+    for _ in range(2000):
+        blocks.append(bytearray(1024))
+    total = 0
+    for _ in range(200000):
+        total += len(blocks)
+    return total
+
+
+class TestJobProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = JobProfiler(interval=0.001)
+
+    def test_profile(self):
+        with self.profiler.profile():
+            allocate_and_compute()
+
+        self.assertGreater(self.profiler.get_samples(), 0)
+        stacks = self.profiler.get_folded_stacks()
+        self.assertTrue(any('allocate_and_compute (test_JobProfiler.py:' in stack for stack in stacks))
+        # frames are ordered from the outermost to the innermost
+        for stack in stacks:
+            frames = [frame.split(' ', 1)[0] for frame in stack.split(';')]
+            if 'allocate_and_compute' in frames:
+                self.assertLess(frames.index('test_profile'), frames.index('allocate_and_compute'))
+
+    def test_save(self):
+        with self.profiler.profile():
+            allocate_and_compute()
+
+        with tempfile.TemporaryDirectory() as directory:
+            profile_path = os.path.join(directory, 'profile.folded')
+            memory_report_path = os.path.join(directory, 'memory.txt')
+            self.profiler.save_folded_stacks(profile_path)
+            self.profiler.save_memory_report(memory_report_path)
+
+            with open(profile_path, 'r') as file:
+                lines = file.read().splitlines()
+            with open(memory_report_path, 'r') as file:
+                memory_report = file.read()
+
+        self.assertEqual(sum(int(line.rsplit(' ', 1)[1]) for line in lines), self.profiler.get_samples())
+        self.assertIn('Peak traced memory', memory_report)
+        self.assertIn('test_JobProfiler.py', memory_report)
+
+
+if __name__ == '__main__':
+    unittest.main()
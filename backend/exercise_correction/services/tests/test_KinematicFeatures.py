@@ -0,0 +1,33 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.pose_correction.KinematicFeatures import KinematicFeatures
+
+
+class TestKinematicFeatures(unittest.TestCase):
+    def setUp(self):
+        self.kinematics = KinematicFeatures(np.array([3, 1, 2, 5, 6]), fps=10)
+
+    def test_get_previous_values(self):
+        np.testing.assert_array_equal(self.kinematics.get_previous_values(np.array([4., 1., 2., 7., 9.])),
+                                      [2, np.nan, 1, np.nan, 7])
+
+    def test_get_velocities(self):
+        velocities = self.kinematics.get_velocities(np.array([4., 1., 2., 7., 9.]))
+        np.testing.assert_array_equal(velocities, [20, np.nan, 10, np.nan, 20])
+        np.testing.assert_array_equal(self.kinematics.get_accelerations(velocities),
+                                      [100, np.nan, np.nan, np.nan, np.nan])
+
+    def test_fps_normalization(self):
+        self.assertEqual(KinematicFeatures(np.arange(3)).get_fps(), KinematicFeatures.REFERENCE_FPS)
+        self.assertEqual(KinematicFeatures(np.arange(3), fps=0).get_fps(), KinematicFeatures.REFERENCE_FPS)
+        self.assertEqual(KinematicFeatures.get_change_per_frame(450), 15)
+        self.assertEqual(KinematicFeatures.get_change_per_frame(450, fps=60), 7.5)
+
+    def test_empty_frames(self):
+        self.assertEqual(KinematicFeatures(np.array([])).get_velocities(np.array([])).shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
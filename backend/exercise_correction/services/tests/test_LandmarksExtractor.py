@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+
+
+class StaticLandmarksExtractor(LandmarksExtractor):
+    def __init__(self, detected_frames, total_frames):
+        super().__init__()
+        self._detected_frames = detected_frames
+        self._video_total_frames = total_frames
+
+    def iter_landmarks_from_video(self, video_path):
+        for frame_index in self._detected_frames:
+            yield frame_index, [(frame_index, frame_index, frame_index, 1.0)] * 33
+        self._total_frames = self._video_total_frames
+
+
+class TestLandmarksExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = StaticLandmarksExtractor([0, 1, 2, 4, 5, 6, 7], 8)
+
+    def test_extract_landmarks_from_video(self):
+        self.extractor.extract_landmarks_from_video('video.mp4')
+        self.assertEqual(list(self.extractor.get_landmarks_dictionary().keys()), [0, 1, 2, 4, 5, 6, 7])
+        self.assertEqual(self.extractor.get_total_frames(), 8)
+
+    def test_iter_landmark_blocks(self):
+        blocks = list(self.extractor.iter_landmark_blocks('video.mp4', block_size=3))
+        self.assertEqual([list(block.keys()) for block in blocks], [[0, 1, 2], [4, 5, 6], [7]])
+        self.assertEqual(blocks[1][5][0], (5, 5, 5, 1.0))
+        self.assertEqual(self.extractor.get_total_frames(), 8)
+
+    def test_iter_landmark_blocks_is_lazy(self):
+        blocks = self.extractor.iter_landmark_blocks('video.mp4', block_size=3)
+        next(blocks)
+        self.assertEqual(self.extractor.get_total_frames(), 0)
+
+    def test_process_keypoints_of_given_indices(self):
+        data = {0: [(0, 0, 0, 0.9), (1, 1, 1, 0.9)], 1: [(2, 2, 2, 0.9), (3, 3, 3, 0.1)],
+                2: [(4, 4, 4, 0.9), (5, 5, 5, 0.9)]}
+        self.assertEqual(self.extractor.process_keypoints(data, keypoint_indices=[1]),
+                         {0: [None, [1, 1, 1]], 1: [None, [3, 3, 3]], 2: [None, [5, 5, 5]]})
+
+    def test_convert_to_array(self):
+        landmarks_array = LandmarksExtractor.convert_to_array([[(1, 2, 3, 0.9), None], [[4, 5, 6], [7, 8, 9]]])
+        self.assertEqual(landmarks_array.shape, (2, 2, 3))
+        self.assertTrue(np.isnan(landmarks_array[0, 1]).all())
+        self.assertEqual(landmarks_array[1, 1].tolist(), [7, 8, 9])
+        self.assertEqual(LandmarksExtractor.convert_to_array([], 33).shape, (0, 33, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
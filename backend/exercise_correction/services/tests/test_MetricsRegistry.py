@@ -0,0 +1,112 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from exercise_correction.services.monitoring.MetricsRegistry import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.registry = self.create_registry(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def create_registry(directory):
+        registry = MetricsRegistry(directory)
+        registry.register_counter('jobs_total', "Jobs processed.", labels=('exercise_type',))
+        registry.register_gauge('workers_busy', "Busy workers.")
+        registry.register_gauge('queue_depth', "Queued jobs.", aggregation='shared')
+        registry.register_histogram('latency_seconds', "Latency.", labels=('view',), buckets=(0.1, 1))
+        return registry
+
+    def test_render(self):
+        self.registry.inc('jobs_total', labels={'exercise_type': 'squat'})
+        self.registry.inc('jobs_total', 2, labels={'exercise_type': 'squat'})
+        self.registry.set('workers_busy', 3)
+        self.registry.observe('latency_seconds', 0.05, {'view': 'video_submit'})
+        self.registry.observe('latency_seconds', 1, {'view': 'video_submit'})
+        self.registry.observe('latency_seconds', 5, {'view': 'video_submit'})
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('# TYPE jobs_total counter', lines)
+        self.assertIn('jobs_total{exercise_type="squat"} 3', lines)
+        self.assertIn('workers_busy 3', lines)
+        self.assertIn('latency_seconds_bucket{view="video_submit",le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{view="video_submit",le="1"} 2', lines)
+        self.assertIn('latency_seconds_bucket{view="video_submit",le="+Inf"} 3', lines)
+        self.assertIn('latency_seconds_sum{view="video_submit"} 6.05', lines)
+        self.assertIn('latency_seconds_count{view="video_submit"} 3', lines)
+
+    def test_aggregates_processes(self):
+        other_registry = self.create_registry(self.directory)
+        other_registry.inc('jobs_total', 2, labels={'exercise_type': 'squat'})
+        other_registry.set('workers_busy', 1)
+        other_registry.observe('latency_seconds', 0.5, {'view': 'video_submit'})
+        other_registry.flush()
+
+        self.registry.inc('jobs_total', labels={'exercise_type': 'squat'})
+        self.registry.set('workers_busy', 2)
+        self.registry.observe('latency_seconds', 0.5, {'view': 'video_submit'})
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('jobs_total{exercise_type="squat"} 3', lines)
+        self.assertIn('workers_busy 3', lines)
+        self.assertIn('latency_seconds_count{view="video_submit"} 2', lines)
+
+    def test_exited_processes_are_merged(self):
+        # a process identifier no process has
+        exited_pid = 2 ** 30
+        for index, value in enumerate([2, 3]):
+            with open(os.path.join(self.directory, f'{exited_pid}_{index}.json'), 'w') as file:
+                json.dump({'pid': exited_pid, 'metrics': {'jobs_total': [[['squat'], value]],
+                                                          'workers_busy': [[[], 4]]}}, file)
+
+        self.registry.inc('jobs_total', labels={'exercise_type': 'squat'})
+        for _ in range(2):
+            lines = self.registry.render().splitlines()
+            self.assertIn('jobs_total{exercise_type="squat"} 6', lines)
+            self.assertNotIn('workers_busy 4', lines)
+
+        # the files of the exited processes are replaced by a single one
+        self.assertEqual(sorted(file_name for file_name in os.listdir(self.directory) if file_name.endswith('.json')),
+                         [MetricsRegistry.EXITED_PROCESSES_FILE_NAME])
+
+    def test_function_values(self):
+        other_registry = self.create_registry(self.directory)
+        other_registry.set_function('queue_depth', lambda: 5)
+        other_registry.flush()
+
+        self.registry.set_function('queue_depth', lambda: 2)
+        self.registry.set_function('jobs_total', lambda: {('squat',): 7})
+
+        lines = self.registry.render().splitlines()
+
+        # shared values are not summed over the processes
+        self.assertIn('queue_depth 2', lines)
+        self.assertIn('jobs_total{exercise_type="squat"} 7', lines)
+
+    def test_invalid_updates(self):
+        with self.assertRaises(ValueError):
+            self.registry.inc('jobs_total', labels={'view': 'squat'})
+        with self.assertRaises(ValueError):
+            self.registry.inc('jobs_total', -1, labels={'exercise_type': 'squat'})
+        with self.assertRaises(TypeError):
+            self.registry.observe('jobs_total', 1, labels={'exercise_type': 'squat'})
+        with self.assertRaises(KeyError):
+            self.registry.inc('unknown_total')
+
+    def test_escapes_label_values(self):
+        self.registry.inc('jobs_total', labels={'exercise_type': 'a "b"\n'})
+
+        self.assertIn('jobs_total{exercise_type="a \\"b\\"\\n"} 1', self.registry.render().splitlines())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from exercise_correction.services.landmarks_extractor.ModelComplexityPolicy import ModelComplexityPolicy
+
+
+class TestModelComplexityPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = ModelComplexityPolicy(latency_slo=60, parallel_workers=3)
+
+    def test_estimate_latency_grows_with_complexity(self):
+        latencies = [self.policy.estimate_latency(complexity, 900, 1280, 720) for complexity in range(3)]
+        self.assertEqual(latencies, sorted(latencies))
+
+    def test_estimate_latency_grows_with_queue_depth(self):
+        idle_latency = self.policy.estimate_latency(2, 900, 1280, 720, queue_depth=0)
+        busy_latency = self.policy.estimate_latency(2, 900, 1280, 720, queue_depth=6)
+        self.assertAlmostEqual(busy_latency, idle_latency * 3)
+
+    def test_select_short_video(self):
+        self.assertEqual(self.policy.select(300, 1280, 720), 2)
+
+    def test_select_long_video(self):
+        self.assertEqual(self.policy.select(1800, 1280, 720), 1)
+        self.assertEqual(self.policy.select(54000, 1280, 720), 0)
+
+    def test_select_under_load(self):
+        self.assertEqual(self.policy.select(600, 1280, 720, queue_depth=0), 2)
+        self.assertEqual(self.policy.select(600, 1280, 720, queue_depth=6), 1)
+
+    def test_select_respects_max_model_complexity(self):
+        policy = ModelComplexityPolicy(latency_slo=60, max_model_complexity=1)
+        self.assertEqual(policy.select(30, 640, 480), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
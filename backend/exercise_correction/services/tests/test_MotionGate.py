@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.landmarks_extractor.MotionGate import MotionGate
+
+
+def draw_square(x, brightness=255):
+    image = np.zeros((240, 320, 3), dtype=np.uint8)
+    image[100:140, x:x + 40] = brightness
+    return image
+
+
+class TestMotionGate(unittest.TestCase):
+    def setUp(self):
+        self.motion_gate = MotionGate()
+
+    def test_idle_frames_are_not_keyframes(self):
+        keyframes = [self.motion_gate.is_keyframe(draw_square(100)) for _ in range(10)]
+        self.assertEqual(keyframes, [False] * 10)
+
+    def test_moving_frames_are_keyframes(self):
+        keyframes = [self.motion_gate.is_keyframe(draw_square(x)) for x in range(0, 200, 20)]
+        self.assertEqual(keyframes, [False] + [True] * 9)
+
+    def test_slow_movements_add_up_to_keyframes(self):
+        keyframes = [self.motion_gate.is_keyframe(draw_square(100 + x, brightness=40)) for x in range(0, 20)]
+
+        # the frames are compared with the previous keyframe rather than with the previous frame, from which a dim
+        # square moving by one pixel does not differ enough
+        self.assertFalse(keyframes[1])
+        self.assertIn(True, keyframes)
+        self.assertLess(keyframes.count(True), 10)
+
+    def test_reset(self):
+        self.motion_gate.is_keyframe(draw_square(0))
+        self.assertTrue(self.motion_gate.is_keyframe(draw_square(100)))
+
+        self.motion_gate.reset()
+        self.assertFalse(self.motion_gate.is_keyframe(draw_square(200)))
+
+    def test_compute_motion(self):
+        reference = np.zeros((10, 10), dtype=np.uint8)
+        downscaled_image = reference.copy()
+        downscaled_image[:5, :2] = 100
+        downscaled_image[5, 5] = 5
+
+        self.assertEqual(self.motion_gate.compute_motion(downscaled_image, reference), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
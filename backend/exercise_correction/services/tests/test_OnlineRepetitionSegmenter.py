@@ -0,0 +1,39 @@
+import unittest
+
+from exercise_correction.services.pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from exercise_correction.services.pose_correction.OnlineRepetitionSegmenter import OnlineRepetitionSegmenter
+
+
+class TestOnlineRepetitionSegmenter(unittest.TestCase):
+    @staticmethod
+    def push_all(segmenter, flexion_angles):
+        split_frames = []
+        for frame, angle in flexion_angles.items():
+            split_frame = segmenter.push(frame, angle)
+            if split_frame is not None:
+                split_frames.append(split_frame)
+        return split_frames
+
+    def test_push(self):
+        flexion_angles = {i: angle for i, angle in enumerate([30, 25, 20, 15, 10, 15, 20, 25, 30, 27, 23, 20, 17, 21, 24])}
+        segmenter = OnlineRepetitionSegmenter(20)
+        self.assertEqual(self.push_all(segmenter, flexion_angles), [8])
+
+    def test_push_reports_split_frame_when_next_repetition_starts(self):
+        flexion_angles = {0: 170, 1: 120, 2: 100, 3: 150, 4: 175, 5: 160, 6: 110}
+        segmenter = OnlineRepetitionSegmenter(135, change_threshold=90)
+        reported = [segmenter.push(frame, angle) for frame, angle in flexion_angles.items()]
+        self.assertEqual(reported, [None, None, None, None, None, None, 4])
+
+    def test_push_matches_get_repetition_split_frames(self):
+        angles = [170, 160, 140, 120, 100, 90, 0, 95, 130, 150, 170, 175, 150, 140, 110, 91, 85, 120, 176, 170,
+                  float('nan'), 130, 100, 140, 170]
+        flexion_angles = {frame: angle for frame, angle in enumerate(angles) if frame % 7 != 3}
+        for change_threshold in (15, 20, 90):
+            segmenter = OnlineRepetitionSegmenter(135, 15, change_threshold)
+            expected_frames = AnglesAnalyzer.get_repetition_split_frames(flexion_angles, 135, 15, change_threshold)
+            self.assertEqual(self.push_all(segmenter, flexion_angles), expected_frames)
+
+
+if __name__ == "__main__":
+    unittest.main()
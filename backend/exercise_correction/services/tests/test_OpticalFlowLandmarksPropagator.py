@@ -0,0 +1,57 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from exercise_correction.services.landmarks_extractor.OpticalFlowLandmarksPropagator import \
+    OpticalFlowLandmarksPropagator
+
+
+class TestOpticalFlowLandmarksPropagator(unittest.TestCase):
+    def setUp(self):
+        self.propagator = OpticalFlowLandmarksPropagator()
+        random_generator = np.random.default_rng(0)
+        texture = cv2.GaussianBlur((random_generator.random((240, 320)) * 255).astype(np.uint8), (0, 0), 2)
+        self.image = cv2.cvtColor(texture, cv2.COLOR_GRAY2BGR)
+        self.landmarks = [(x / 320, 0.5, 0.0, 0.9) for x in np.linspace(80, 240, 33)]
+
+    def shift(self, landmarks, offset):
+        return [(x + offset / 320, y, z, visibility) for x, y, z, visibility in landmarks]
+
+    def test_propagate_accelerating_movement(self):
+        offsets = [0, 1, 4, 9, 16]
+        images = [np.roll(self.image, offset, axis=1) for offset in offsets]
+
+        self.propagator.anchor(0, images[0], self.landmarks)
+        for frame in range(1, 4):
+            self.propagator.propagate(frame, images[frame])
+        propagated_landmarks = self.propagator.reanchor(4, images[4], self.shift(self.landmarks, offsets[4]))
+
+        # the linear interpolation between the keyframes would place the landmarks 4, 8 and 12 pixels away
+        self.assertEqual([frame for frame, _ in propagated_landmarks], [1, 2, 3])
+        for (frame, landmarks), offset in zip(propagated_landmarks, offsets[1:4]):
+            np.testing.assert_allclose(np.array(landmarks), np.array(self.shift(self.landmarks, offset)), atol=1e-3)
+
+    def test_drift_is_spread_over_the_propagated_frames(self):
+        self.propagator.anchor(0, self.image, self.landmarks)
+        self.propagator.propagate(1, self.image)
+
+        # the keyframe is estimated 2 pixels away from the tracked landmarks
+        propagated_landmarks = self.propagator.reanchor(2, self.image, self.shift(self.landmarks, 2))
+        np.testing.assert_allclose(np.array(propagated_landmarks[0][1]), np.array(self.shift(self.landmarks, 1)),
+                                   atol=1e-3)
+
+    def test_lost_keypoints_become_invisible(self):
+        self.propagator.anchor(0, self.image, self.landmarks)
+        self.propagator.propagate(1, np.zeros_like(self.image))
+        propagated_landmarks = self.propagator.reanchor(2, self.image, self.landmarks)
+
+        self.assertTrue(all(keypoint[3] == 0 for keypoint in propagated_landmarks[0][1]))
+
+    def test_nothing_is_propagated_before_a_keyframe(self):
+        self.propagator.propagate(0, self.image)
+        self.assertEqual(self.propagator.reanchor(1, self.image, self.landmarks), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from exercise_correction.services.constants import BLAZE_POSE_LANDMARKS
+from exercise_correction.services.landmarks_extractor.StreamingKeypointsProcessor import StreamingKeypointsProcessor
+from exercise_correction.services.pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from exercise_correction.services.pose_correction.BodySideSelector import BodySideSelector
+from exercise_correction.services.pose_correction.BicepCurlPoseCorrection import BicepCurlPoseCorrection
+from exercise_correction.services.pose_correction.KinematicFeatures import KinematicFeatures
+from exercise_correction.services.pose_correction.PoseCorrectionRegistry import PoseCorrectionRegistry
+from exercise_correction.services.pose_correction.PushupPoseCorrection import PushUpPoseCorrection
+from exercise_correction.services.pose_correction.SquatPoseCorrection import SquatPoseCorrection
+from exercise_correction.services.rules.CorrectionRuleSet import CorrectionRuleSet
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+def film_side(landmarks, side):
+    # the landmarks of the right side of a synthetic pose become the ones of the side facing the camera, the other
+    # side being occluded
+    occluded_landmarks = BodySideSelector.get_body_landmarks('left' if side == 'right' else 'right')
+    filmed_landmarks = dict()
+    for frame, frame_landmarks in landmarks.items():
+        filmed_landmarks[frame] = [None] * len(frame_landmarks)
+        for name, index in BLAZE_POSE_LANDMARKS.items():
+            keypoint = frame_landmarks[BLAZE_POSE_LANDMARKS[BodySideSelector.resolve_name(name, side)]]
+            filmed_landmarks[frame][index] = tuple(keypoint[:3]) + ((0.1,) if index in occluded_landmarks else (1.0,))
+
+    return filmed_landmarks
+
+
+# advice of the default rules for a correct repetition of each exercise, and for a shallow one dropping into the
+# eccentric phase, which changes only when the rules are meant to
+GOLDEN_ADVICE = {
+    ('squat', 'correct'): {
+        'squat_depth': ('You depth is good.', 1),
+        'head_position': ('You need to keep your head straight.', 3),
+        'frontal_knee_position': ('You need to keep your knees in line with your toes.', 3),
+        'thoracic_position': ('Your thoracic position is good.', 1),
+        'hip_position': ('Your hip position is good.', 1),
+        'foot_position': ('Your foot position is good.', 1),
+        'trunk_position': ('Your trunk is parallel to your tibia.', 1),
+        'eccentric_concentric_ratio': ('Your movement is controlled, not dropping into the squat.', 1),
+    },
+    ('squat', 'shallow_and_dropped'): {
+        'squat_depth': ('You need to go deeper in depth.', 2),
+        'head_position': ('You need to keep your head straight.', 3),
+        'frontal_knee_position': ('You need to keep your knees in line with your toes.', 3),
+        'thoracic_position': ('Your thoracic position is good.', 1),
+        'hip_position': ('Your hip position is good.', 1),
+        'foot_position': ('Your foot position is good.', 1),
+        'trunk_position': ('Your trunk is parallel to your tibia.', 1),
+        'eccentric_concentric_ratio': ('You need to also control the descent movement, not just the ascent.', 3),
+    },
+    ('bicep_curl', 'correct'): {
+        'curl_depth': ('Perfect curl depth!', 1),
+        'wrist_position': ('Good wrist position.', 1),
+        'elbow_position': ('Perfect elbow position!', 1),
+        'back_arching_momentum': ('Good back stability!', 1),
+        'eccentric_concentric_ratio': ('Your movement is controlled, great job!', 1),
+    },
+    ('bicep_curl', 'shallow_and_dropped'): {
+        'curl_depth': ('Good curl depth, but could be better.', 2),
+        'wrist_position': ('Good wrist position.', 1),
+        'elbow_position': ('Perfect elbow position!', 1),
+        'back_arching_momentum': ('Good back stability!', 1),
+        'eccentric_concentric_ratio': ('You need to also control the descent movement, aim for a slower eccentric '
+                                       'phase.', 3),
+    },
+    ('pushup', 'correct'): {
+        'push_up_depth': ('Perfect range of motion!', 1),
+        'hand_position': ('Bad hand position, please adjust your hands.', 3),
+        'body_alignment': ('Good body alignment!', 1),
+        'elbow_position': ('Bad elbow position, keep your elbows closer to your body.', 3),
+        'eccentric_concentric_ratio': ('Your movement is controlled, great job!', 1),
+    },
+    ('pushup', 'shallow_and_dropped'): {
+        'push_up_depth': ('Good range of motion, but could be better.', 2),
+        'hand_position': ('Bad hand position, please adjust your hands.', 3),
+        'body_alignment': ('Good body alignment!', 1),
+        'elbow_position': ('Bad elbow position, keep your elbows closer to your body.', 3),
+        'eccentric_concentric_ratio': ('You need to also control the descent movement, aim for a slower eccentric '
+                                       'phase.', 3),
+    },
+}
+
+
+class TestPoseCorrection(unittest.TestCase):
+    def test_golden_correction_advice(self):
+        shallow_depths = {'squat': 100, 'bicep_curl': 60, 'pushup': 100}
+        for (exercise_type, execution), expected_advice in GOLDEN_ADVICE.items():
+            with self.subTest(exercise_type=exercise_type, execution=execution):
+                correction = PoseCorrectionRegistry().get(exercise_type)
+                generator_options = {'depth': shallow_depths[exercise_type], 'eccentric_seconds': 0.6} \
+                    if execution == 'shallow_and_dropped' else {}
+                landmarks = SyntheticPoseGenerator(exercise_type, repetitions=1,
+                                                   **generator_options).generate_landmarks_dictionary()
+                angles = AnglesAnalyzer(landmarks, correction._pose_analyzer).compute_angles_for_landmarks(
+                    landmarks, [correction._segmentation_angle_name])
+
+                split_frames = AnglesAnalyzer.get_repetition_split_frames(
+                    angles[correction._segmentation_angle_name], correction._REPETITION_START_THRESHOLD,
+                    correction._ERROR_THRESHOLD,
+                    KinematicFeatures.get_change_per_frame(correction._CHANGE_THRESHOLD))
+                advice = [correction._get_correction_advice(landmarks_segment, angles_segment)
+                          for landmarks_segment, angles_segment in zip(
+                              AnglesAnalyzer.split_landmarks_data_into_repetitions(landmarks, split_frames),
+                              AnglesAnalyzer.split_angles_data_into_repetitions(angles, split_frames))]
+
+                self.assertEqual(advice, [expected_advice])
+
+    def test_get_correction_advice_of_synthetic_repetitions(self):
+        expected_depth_advice = {
+            SquatPoseCorrection: 'squat_depth',
+            BicepCurlPoseCorrection: 'curl_depth',
+            PushUpPoseCorrection: 'push_up_depth',
+        }
+        for exercise_type, correction_class in (('squat', SquatPoseCorrection),
+                                                ('bicep_curl', BicepCurlPoseCorrection),
+                                                ('pushup', PushUpPoseCorrection)):
+            with self.subTest(exercise_type=exercise_type):
+                correction = correction_class()
+                landmarks = SyntheticPoseGenerator(exercise_type, repetitions=2).generate_landmarks_dictionary()
+                angles = AnglesAnalyzer(landmarks, correction._pose_analyzer).compute_angles_for_landmarks(
+                    landmarks, [correction._segmentation_angle_name])
+
+                split_frames = AnglesAnalyzer.get_repetition_split_frames(
+                    angles[correction._segmentation_angle_name], correction._REPETITION_START_THRESHOLD,
+                    correction._ERROR_THRESHOLD,
+                    KinematicFeatures.get_change_per_frame(correction._CHANGE_THRESHOLD))
+                repetition_angles = AnglesAnalyzer.split_angles_data_into_repetitions(angles, split_frames)
+                repetition_landmarks = AnglesAnalyzer.split_landmarks_data_into_repetitions(landmarks, split_frames)
+
+                self.assertTrue(repetition_angles)
+                for landmarks_segment, angles_segment in zip(repetition_landmarks, repetition_angles):
+                    advice = correction._get_correction_advice(landmarks_segment, angles_segment)
+                    self.assertEqual(next(iter(advice)), expected_depth_advice[correction_class])
+                    if advice[expected_depth_advice[correction_class]][1] != 3:
+                        self.assertIn('eccentric_concentric_ratio', advice)
+                    for message, level in advice.values():
+                        self.assertIsInstance(message, str)
+                        self.assertIn(level, (1, 2, 3))
+
+    def test_get_correction_advice_of_given_rule_set(self):
+        correction = SquatPoseCorrection()
+        rule_set = CorrectionRuleSet({'version': 'test', 'exercises': {'squat': [{
+            'category': 'squat_depth',
+            'metric': 'right_hip_knee_ankle',
+            'frames': 'above_error_threshold',
+            'bands': [{'below': 100, 'advice': 'deep', 'correction_level': 1}],
+            'otherwise': {'advice': 'shallow', 'correction_level': 2},
+        }]}})
+        angles = {0: 170, 1: 120, 2: 95, 3: 150}
+        landmarks = {frame: [(0, 0, 0)] * 33 for frame in angles}
+
+        advice = correction._get_correction_advice(landmarks, {'right_hip_knee_ankle': angles,
+                                                               'right_shoulder_hip_knee': angles}, rule_set)
+        self.assertEqual(advice, {'squat_depth': ('deep', 1)})
+
+    def test_evaluate_repetitions_concurrently_in_order(self):
+        correction = BicepCurlPoseCorrection()
+        landmarks = SyntheticPoseGenerator('bicep_curl', repetitions=4, noise=0.02,
+                                           seed=0).generate_landmarks_dictionary()
+        angles = AnglesAnalyzer(landmarks, correction._pose_analyzer).compute_angles_for_landmarks(
+            landmarks, [correction._segmentation_angle_name])
+        split_frames = AnglesAnalyzer.get_repetition_split_frames(
+            angles[correction._segmentation_angle_name], correction._REPETITION_START_THRESHOLD,
+            correction._ERROR_THRESHOLD, KinematicFeatures.get_change_per_frame(correction._CHANGE_THRESHOLD))
+
+        frames, video_landmarks, segmentation_angles = correction._get_video_arrays(
+            landmarks, angles[correction._segmentation_angle_name])
+        repetition_slices = AnglesAnalyzer.get_repetition_slices(frames, split_frames)
+        rule_set = correction.get_rule_set()
+
+        expected_advice = [correction._get_correction_advice(landmarks_segment, angles_segment, rule_set)
+                           for landmarks_segment, angles_segment in zip(
+                               AnglesAnalyzer.split_landmarks_data_into_repetitions(landmarks, split_frames),
+                               AnglesAnalyzer.split_angles_data_into_repetitions(angles, split_frames))]
+        self.assertGreater(len(expected_advice), 1)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            advice = correction._evaluate_repetitions(frames, video_landmarks, segmentation_angles,
+                                                      repetition_slices, rule_set, None, executor)
+        self.assertEqual(advice, expected_advice)
+
+    def test_left_side_is_analyzed_when_facing_the_camera(self):
+        correction = SquatPoseCorrection()
+        landmarks = SyntheticPoseGenerator('squat', repetitions=1).generate_landmarks_dictionary()
+
+        advice = []
+        for video_landmarks, expected_side in ((film_side(landmarks, 'right'), 'right'),
+                                               (film_side(landmarks, 'left'), 'left')):
+            camera_view, side, keypoint_indices = correction._detect_view(video_landmarks, None)
+            self.assertEqual((camera_view, side), ('side', expected_side))
+
+            processed_landmarks = StreamingKeypointsProcessor(keypoint_indices=keypoint_indices).process_block(
+                video_landmarks)
+            segmentation_angle_name = BodySideSelector.resolve_name(correction._segmentation_angle_name, side)
+            angles = AnglesAnalyzer(processed_landmarks, correction._pose_analyzer).compute_angles_for_landmarks(
+                processed_landmarks, [segmentation_angle_name])
+            advice.append(correction._get_correction_advice(processed_landmarks, angles, None, None, camera_view,
+                                                            side))
+
+        self.assertEqual(advice[1], advice[0])
+        self.assertIn('trunk_position', advice[0])
+        self.assertNotIn('hip_position', advice[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
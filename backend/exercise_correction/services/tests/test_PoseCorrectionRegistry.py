@@ -0,0 +1,61 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+from exercise_correction.services.pose_correction.PoseCorrectionRegistry import PoseCorrectionRegistry
+from exercise_correction.services.pose_correction.SquatPoseCorrection import SquatPoseCorrection
+
+
+class TestPoseCorrectionRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = PoseCorrectionRegistry(load_entry_points=False)
+
+    def test_built_in_exercises(self):
+        self.assertEqual(self.registry.get_exercise_types(), ['squat', 'bicep_curl', 'pushup'])
+        self.assertIsInstance(self.registry.get('squat'), SquatPoseCorrection)
+        self.assertIsNone(self.registry.get('lunge'))
+
+    def test_pose_corrections_are_reused_across_threads(self):
+        pose_corrections = []
+        threads = [threading.Thread(target=lambda: pose_corrections.append(self.registry.get('pushup')))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(pose_corrections), 8)
+        self.assertTrue(all(pose_correction is pose_corrections[0] for pose_correction in pose_corrections))
+
+    def test_register_replaces_pose_correction(self):
+        squat_pose_correction = self.registry.get('squat')
+        self.registry.register('squat', SquatPoseCorrection)
+        self.assertIsNot(self.registry.get('squat'), squat_pose_correction)
+
+    def test_load_entry_points(self):
+        with tempfile.TemporaryDirectory() as directory:
+            distribution_directory = os.path.join(directory, 'exercise_plugin-1.0.dist-info')
+            os.mkdir(distribution_directory)
+            with open(os.path.join(distribution_directory, 'METADATA'), 'w') as file:
+                file.write("Metadata-Version: 2.1\nName: exercise-plugin\nVersion: 1.0\n")
+            with open(os.path.join(distribution_directory, 'entry_points.txt'), 'w') as file:
+                file.write("[test.pose_corrections]\n"
+                           "front_squat = exercise_correction.services.pose_correction.SquatPoseCorrection:"
+                           "SquatPoseCorrection\n"
+                           "broken = exercise_correction.services.missing_module:MissingPoseCorrection\n")
+
+            sys.path.insert(0, directory)
+            try:
+                self.registry.load_entry_points('test.pose_corrections')
+            finally:
+                sys.path.remove(directory)
+
+        self.assertIsInstance(self.registry.get('front_squat'), SquatPoseCorrection)
+        self.assertIsNone(self.registry.get('broken'))
+        self.assertIn('broken', self.registry.get_load_errors())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from exercise_correction.services.landmarks_extractor.PoseGraphPool import PoseGraphPool
+
+
+class FakeGraph:
+    def __init__(self, model_complexity):
+        self.model_complexity = model_complexity
+        self.resets = 0
+        self.closed = False
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestPoseGraphPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = PoseGraphPool(FakeGraph, max_idle_graphs=1)
+
+    def test_reuses_released_graphs(self):
+        with self.pool.acquire(1) as graph:
+            self.assertEqual(graph.model_complexity, 1)
+            self.assertEqual(self.pool.get_graph_counts(), {('1', 'in_use'): 1, ('1', 'idle'): 0})
+
+        self.assertEqual(graph.resets, 1)
+        self.assertEqual(self.pool.get_graph_counts(), {('1', 'in_use'): 0, ('1', 'idle'): 1})
+
+        with self.pool.acquire(1) as reused_graph:
+            self.assertIs(reused_graph, graph)
+
+        with self.pool.acquire(2) as other_graph:
+            self.assertIsNot(other_graph, graph)
+
+        self.assertEqual(self.pool.get_acquisitions(), {('1', 'created'): 1, ('1', 'reused'): 1, ('2', 'created'): 1})
+        self.assertEqual(set(self.pool.get_busy_seconds()), {('1',), ('2',)})
+
+    def test_closes_graphs_beyond_max_idle(self):
+        with self.pool.acquire(0) as first_graph, self.pool.acquire(0) as second_graph:
+            self.assertIsNot(first_graph, second_graph)
+
+        # the second graph is released first and kept, the first one does not fit in the pool anymore
+        self.assertFalse(second_graph.closed)
+        self.assertTrue(first_graph.closed)
+        self.assertEqual(self.pool.get_graph_counts()[('0', 'idle')], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from exercise_correction.services.landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from exercise_correction.services.landmarks_extractor.PrefetchingLandmarksExtractor import \
+    PrefetchingLandmarksExtractor
+
+
+class CountingLandmarksExtractor(LandmarksExtractor):
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def iter_landmarks_from_video(self, video_path):
+        self.runs += 1
+        for frame_index in [0, 1, 3, 4, 6]:
+            yield frame_index, [(0.25 * frame_index, 0.5, -0.125, 0.75)] * 33
+        self._total_frames = 7
+
+
+class TestPrefetchingLandmarksExtractor(unittest.TestCase):
+    def setUp(self):
+        self.wrapped_extractor = CountingLandmarksExtractor()
+        self.landmarks_extractor = PrefetchingLandmarksExtractor(self.wrapped_extractor)
+
+    def test_prefetched_landmarks_are_not_extracted_again(self):
+        prefetched_landmarks = self.landmarks_extractor.prefetch('video.mp4', 2)
+        self.assertEqual(list(prefetched_landmarks), [0, 1])
+
+        self.landmarks_extractor.extract_landmarks_from_video('video.mp4')
+        self.assertEqual(list(self.landmarks_extractor.get_landmarks_dictionary()), [0, 1, 3, 4, 6])
+        self.assertEqual(self.landmarks_extractor.get_total_frames(), 7)
+        self.assertEqual(self.wrapped_extractor.runs, 1)
+
+    def test_prefetch_more_frames_than_detected(self):
+        self.assertEqual(len(self.landmarks_extractor.prefetch('video.mp4', 10)), 5)
+        self.assertEqual(len(list(self.landmarks_extractor.iter_landmark_blocks('video.mp4', 2))), 3)
+        self.assertEqual(self.wrapped_extractor.runs, 1)
+
+    def test_extraction_without_prefetch(self):
+        self.landmarks_extractor.extract_landmarks_from_video('video.mp4')
+        self.assertEqual(len(self.landmarks_extractor.get_landmarks_dictionary()), 5)
+
+        # the prefetched landmarks are only handed over once
+        self.landmarks_extractor.prefetch('video.mp4', 2)
+        self.landmarks_extractor.extract_landmarks_from_video('video.mp4')
+        self.landmarks_extractor.extract_landmarks_from_video('video.mp4')
+        self.assertEqual(len(self.landmarks_extractor.get_landmarks_dictionary()), 5)
+        self.assertEqual(self.wrapped_extractor.runs, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
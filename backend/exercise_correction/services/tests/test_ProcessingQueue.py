@@ -0,0 +1,33 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from exercise_correction.services.scheduling.ProcessingQueue import ProcessingQueue
+
+
+class TestProcessingQueue(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.processing_queue = ProcessingQueue(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_tracked_jobs_are_counted(self):
+        self.assertEqual(self.processing_queue.get_depth(), 0)
+        with self.processing_queue.track_job():
+            with self.processing_queue.track_job():
+                self.assertEqual(self.processing_queue.get_depth(), 2)
+        self.assertEqual(self.processing_queue.get_depth(), 0)
+
+    def test_files_which_are_not_job_markers_are_ignored(self):
+        for file_name in ['stray.job', 'stray_file.job', '.job', 'notes.txt']:
+            open(os.path.join(self.directory, file_name), 'w').close()
+
+        with self.processing_queue.track_job():
+            self.assertEqual(self.processing_queue.get_depth(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
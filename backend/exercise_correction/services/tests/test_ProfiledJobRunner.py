@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+
+from exercise_correction.services.monitoring.ProfiledJobRunner import ProfiledJobRunner
+from exercise_correction.services.monitoring.StageTimer import StageTimer
+
+
+def job(stage_timer):
+    with stage_timer.stage('angles', frames=10):
+        yield os.getpid()
+
+
+def failing_job(stage_timer):
+    raise ValueError("failed")
+
+
+class TestProfiledJobRunner(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.profile_path = os.path.join(self.directory.name, 'video.profile.folded')
+        self.memory_report_path = os.path.join(self.directory.name, 'video.memory.txt')
+        self.runner = ProfiledJobRunner(self.profile_path, self.memory_report_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_run(self):
+        stage_timer = StageTimer()
+        result = self.runner.run(job, stage_timer)
+
+        # the job runs in a process of its own and its iterator is consumed there
+        self.assertEqual(len(result), 1)
+        self.assertNotEqual(result[0], os.getpid())
+        self.assertEqual(stage_timer.get_stages()['angles']['frames'], 10)
+        self.assertTrue(os.path.isfile(self.profile_path))
+        self.assertTrue(os.path.isfile(self.memory_report_path))
+
+    def test_run_failing_job(self):
+        with self.assertRaises(ValueError):
+            self.runner.run(failing_job)
+
+        self.assertTrue(os.path.isfile(self.memory_report_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.constants import BLAZE_POSE_LANDMARKS
+from exercise_correction.services.pose_correction.PoseAnalyzer import PoseAnalyzer
+from exercise_correction.services.rules.RepetitionMetrics import RepetitionMetrics
+
+
+class TestRepetitionMetrics(unittest.TestCase):
+    def setUp(self):
+        self.angles = {12: 170, 10: 150, 11: 12, 13: 60, 15: 60, 16: 140}
+        self.landmarks = {frame: [(0, 0.5, 0)] * 33 for frame in self.angles}
+        self.landmarks[13] = [(0, 0.6, 0)] * 33
+        self.metrics = RepetitionMetrics.from_dictionaries(self.landmarks, {'right_hip_knee_ankle': self.angles},
+                                                           PoseAnalyzer(), 'right_hip_knee_ankle', 135, 15)
+
+    def test_is_metric(self):
+        self.assertTrue(RepetitionMetrics.is_metric('head_pitch'))
+        self.assertTrue(RepetitionMetrics.is_metric('eccentric_concentric_ratio'))
+        self.assertTrue(RepetitionMetrics.is_metric('right_hip_knee_ankle'))
+        self.assertTrue(RepetitionMetrics.is_metric('heel_height_speed'))
+        self.assertTrue(RepetitionMetrics.is_metric('right_hip_knee_ankle_acceleration'))
+        self.assertFalse(RepetitionMetrics.is_metric('eccentric_concentric_ratio_velocity'))
+        self.assertFalse(RepetitionMetrics.is_metric('unknown'))
+        self.assertFalse(RepetitionMetrics.is_metric('_speed'))
+
+    def test_get_metric_follows_landmarks_order(self):
+        np.testing.assert_array_equal(self.metrics.get_metric('right_hip_knee_ankle'), list(self.angles.values()))
+
+    def test_get_frame_selection(self):
+        np.testing.assert_array_equal(self.metrics.get_frame_selection('under_tension'),
+                                      [False, False, True, True, True, False])
+        np.testing.assert_array_equal(self.metrics.get_frame_selection('above_error_threshold'),
+                                      [True, True, False, True, True, True])
+        self.assertTrue(self.metrics.get_frame_selection('all').all())
+
+    def test_derived_metrics(self):
+        np.testing.assert_array_equal(self.metrics.get_metric('right_hip_knee_ankle_velocity'),
+                                      [4740, np.nan, -4140, -3300, np.nan, 2400])
+        np.testing.assert_array_equal(self.metrics.get_metric('right_hip_knee_ankle_speed'),
+                                      [4740, np.nan, 4140, 3300, np.nan, 2400])
+        np.testing.assert_array_equal(self.metrics.get_metric('right_hip_knee_ankle_acceleration'),
+                                      [266400, np.nan, np.nan, -241200, np.nan, np.nan])
+
+    def test_get_bottom_index(self):
+        self.assertEqual(self.metrics.get_bottom_index(), 3)
+
+    def test_heel_height_speed(self):
+        speeds = self.metrics.get_metric('heel_height_speed')
+        np.testing.assert_allclose(speeds, [0, np.nan, 0, 3, np.nan, 0])
+
+    def test_trunk_vertical_angle(self):
+        landmarks = [(0, 0, 0)] * 33
+        landmarks[BLAZE_POSE_LANDMARKS['right shoulder']] = (1, 1, 0)
+        metrics = RepetitionMetrics.from_dictionaries({0: landmarks}, dict(), PoseAnalyzer(), 'right_hip_knee_ankle',
+                                                      135, 15)
+        self.assertAlmostEqual(metrics.get_metric('trunk_vertical_angle')[0], 45)
+
+    def test_missing_angles_are_computed_from_landmarks(self):
+        pose_analyzer = PoseAnalyzer()
+        landmarks = [(0.5, 0.5, 0)] * 33
+        landmarks[BLAZE_POSE_LANDMARKS['right shoulder']] = (0.5, 0.2, 0)
+        landmarks[BLAZE_POSE_LANDMARKS['right knee']] = (0.7, 0.6, 0)
+        metrics = RepetitionMetrics.from_dictionaries({0: landmarks}, dict(), pose_analyzer, 'right_hip_knee_ankle',
+                                                      135, 15)
+        self.assertAlmostEqual(metrics.get_metric('right_shoulder_hip_knee')[0],
+                               pose_analyzer.compute_right_shoulder_hip_knee_angle(landmarks))
+
+    def test_views_of_video_arrays(self):
+        frames = np.arange(10, 20)
+        landmarks = np.zeros((10, 33, 3))
+        angles = np.linspace(170, 80, 10)
+        metrics = RepetitionMetrics(frames[2:6], landmarks[2:6], {'right_hip_knee_ankle': angles[2:6]}, PoseAnalyzer(),
+                                    'right_hip_knee_ankle', 135, 15)
+
+        self.assertEqual(metrics.get_bottom_index(), 3)
+        self.assertTrue(np.shares_memory(metrics.get_metric('right_hip_knee_ankle'), angles))
+
+    def test_features_are_computed_once_on_demand(self):
+        self.assertEqual(self.metrics.get_computed_features(), [])
+
+        trunk_tibia_angle_differences = self.metrics.get_metric('trunk_tibia_angle_difference')
+        self.assertIs(self.metrics.get_metric('trunk_tibia_angle_difference'), trunk_tibia_angle_differences)
+        self.assertCountEqual(self.metrics.get_computed_features(),
+                              ['trunk_vertical_angle', 'tibia_vertical_angle', 'trunk_tibia_angle_difference'])
+
+        self.metrics.get_bottom_index()
+        self.assertNotIn('head_pitch', self.metrics.get_computed_features())
+        self.assertIn('right_hip_knee_ankle', self.metrics.get_computed_features())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from exercise_correction.services.landmarks_extractor.LandmarksExtractor import LandmarksExtractor
+from exercise_correction.services.landmarks_extractor.ReplayLandmarksExtractor import ReplayLandmarksExtractor
+
+
+class CountingLandmarksExtractor(LandmarksExtractor):
+    runs = 0
+
+    def iter_landmarks_from_video(self, video_path):
+        CountingLandmarksExtractor.runs += 1
+        for frame_index in [0, 1, 3]:
+            yield frame_index, [(0.25 * frame_index, 0.5, -0.125, 0.75)] * 33
+        self._total_frames = 4
+
+
+class TestReplayLandmarksExtractor(unittest.TestCase):
+    def setUp(self):
+        CountingLandmarksExtractor.runs = 0
+        self.directory = tempfile.mkdtemp()
+        self.recordings_directory = os.path.join(self.directory, 'recordings')
+        self.video_path = os.path.join(self.directory, 'video.mp4')
+        with open(self.video_path, 'wb') as file:
+            file.write(b'video content')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def create_extractor(self, recording_key=''):
+        return ReplayLandmarksExtractor(self.recordings_directory, CountingLandmarksExtractor, recording_key)
+
+    def test_record_then_replay(self):
+        recording_extractor = self.create_extractor()
+        recording_extractor.extract_landmarks_from_video(self.video_path)
+        self.assertTrue(os.path.isfile(recording_extractor.get_recording_path(self.video_path)))
+
+        replay_extractor = self.create_extractor()
+        replay_extractor.extract_landmarks_from_video(self.video_path)
+
+        self.assertEqual(CountingLandmarksExtractor.runs, 1)
+        self.assertEqual(replay_extractor.get_landmarks_dictionary(), recording_extractor.get_landmarks_dictionary())
+        self.assertEqual(replay_extractor.get_total_frames(), 4)
+
+    def test_recording_is_written_in_chunks(self):
+        recording_extractor = self.create_extractor()
+        recording_extractor.RECORDING_CHUNK_SIZE = 2
+        recording_extractor.extract_landmarks_from_video(self.video_path)
+
+        # only the recording is left once it is made
+        self.assertEqual(os.listdir(self.recordings_directory),
+                         [os.path.basename(recording_extractor.get_recording_path(self.video_path))])
+
+        replay_extractor = self.create_extractor()
+        replay_extractor.extract_landmarks_from_video(self.video_path)
+        self.assertEqual(CountingLandmarksExtractor.runs, 1)
+        self.assertEqual(replay_extractor.get_landmarks_dictionary(), recording_extractor.get_landmarks_dictionary())
+
+    def test_recording_key(self):
+        self.create_extractor('complexity1').extract_landmarks_from_video(self.video_path)
+        self.create_extractor('complexity2').extract_landmarks_from_video(self.video_path)
+        self.assertEqual(CountingLandmarksExtractor.runs, 2)
+
+    def test_changed_video_is_recorded_again(self):
+        self.create_extractor().extract_landmarks_from_video(self.video_path)
+        with open(self.video_path, 'ab') as file:
+            file.write(b' changed')
+        self.create_extractor().extract_landmarks_from_video(self.video_path)
+        self.assertEqual(CountingLandmarksExtractor.runs, 2)
+
+    def test_save_recording(self):
+        extractor = self.create_extractor()
+        landmarks = [[(0.5, 0.25, 0.0, 1.0)] * 33, [(0.75, 0.5, 0.0, 0.25)] * 33]
+        extractor.save_recording(extractor.get_recording_path(self.video_path), [2, 5], landmarks, 6)
+
+        extractor.extract_landmarks_from_video(self.video_path)
+
+        self.assertEqual(CountingLandmarksExtractor.runs, 0)
+        self.assertEqual(extractor.get_landmarks_dictionary(), {2: landmarks[0], 5: landmarks[1]})
+        self.assertEqual(extractor.get_total_frames(), 6)
+        self.assertEqual(extractor.get_frame_timestamps(), [])
+
+    def test_replay_frame_timestamps(self):
+        extractor = self.create_extractor()
+        landmarks = [[(0.5, 0.25, 0.0, 1.0)] * 33]
+        extractor.save_recording(extractor.get_recording_path(self.video_path), [1], landmarks, 3,
+                                 [0.0, 0.0625, 0.125])
+
+        extractor.extract_landmarks_from_video(self.video_path)
+
+        self.assertEqual(extractor.get_frame_timestamps(), [0.0, 0.0625, 0.125])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from exercise_correction.services.exception.custom_exceptions import RuleSetError
+from exercise_correction.services.rules.RuleSetRepository import RuleSetRepository
+
+
+def create_rule_set(version, threshold):
+    return {'version': version, 'exercises': {'squat': [{
+        'category': 'squat_depth',
+        'metric': 'right_hip_knee_ankle',
+        'bands': [{'above': threshold, 'advice': 'deeper', 'correction_level': 2}],
+        'otherwise': {'advice': 'good', 'correction_level': 1},
+    }]}}
+
+
+class TestRuleSetRepository(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, 'rules.json')
+        self.modification_time = 1_000_000_000
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_rule_set(self, content):
+        with open(self.file_path, 'w') as file:
+            file.write(content if isinstance(content, str) else json.dumps(content))
+
+        # a distinct modification time for every write, however quickly the file is rewritten
+        self.modification_time += 1
+        os.utime(self.file_path, ns=(self.modification_time, self.modification_time))
+
+    def test_reloads_changed_file(self):
+        self.write_rule_set(create_rule_set('1', 90))
+        repository = RuleSetRepository(self.file_path)
+
+        rule_set = repository.get_rule_set()
+        self.assertEqual(rule_set.get_version(), '1')
+        self.assertIs(repository.get_rule_set(), rule_set)
+
+        self.write_rule_set(create_rule_set('2', 100))
+        self.assertEqual(repository.get_rule_set().get_version(), '2')
+        self.assertEqual(repository.get_rule_set().get_rule('squat', 'squat_depth').classify_value(95), ('good', 1))
+
+        # a version already compiled is reused
+        self.write_rule_set(create_rule_set('1', 90))
+        self.assertIs(repository.get_rule_set(), rule_set)
+
+    def test_keeps_previous_rule_set_when_file_is_invalid(self):
+        self.write_rule_set(create_rule_set('1', 90))
+        repository = RuleSetRepository(self.file_path)
+        rule_set = repository.get_rule_set()
+
+        self.write_rule_set('{"version": "2", ')
+        self.assertIs(repository.get_rule_set(), rule_set)
+        self.assertIsNotNone(repository.get_load_error())
+
+        self.write_rule_set(create_rule_set('2', 100))
+        self.assertEqual(repository.get_rule_set().get_version(), '2')
+        self.assertIsNone(repository.get_load_error())
+
+    def test_keeps_previous_rule_set_when_rules_are_invalid(self):
+        self.write_rule_set(create_rule_set('1', 90))
+        repository = RuleSetRepository(self.file_path)
+        rule_set = repository.get_rule_set()
+
+        rules = create_rule_set('2', 100)['exercises']['squat']
+        for invalid_rules in (['squat_depth'], [dict(rules[0], bands=[{'above': None, 'advice': 'deeper',
+                                                                        'correction_level': 2}])],
+                              [dict(rules[0], views=[['side']])], [dict(rules[0], initial='90')],
+                              [dict(rules[0], max_speed=[1])], [dict(rules[0], stop_at_correction_level=2.5)]):
+            with self.subTest(rules=invalid_rules):
+                self.write_rule_set({'version': '2', 'exercises': {'squat': invalid_rules}})
+                self.assertIs(repository.get_rule_set(), rule_set)
+                self.assertIsNotNone(repository.get_load_error())
+
+    def test_rejects_changed_rules_of_same_version(self):
+        self.write_rule_set(create_rule_set('1', 90))
+        repository = RuleSetRepository(self.file_path)
+        rule_set = repository.get_rule_set()
+
+        self.write_rule_set(create_rule_set('1', 100))
+        self.assertIs(repository.get_rule_set(), rule_set)
+        self.assertIn("changed without a new version", repository.get_load_error())
+
+        self.write_rule_set(create_rule_set('2', 100))
+        self.assertEqual(repository.get_rule_set().get_version(), '2')
+        self.assertIsNone(repository.get_load_error())
+
+    def test_missing_file(self):
+        with self.assertRaises(RuleSetError):
+            RuleSetRepository(self.file_path).get_rule_set()
+
+    def test_pickle(self):
+        self.write_rule_set(create_rule_set('1', 90))
+        repository = pickle.loads(pickle.dumps(RuleSetRepository(self.file_path)))
+        self.assertEqual(repository.get_rule_set().get_version(), '1')
+
+
+if __name__ == "__main__":
+    unittest.main()
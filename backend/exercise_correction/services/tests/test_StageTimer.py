@@ -0,0 +1,66 @@
+import json
+import os
+import tempfile
+import unittest
+
+from exercise_correction.services.monitoring.StageTimer import StageTimer
+from exercise_correction.services.monitoring.Tracer import Tracer
+
+
+class TestStageTimer(unittest.TestCase):
+    def setUp(self):
+        self.stage_timer = StageTimer()
+
+    def test_stage(self):
+        with self.stage_timer.stage('angles', frames=10):
+            sum(range(10000))
+
+        stages = self.stage_timer.get_stages()
+        self.assertEqual(list(stages.keys()), ['angles'])
+        self.assertGreater(stages['angles']['wall_seconds'], 0)
+        self.assertEqual(stages['angles']['frames'], 10)
+        self.assertEqual(stages['angles']['bytes_written'], 0)
+
+    def test_stages_accumulate(self):
+        for _ in range(3):
+            with self.stage_timer.stage('decoding', frames=1):
+                pass
+        self.stage_timer.add('decoding', wall_seconds=1.0, bytes_written=100)
+
+        stages = self.stage_timer.get_stages()
+        self.assertEqual(stages['decoding']['frames'], 3)
+        self.assertEqual(stages['decoding']['bytes_written'], 100)
+        self.assertGreaterEqual(self.stage_timer.get_total_wall_seconds(), 1.0)
+
+    def test_stage_timed_on_exception(self):
+        with self.assertRaises(ValueError):
+            with self.stage_timer.stage('advice'):
+                raise ValueError()
+        self.assertIn('advice', self.stage_timer.get_stages())
+
+    def test_get_stages_returns_copies(self):
+        self.stage_timer.add('database', wall_seconds=1.0)
+        self.stage_timer.get_stages()['database']['wall_seconds'] = 5.0
+        self.assertEqual(self.stage_timer.get_stages()['database']['wall_seconds'], 1.0)
+
+    def test_traced_stages(self):
+        with tempfile.TemporaryDirectory() as directory:
+            trace_file = os.path.join(directory, 'traces.jsonl')
+            stage_timer = StageTimer(Tracer(trace_file))
+
+            with stage_timer.span('job'):
+                with stage_timer.stage('angles', frames=10):
+                    pass
+                with stage_timer.stage('inference', frames=1, traced=False):
+                    pass
+
+            with open(trace_file, 'r') as file:
+                events = [json.loads(line) for line in file]
+
+        self.assertEqual([event['name'] for event in events], ['angles', 'job'])
+        self.assertEqual(events[0]['args']['frames'], 10)
+        self.assertEqual(list(stage_timer.get_stages()), ['angles', 'inference'])
+
+
+if __name__ == "__main__":
+    unittest.main()
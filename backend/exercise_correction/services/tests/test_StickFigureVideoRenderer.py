@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+
+import cv2
+
+from exercise_correction.services.synthetic.StickFigureVideoRenderer import StickFigureVideoRenderer
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class TestStickFigureVideoRenderer(unittest.TestCase):
+    def test_render(self):
+        generator = SyntheticPoseGenerator('bicep_curl', repetitions=1, fps=10)
+        renderer = StickFigureVideoRenderer(160, 120, fps=10)
+
+        with tempfile.TemporaryDirectory() as directory:
+            video_path = os.path.join(directory, 'curl.mp4')
+            frame_count = renderer.render(generator, video_path, block_size=7)
+
+            cap = cv2.VideoCapture(video_path)
+            self.assertEqual(frame_count, generator.get_total_frames())
+            self.assertEqual(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), frame_count)
+            self.assertEqual(int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), 160)
+            self.assertEqual(int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)), 120)
+
+            # the figure is drawn over the background
+            success, image = cap.read()
+            cap.release()
+            self.assertTrue(success)
+            self.assertLess(image.min(), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
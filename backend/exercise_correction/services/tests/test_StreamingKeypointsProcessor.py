@@ -0,0 +1,53 @@
+import unittest
+
+from exercise_correction.services.landmarks_extractor.StreamingKeypointsProcessor import StreamingKeypointsProcessor
+
+
+class TestStreamingKeypointsProcessor(unittest.TestCase):
+    def setUp(self):
+        self.processor = StreamingKeypointsProcessor(threshold=0.5)
+
+    def test_process_block_interpolates_missing_keypoints(self):
+        data = {
+            0: [(1, 2, 3, 0.9), (4, 5, 6, 0.6)],
+            1: [(7, 8, 9, 0.3), (10, 11, 12, 0.7)],
+            2: [(13, 14, 15, 0.9), (25, 14, 1, 0.2)],
+            3: [(13, 14, 15, 0.9), (16, 17, 18, 0.8)]
+        }
+        expected_output = {
+            0: [[1, 2, 3], [4, 5, 6]],
+            1: [[7, 8, 9], [10, 11, 12]],
+            2: [[13, 14, 15], [13, 14, 15]],
+            3: [[13, 14, 15], [16, 17, 18]]
+        }
+
+        self.assertEqual(self.processor.process_block(data), expected_output)
+
+    def test_process_block_retains_frames_waiting_for_keypoints(self):
+        first_block = {0: [(0, 0, 0, 0.9)], 1: [(0, 0, 0, 0.1)]}
+        second_block = {2: [(2, 4, 6, 0.9)]}
+
+        self.assertEqual(self.processor.process_block(first_block), {0: [[0, 0, 0]]})
+        self.assertEqual(self.processor.process_block(second_block), {1: [[1, 2, 3]], 2: [[2, 4, 6]]})
+
+    def test_flush_holds_last_valid_keypoints(self):
+        self.processor.process_block({0: [(1, 1, 1, 0.9), (2, 2, 2, 0.1)], 1: [(3, 3, 3, 0.1), (2, 2, 2, 0.1)]})
+        self.assertEqual(self.processor.flush(), {0: [[1, 1, 1], None], 1: [[1, 1, 1], None]})
+
+    def test_only_given_keypoints_are_processed(self):
+        processor = StreamingKeypointsProcessor(threshold=0.5, keypoint_indices=[1])
+        data = {0: [(1, 1, 1, 0.9), (2, 2, 2, 0.9)], 1: [(3, 3, 3, 0.9), (4, 4, 4, 0.1)],
+                2: [(5, 5, 5, 0.9), (6, 6, 6, 0.9)]}
+        self.assertEqual(processor.process_block(data), {0: [None, [2, 2, 2]], 1: [None, [4, 4, 4]],
+                                                         2: [None, [6, 6, 6]]})
+
+    def test_max_gap_bounds_retained_frames(self):
+        processor = StreamingKeypointsProcessor(threshold=0.5, max_gap=2)
+        data = {frame: [(frame, frame, frame, 0.9 if frame == 0 else 0.1)] for frame in range(5)}
+        processed_data = processor.process_block(data)
+        self.assertEqual(list(processed_data.keys()), [0, 1, 2])
+        self.assertEqual(processed_data[2], [[0, 0, 0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from exercise_correction.services.pose_correction.AnglesAnalyzer import AnglesAnalyzer
+from exercise_correction.services.pose_correction.BicepCurlPoseCorrection import BicepCurlPoseCorrection
+from exercise_correction.services.pose_correction.KinematicFeatures import KinematicFeatures
+from exercise_correction.services.pose_correction.PoseAnalyzer import PoseAnalyzer
+from exercise_correction.services.pose_correction.PushupPoseCorrection import PushUpPoseCorrection
+from exercise_correction.services.pose_correction.SquatPoseCorrection import SquatPoseCorrection
+from exercise_correction.services.synthetic.SyntheticPoseGenerator import SyntheticPoseGenerator
+
+
+class TestSyntheticPoseGenerator(unittest.TestCase):
+    EXERCISES = [
+        ('squat', SquatPoseCorrection, 'right_hip_knee_ankle'),
+        ('bicep_curl', BicepCurlPoseCorrection, 'right_shoulder_elbow_wrist'),
+        ('pushup', PushUpPoseCorrection, 'right_shoulder_elbow_wrist'),
+    ]
+
+    def test_joint_angles(self):
+        pose_analyzer = PoseAnalyzer()
+        for exercise_type, _, angle_name in self.EXERCISES:
+            generator = SyntheticPoseGenerator(exercise_type, repetitions=2)
+            landmarks = generator.generate_array()
+            angles = [getattr(pose_analyzer, f'compute_{angle_name}_angle')(frame_landmarks)
+                      for frame_landmarks in landmarks.tolist()]
+            expected_angles = generator.compute_joint_angles(np.arange(generator.get_total_frames()))
+            np.testing.assert_allclose(angles, expected_angles, atol=1e-6)
+
+    def test_repetition_segmentation(self):
+        for exercise_type, pose_correction_class, angle_name in self.EXERCISES:
+            pose_correction = pose_correction_class()
+            generator = SyntheticPoseGenerator(exercise_type, repetitions=5, seed=0)
+            angles_analyzer = AnglesAnalyzer(generator.generate_landmarks_dictionary(), PoseAnalyzer())
+            angles_analyzer.compute_angles([angle_name])
+
+            split_frames = angles_analyzer.get_repetition_split_frames(
+                angles_analyzer.get_angles()[angle_name], pose_correction._REPETITION_START_THRESHOLD,
+                pose_correction._ERROR_THRESHOLD,
+                KinematicFeatures.get_change_per_frame(pose_correction._CHANGE_THRESHOLD))
+            self.assertEqual(len(split_frames), 4)
+
+    def test_landmarks_shape(self):
+        generator = SyntheticPoseGenerator('squat', repetitions=3, fps=10, dropout=0.2, seed=0)
+        landmarks_dictionary = generator.generate_landmarks_dictionary()
+        self.assertEqual(list(landmarks_dictionary.keys()), list(range(generator.get_total_frames())))
+        self.assertEqual(len(landmarks_dictionary[0]), 33)
+        self.assertEqual(len(landmarks_dictionary[0][0]), 4)
+
+        visibility = np.array([[values[3] for values in landmarks] for landmarks in landmarks_dictionary.values()])
+        self.assertAlmostEqual(np.mean(visibility < 0.5), 0.2, delta=0.05)
+
+    def test_blocks_do_not_change_sequence(self):
+        generator = SyntheticPoseGenerator('pushup', repetitions=2, noise=0.01, dropout=0.1, seed=42)
+        small_blocks = np.concatenate([landmarks for _, landmarks in generator.iter_landmark_arrays(7)])
+        large_blocks = np.concatenate([landmarks for _, landmarks in generator.iter_landmark_arrays(1000)])
+        np.testing.assert_array_equal(small_blocks, large_blocks)
+
+    def test_for_frame_count(self):
+        generator = SyntheticPoseGenerator.for_frame_count('bicep_curl', 10000)
+        self.assertGreaterEqual(generator.get_total_frames(), 10000)
+        self.assertLess(generator.get_total_frames() - 10000, 105)
+
+    def test_unknown_exercise(self):
+        with self.assertRaises(ValueError):
+            SyntheticPoseGenerator('deadlift')
+
+
+if __name__ == "__main__":
+    unittest.main()
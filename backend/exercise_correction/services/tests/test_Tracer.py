@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from exercise_correction.services.monitoring.Tracer import Tracer
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, 'traces.jsonl')
+        self.tracer = Tracer(self.file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_events(self):
+        with open(self.file_path, 'r') as file:
+            return [json.loads(line) for line in file]
+
+    def test_nested_spans(self):
+        with self.tracer.span('request', category='http') as trace_id:
+            with self.tracer.span('job', exercise_type='squat'):
+                self.assertEqual(Tracer.get_trace_id(), trace_id)
+                with self.tracer.span('angles'):
+                    pass
+            # nothing is written before the outermost span ends
+            self.assertFalse(os.path.exists(self.file_path))
+
+        events = {event['name']: event for event in self.read_events()}
+        self.assertEqual(set(events), {'request', 'job', 'angles'})
+        self.assertTrue(all(event['ph'] == 'X' and event['args']['trace_id'] == trace_id
+                            for event in events.values()))
+        self.assertIsNone(events['request']['args']['parent_id'])
+        self.assertEqual(events['job']['args']['parent_id'], events['request']['args']['span_id'])
+        self.assertEqual(events['angles']['args']['parent_id'], events['job']['args']['span_id'])
+        self.assertEqual(events['job']['args']['exercise_type'], 'squat')
+        self.assertEqual(events['request']['cat'], 'http')
+        self.assertLessEqual(events['request']['ts'], events['job']['ts'])
+        self.assertIsNone(Tracer.get_trace_id())
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            with self.tracer.span('request'):
+                raise ValueError()
+
+        self.assertEqual(self.read_events()[0]['args']['error'], 'ValueError')
+
+    def test_load_trace(self):
+        with self.tracer.span('request') as first_trace_id:
+            with self.tracer.span('job'):
+                pass
+        with self.tracer.span('request'):
+            pass
+
+        events = Tracer.load_trace(self.file_path, first_trace_id)
+        self.assertEqual([event['name'] for event in events], ['request', 'job'])
+
+        chrome_trace_path = os.path.join(self.directory, 'trace.json')
+        Tracer.save_chrome_trace(events, chrome_trace_path)
+        with open(chrome_trace_path, 'r') as file:
+            self.assertEqual(len(json.load(file)['traceEvents']), 2)
+
+    def test_disabled(self):
+        tracer = Tracer()
+        with tracer.span('request') as trace_id:
+            self.assertIsNone(trace_id)
+
+        self.assertFalse(tracer.is_enabled())
+        self.assertFalse(os.path.exists(self.file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import cv2
+import numpy as np
+
+from exercise_correction.services.exception.custom_exceptions import VideoProbeError
+from exercise_correction.services.scheduling.VideoProber import VideoProber
+
+
+class TestVideoProber(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.video_path = os.path.join(self.directory, 'video.mp4')
+        writer = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*'mp4v'), 30, (160, 120))
+        for frame in range(60):
+            writer.write(np.full((120, 160, 3), frame * 4, dtype=np.uint8))
+        writer.release()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_probe(self):
+        video_properties = VideoProber(60, (1920, 1080)).probe(self.video_path)
+
+        self.assertEqual(video_properties['fps'], 30)
+        self.assertEqual(video_properties['frame_count'], 60)
+        self.assertEqual((video_properties['width'], video_properties['height']), (160, 120))
+        self.assertEqual(video_properties['duration'], 2)
+
+    def test_pose_is_detected_on_sampled_frames(self):
+        sampled_images = []
+
+        def detect_pose(image):
+            sampled_images.append(image)
+            return False
+
+        with self.assertRaisesRegex(VideoProbeError, "No person"):
+            VideoProber(60, (1920, 1080), sampled_frames=3, pose_detector=detect_pose).probe(self.video_path)
+
+        # the frames are sampled across the whole video
+        self.assertEqual(len(sampled_images), 3)
+        self.assertLess(sampled_images[0].mean(), 10)
+        self.assertGreater(sampled_images[-1].mean(), 200)
+
+        VideoProber(60, (1920, 1080), pose_detector=lambda image: image.mean() > 100).probe(self.video_path)
+
+    def test_length_is_measured_without_frame_count(self):
+        # the raw MJPEG streams have no frame count, and a frame rate of 25 is assumed
+        stream_path = os.path.join(self.directory, 'video.mjpeg')
+        with open(stream_path, 'wb') as file:
+            for frame in range(60):
+                file.write(cv2.imencode('.jpg', np.full((120, 160, 3), frame * 4, dtype=np.uint8))[1].tobytes())
+
+        video_properties = VideoProber(60, (1920, 1080)).probe(stream_path)
+        self.assertEqual(video_properties['frame_count'], 60)
+        self.assertAlmostEqual(video_properties['duration'], 2.4)
+
+        # the frames are still sampled across the whole video
+        sampled_images = []
+        with self.assertRaisesRegex(VideoProbeError, "No person"):
+            VideoProber(60, (1920, 1080), pose_detector=lambda image: sampled_images.append(image)).probe(stream_path)
+        self.assertEqual(len(sampled_images), 5)
+        self.assertGreater(sampled_images[-1].mean(), 200)
+
+        with self.assertRaisesRegex(VideoProbeError, "longer than the maximum of 1 seconds"):
+            VideoProber(1, (1920, 1080)).probe(stream_path)
+
+    def test_too_long_video_is_rejected(self):
+        with self.assertRaisesRegex(VideoProbeError, "longer than the maximum of 1 seconds"):
+            VideoProber(1, (1920, 1080)).probe(self.video_path)
+
+    def test_too_high_resolution_is_rejected(self):
+        # the maximum resolution applies either way round
+        VideoProber(60, (120, 160)).probe(self.video_path)
+        with self.assertRaisesRegex(VideoProbeError, "resolution"):
+            VideoProber(60, (150, 150)).probe(self.video_path)
+
+    def test_invalid_video_is_rejected(self):
+        invalid_video_path = os.path.join(self.directory, 'invalid.mp4')
+        with open(invalid_video_path, 'wb') as file:
+            file.write(b'file_content')
+
+        with self.assertRaises(VideoProbeError):
+            VideoProber(60, (1920, 1080)).probe(invalid_video_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,106 +1,213 @@
-from django.urls import reverse
-from django.contrib.auth import get_user_model
-from django.core.files.uploadedfile import SimpleUploadedFile
-from rest_framework import status
-from rest_framework.test import APITestCase
-
-from exercise_correction.models.user_profile import UserProfile
-from exercise_correction.models.video import Video
-
-
-class RegisterViewTest(APITestCase):
-    def test_register_user(self):
-        url = reverse('register')
-        data = {
-            'username': 'testuser',
-            'password': 'testpass123',
-            'password2': 'testpass123',
-            'email': 'testuser@example.com'
-        }
-        response = self.client.post(url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-
-
-class ExercisesListViewTest(APITestCase):
-    def setUp(self):
-        self.url = reverse('exercises_list')
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.client.force_authenticate(user=self.user)
-
-    def test_get_exercises(self):
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertGreater(len(response.data), 0)
-
-
-class DeleteUserViewTest(APITestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('delete_account')
-
-    def test_delete_user(self):
-        response = self.client.delete(self.url)
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(get_user_model().objects.filter(username='testuser').exists())
-
-
-class UserProfileViewTest(APITestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.profile = UserProfile.objects.create(user=self.user, height_cm=170, weight_kg=70.0, gender='M')
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('user_profile')
-
-    def test_retrieve_user_profile(self):
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['height_cm'], 170)
-
-    def test_update_user_profile(self):
-        data = {'height_cm': 175}
-        response = self.client.patch(self.url, data, format='json')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.profile.refresh_from_db()
-        self.assertEqual(self.profile.height_cm, 175)
-
-
-class VideoSubmitViewTest(APITestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('video_submit')
-        self.video_file = SimpleUploadedFile("nothing.mp4", b"file_content", content_type="video/mp4")
-
-    def test_submit_video(self):
-        data = {'video': self.video_file, 'type': 'squat'}
-        response = self.client.post(self.url, data, format='multipart')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertFalse(Video.objects.filter(user=self.user).exists())
-
-
-class UserVideosListViewTest(APITestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.video = Video.objects.create(user=self.user, video='nothing.mp4', exercise_type='squat')
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('user_videos')
-
-    def test_list_user_videos(self):
-        response = self.client.get(self.url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], self.video.id)
-
-
-class VideoDeleteViewTest(APITestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
-        self.video = Video.objects.create(user=self.user, video='nothing.mp4', exercise_type='squat')
-        self.client.force_authenticate(user=self.user)
-        self.url = reverse('delete_video', args=[self.video.id])
-
-    def test_delete_video(self):
-        response = self.client.delete(self.url)
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Video.objects.filter(id=self.video.id).exists())
+from unittest import mock
+
+from django.test import override_settings
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from exercise_correction.models.processing_metrics import ProcessingMetrics
+from exercise_correction.models.user_profile import UserProfile
+from exercise_correction.models.video import Video
+from exercise_correction.services.exception.custom_exceptions import LandmarkExtractionError
+from exercise_correction.views.video import VideoSubmitView
+
+
+class RegisterViewTest(APITestCase):
+    def test_register_user(self):
+        url = reverse('register')
+        data = {
+            'username': 'testuser',
+            'password': 'testpass123',
+            'password2': 'testpass123',
+            'email': 'testuser@example.com'
+        }
+        response = self.client.post(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class ExercisesListViewTest(APITestCase):
+    def setUp(self):
+        self.url = reverse('exercises_list')
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.client.force_authenticate(user=self.user)
+
+    def test_get_exercises(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreater(len(response.data), 0)
+
+
+class DeleteUserViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('delete_account')
+
+    def test_delete_user(self):
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(get_user_model().objects.filter(username='testuser').exists())
+
+
+class UserProfileViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.profile = UserProfile.objects.create(user=self.user, height_cm=170, weight_kg=70.0, gender='M')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user_profile')
+
+    def test_retrieve_user_profile(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['height_cm'], 170)
+
+    def test_update_user_profile(self):
+        data = {'height_cm': 175}
+        response = self.client.patch(self.url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.height_cm, 175)
+
+
+class VideoSubmitViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('video_submit')
+        self.video_file = SimpleUploadedFile("nothing.mp4", b"file_content", content_type="video/mp4")
+
+    def test_submit_video(self):
+        data = {'video': self.video_file, 'type': 'squat'}
+        response = self.client.post(self.url, data, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Video.objects.filter(user=self.user).exists())
+
+    def test_submit_video_profile_requires_admin(self):
+        data = {'video': self.video_file, 'type': 'squat', 'profile': 'true'}
+        response = self.client.post(self.url, data, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Video.objects.filter(user=self.user).exists())
+
+    def test_submit_video_profile_requires_exercise_type(self):
+        self.user.is_staff = True
+        self.user.save()
+        data = {'video': self.video_file, 'type': 'auto', 'profile': 'true'}
+        response = self.client.post(self.url, data, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Video.objects.filter(user=self.user).exists())
+
+    @override_settings(STREAMING_PROCESSING_MIN_DURATION_SECONDS=0)
+    def test_streaming_processing_errors(self):
+        def process_video_stream(video_file, landmarks_extractor=None, rule_set=None, stage_timer=None):
+            yield 'repetition.mp4', {}
+            raise error
+
+        pose_correction = mock.Mock(process_video_stream=process_video_stream)
+        with mock.patch('exercise_correction.views.video.pose_correction_registry') as pose_correction_registry:
+            pose_correction_registry.get.return_value = pose_correction
+
+            # the errors raised while the repetitions are consumed are handled as the ones of the processing
+            error = RuntimeError("decoder failure")
+            outputs = VideoSubmitView.process_video('video.mp4', 'squat', landmarks_extractor=mock.Mock())
+            self.assertEqual(next(outputs), ('repetition.mp4', {}))
+            with self.assertRaisesRegex(Exception, "An unexpected error occurred while processing the video"):
+                next(outputs)
+
+            error = LandmarkExtractionError("No landmarks")
+            outputs = VideoSubmitView.process_video('video.mp4', 'squat', landmarks_extractor=mock.Mock())
+            with self.assertRaises(LandmarkExtractionError):
+                list(outputs)
+
+
+class UserVideosListViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.video = Video.objects.create(user=self.user, video='nothing.mp4', exercise_type='squat')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('user_videos')
+
+    def test_list_user_videos(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['id'], self.video.id)
+
+
+class VideoDeleteViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.video = Video.objects.create(user=self.user, video='nothing.mp4', exercise_type='squat')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('delete_video', args=[self.video.id])
+
+    def test_delete_video(self):
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Video.objects.filter(id=self.video.id).exists())
+
+
+class ProcessingMetricsSummaryViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345')
+        self.admin = get_user_model().objects.create_user(username='admin', password='12345', is_staff=True)
+        self.url = reverse('processing_metrics')
+
+        for total_wall_seconds, width in [(1.0, 640), (3.0, 640), (5.0, 1280)]:
+            video = Video.objects.create(user=self.user, video='nothing.mp4', exercise_type='squat')
+            ProcessingMetrics.objects.create(
+                video=video, width=width, height=480, frame_count=300, total_wall_seconds=total_wall_seconds,
+                stages={'inference': {'wall_seconds': total_wall_seconds / 2, 'cpu_seconds': 0.5, 'frames': 300,
+                                      'bytes_written': 0}}
+            )
+
+    def test_summary_requires_admin(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_summary_by_exercise_type_and_resolution(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(group['resolution'], group['count']) for group in response.data],
+                         [('1280x480', 1), ('640x480', 2)])
+        self.assertEqual(response.data[1]['total_wall_seconds']['p50'], 2.0)
+        self.assertEqual(response.data[1]['stages']['inference']['wall_seconds']['p50'], 1.0)
+        self.assertEqual(response.data[1]['stages']['inference']['frames'], 600)
+
+    def test_summary_filtered_by_exercise_type(self):
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url, {'type': 'pushup'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+
+@override_settings(METRICS_ALLOWED_IPS=())
+class MetricsViewTest(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='testuser', password='12345', is_staff=True)
+        self.client.force_authenticate(user=self.user)
+
+    def test_metrics_require_admin_or_internal_client(self):
+        self.user.is_staff = False
+        self.user.save()
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=None)
+        with override_settings(METRICS_ALLOWED_IPS=('127.0.0.1',)):
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_200_OK)
+
+    def test_metrics_exposition(self):
+        self.client.get(reverse('exercises_list'))
+
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+
+        content = response.content.decode()
+        self.assertIn('http_request_duration_seconds_count{view="exercises_list",method="GET",status="200"}', content)
+        self.assertIn('http_request_db_queries_count{view="exercises_list",method="GET"}', content)
+        self.assertIn('# TYPE processing_queue_depth gauge', content)
+        self.assertIn('processing_queue_depth ', content)
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.permissions import BasePermission, IsAdminUser
+from rest_framework.views import APIView
+
+from ..metrics import metrics_registry
+
+
+class IsInternalClient(BasePermission):
+    """
+    Allows the requests from the internal addresses of the settings, such as the ones of the metrics scrapers.
+    """
+    def has_permission(self, request, view):
+        return request.META.get('REMOTE_ADDR') in settings.METRICS_ALLOWED_IPS
+
+
+class MetricsView(APIView):
+    permission_classes = [IsAdminUser | IsInternalClient]
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request, *args, **kwargs):
+        return HttpResponse(metrics_registry.render(), content_type=self.CONTENT_TYPE)
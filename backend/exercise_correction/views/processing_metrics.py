@@ -0,0 +1,70 @@
+from collections import defaultdict
+
+import numpy as np
+
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from ..models.processing_metrics import ProcessingMetrics
+
+
+class ProcessingMetricsSummaryView(APIView):
+    permission_classes = [IsAdminUser]
+    PERCENTILES = (50, 90, 95, 99)
+
+    def get(self, request, *args, **kwargs):
+        queryset = ProcessingMetrics.objects.select_related('video')
+
+        exercise_type = request.query_params.get('type')
+        if exercise_type:
+            queryset = queryset.filter(video__exercise_type=exercise_type)
+
+        # group the metrics by exercise type and video resolution
+        groups = defaultdict(list)
+        for metrics in queryset:
+            groups[(metrics.video.exercise_type, metrics.get_resolution())].append(metrics)
+
+        summary = [self.summarize_group(exercise_type, resolution, group_metrics)
+                   for (exercise_type, resolution), group_metrics in sorted(groups.items())]
+
+        return Response(summary)
+
+    @staticmethod
+    def summarize_group(exercise_type, resolution, group_metrics):
+        """
+        Compute the percentiles of the total and per-stage processing times of a group of videos.
+        """
+        stage_values = defaultdict(lambda: defaultdict(list))
+        for metrics in group_metrics:
+            for stage, measurements in metrics.stages.items():
+                for measurement, value in measurements.items():
+                    stage_values[stage][measurement].append(value)
+
+        return {
+            'exercise_type': exercise_type,
+            'resolution': resolution,
+            'count': len(group_metrics),
+            'total_wall_seconds': ProcessingMetricsSummaryView.compute_percentiles(
+                [metrics.total_wall_seconds for metrics in group_metrics]),
+            'stages': {
+                stage: {
+                    'wall_seconds': ProcessingMetricsSummaryView.compute_percentiles(measurements['wall_seconds']),
+                    'cpu_seconds': ProcessingMetricsSummaryView.compute_percentiles(measurements['cpu_seconds']),
+                    'frames': int(np.sum(measurements['frames'])),
+                    'bytes_written': int(np.sum(measurements['bytes_written'])),
+                }
+                for stage, measurements in stage_values.items()
+            },
+        }
+
+    @staticmethod
+    def compute_percentiles(values):
+        """
+        Compute the percentiles of a list of values, or None for each of them if the list is empty.
+        """
+        if not values:
+            return {f'p{percentile}': None for percentile in ProcessingMetricsSummaryView.PERCENTILES}
+
+        return {f'p{percentile}': float(np.percentile(values, percentile))
+                for percentile in ProcessingMetricsSummaryView.PERCENTILES}
@@ -1,12 +1,12 @@
-from rest_framework import generics, permissions
-
-from ..models.user_profile import UserProfile
-from ..serializers.user_profile import UserProfileSerializer
-
-
-class UserProfileView(generics.RetrieveUpdateAPIView):
-    serializer_class = UserProfileSerializer
-    permission_classes = [permissions.IsAuthenticated]
-
-    def get_object(self):
-        return UserProfile.objects.get(user=self.request.user)
+from rest_framework import generics, permissions
+
+from ..models.user_profile import UserProfile
+from ..serializers.user_profile import UserProfileSerializer
+
+
+class UserProfileView(generics.RetrieveUpdateAPIView):
+    serializer_class = UserProfileSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_object(self):
+        return UserProfile.objects.get(user=self.request.user)
@@ -1,161 +1,464 @@
-import os
-import re
-import uuid
-
-from django.db import transaction
-
-from rest_framework.generics import ListAPIView, DestroyAPIView
-from rest_framework.permissions import IsAuthenticated
-from rest_framework.views import APIView
-from rest_framework.parsers import MultiPartParser
-from rest_framework.response import Response
-from rest_framework import status
-
-from ..models.advice import Advice
-from ..models.repetition import Repetition
-from ..models.video import Video
-from ..serializers.video import VideoSerializer
-from ..services.exception.custom_exceptions import LandmarkExtractionError, AngleComputationError
-from ..services.pose_correction.BicepCurlPoseCorrection import BicepCurlPoseCorrection
-from ..services.pose_correction.PushupPoseCorrection import PushUpPoseCorrection
-from ..services.pose_correction.SquatPoseCorrection import SquatPoseCorrection
-
-
-class VideoSubmitView(APIView):
-    permission_classes = [IsAuthenticated]
-    parser_classes = [MultiPartParser]
-
-    def post(self, request, *args, **kwargs):
-        video_file = request.FILES.get('video')
-        if not video_file:
-            return Response({"error": "No video file provided"}, status=status.HTTP_400_BAD_REQUEST)
-
-        exercise_type = request.data.get('type')
-        if not exercise_type:
-            return Response({"error": "No exercise type provided"}, status=status.HTTP_400_BAD_REQUEST)
-
-        # generate a unique file name
-        unique_filename = self.get_unique_filename(video_file.name)
-
-        # submitted video path
-        input_directory = "media/submitted_videos/"
-        input_video_path = os.path.join(input_directory, unique_filename)
-
-        try:
-            with transaction.atomic():
-                # save the original video within the atomic block
-                original_video_instance = Video(user=request.user, video=unique_filename, exercise_type=exercise_type)
-                original_video_instance.save()
-                original_video_instance.video.save(unique_filename, video_file)
-
-                processed_video_output_dictionary = self.process_video(input_video_path, exercise_type)
-
-                if not processed_video_output_dictionary:
-                    raise Exception("Processing failed")
-
-                repetitions = []
-                # iterate over each processed video and their respective advice
-                for video_path, advices in processed_video_output_dictionary.items():
-                    # ensure the video path is correct
-                    video_path = re.sub(r'./media/', '', video_path)
-                    repetition_instance = Repetition(video=original_video_instance, repetition=video_path)
-                    repetition_instance.save()
-
-                    # save each piece of advice
-                    for category, details in advices.items():
-                        text, correction_level = details
-                        Advice.objects.create(
-                            repetition=repetition_instance,
-                            category=category,
-                            text=text,
-                            correction_level=correction_level
-                        )
-
-                    repetitions.append(repetition_instance)
-
-                return Response(VideoSerializer(original_video_instance).data, status=status.HTTP_200_OK)
-        except (LandmarkExtractionError, AngleComputationError) as e:
-            self.cleanup_file(input_video_path)
-            print(e)
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
-            self.cleanup_file(input_video_path)
-            print(e)
-            return Response({"error": "An unexpected error occurred"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-    @staticmethod
-    def get_unique_filename(original_filename):
-        """
-        Generate a unique file name by appending a UUID to the original file name.
-        """
-        base, ext = os.path.splitext(original_filename)
-        unique_filename = f"{base}_{uuid.uuid4().hex}{ext}"
-        return unique_filename
-
-    @staticmethod
-    def process_video(video_file, exercise_type):
-        """
-        Process the video file and return a dictionary with processed video paths and their respective advice.
-        """
-        if exercise_type == 'squat':
-            pose_correction = SquatPoseCorrection()
-        elif exercise_type == 'bicep_curl':
-            pose_correction = BicepCurlPoseCorrection()
-        elif exercise_type == 'pushup':
-            pose_correction = PushUpPoseCorrection()
-        else:
-            return None
-
-        try:
-            return pose_correction.process_video(video_file)
-        except (LandmarkExtractionError, AngleComputationError) as e:
-            raise e
-        except Exception as e:
-            raise Exception("An unexpected error occurred while processing the video")
-
-    @staticmethod
-    def cleanup_file(file_path):
-        """
-        Delete the file at the given file path.
-        """
-        if os.path.exists(file_path):
-            os.remove(file_path)
-
-
-class UserVideosListView(ListAPIView):
-    serializer_class = VideoSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        exercise_type = self.request.query_params.get('type')
-        if exercise_type:
-            return Video.objects.filter(
-                user=self.request.user,
-                exercise_type=exercise_type
-            ).prefetch_related('repetitions__advice').order_by('-created_at')
-        return Video.objects.filter(
-            user=self.request.user
-        ).prefetch_related('repetitions__advice').order_by('-created_at')
-
-
-class VideoDeleteView(DestroyAPIView):
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
-        # only allow deleting videos that belong to the requesting user
-        return Video.objects.filter(user=self.request.user)
-
-    def delete(self, request, *args, **kwargs):
-        video_id = kwargs.get('pk', None)
-        if not video_id:
-            return Response({"message": "Invalid request"}, status=status.HTTP_400_BAD_REQUEST)
-
-        video = Video.objects.filter(pk=video_id, user=request.user).first()
-        if video:
-            self.perform_destroy(video)
-            return Response({"message": "Video deleted successfully"}, status=status.HTTP_204_NO_CONTENT)
-        else:
-            return Response({"message": "Video not found or not owned by user"}, status=status.HTTP_404_NOT_FOUND)
-
-    def perform_destroy(self, instance):
-        instance.delete()
+import functools
+import logging
+import os
+import re
+import time
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+
+from rest_framework.generics import ListAPIView, DestroyAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..metrics import metrics_registry
+from ..models.advice import Advice
+from ..models.processing_metrics import ProcessingMetrics
+from ..models.repetition import Repetition
+from ..models.video import Video
+from ..serializers.video import VideoSerializer
+from ..services.exception.custom_exceptions import LandmarkExtractionError, AngleComputationError, VideoProbeError
+from ..services.landmarks_extractor.BlazePoseLandmarksExtractor import BlazePoseLandmarksExtractor
+from ..services.landmarks_extractor.ModelComplexityPolicy import ModelComplexityPolicy
+from ..services.landmarks_extractor.MotionGate import MotionGate
+from ..services.landmarks_extractor.OpticalFlowLandmarksPropagator import OpticalFlowLandmarksPropagator
+from ..services.landmarks_extractor.PoseGraphPool import PoseGraphPool
+from ..services.landmarks_extractor.PrefetchingLandmarksExtractor import PrefetchingLandmarksExtractor
+from ..services.landmarks_extractor.ReplayLandmarksExtractor import ReplayLandmarksExtractor
+from ..services.monitoring.ProfiledJobRunner import ProfiledJobRunner
+from ..services.monitoring.StageTimer import StageTimer
+from ..services.monitoring.Tracer import Tracer
+from ..services.pose_correction.ExerciseClassifier import ExerciseClassifier
+from ..services.pose_correction.PoseCorrectionRegistry import PoseCorrectionRegistry
+from ..services.rules.RuleSetRepository import RuleSetRepository
+from ..services.scheduling.AnalysisProxyTranscoder import AnalysisProxyTranscoder
+from ..services.scheduling.ProcessingQueue import ProcessingQueue
+from ..services.scheduling.VideoProber import VideoProber
+
+
+processing_queue = ProcessingQueue(settings.PROCESSING_QUEUE_DIRECTORY)
+pose_graph_pool = PoseGraphPool(BlazePoseLandmarksExtractor.create_pose_graph)
+tracer = Tracer(settings.TRACE_FILE or None)
+rule_set_repository = RuleSetRepository(settings.CORRECTION_RULES_FILE)
+# the pose corrections are created once per worker process and shared by its jobs
+pose_correction_registry = PoseCorrectionRegistry(rule_set_repository)
+# the repetitions are evaluated in threads, reading views of the arrays of their video instead of copies
+advice_executor = ThreadPoolExecutor(max_workers=settings.ADVICE_WORKERS, thread_name_prefix='advice')
+exercise_classifier = ExerciseClassifier()
+
+logger = logging.getLogger(__name__)
+
+metrics_registry.set_function('processing_queue_depth', processing_queue.get_depth)
+metrics_registry.set_function('pose_graph_pool_graphs', pose_graph_pool.get_graph_counts)
+metrics_registry.set_function('pose_graph_pool_acquisitions_total', pose_graph_pool.get_acquisitions)
+metrics_registry.set_function('pose_graph_pool_busy_seconds_total', pose_graph_pool.get_busy_seconds)
+
+
+class VideoSubmitView(APIView):
+    permission_classes = [IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        # trace the submission so that a slow one can be followed through every processing stage
+        with tracer.span('request', category='http', view='video_submit', user=request.user.pk) as trace_id:
+            response = self.submit_video(request)
+
+        if trace_id is not None:
+            response['X-Trace-Id'] = trace_id
+
+        return response
+
+    def submit_video(self, request):
+        video_file = request.FILES.get('video')
+        if not video_file:
+            return Response({"error": "No video file provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+        exercise_type = request.data.get('type')
+        if not exercise_type:
+            return Response({"error": "No exercise type provided"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # profiling slows the job down, so only administrators may request it
+        profile = str(request.data.get('profile', '')).lower() in ('1', 'true')
+        if profile and not request.user.is_staff:
+            return Response({"error": "Only administrators can profile a submission"},
+                            status=status.HTTP_403_FORBIDDEN)
+
+        # the exercise is recognized from the landmarks extracted for its correction
+        detect_exercise_type = exercise_type == 'auto'
+        if detect_exercise_type and profile:
+            return Response({"error": "The exercise type must be provided to profile a submission"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # generate a unique file name
+        unique_filename = self.get_unique_filename(video_file.name)
+
+        # submitted video path
+        input_directory = "media/submitted_videos/"
+        input_video_path = os.path.join(input_directory, unique_filename)
+        proxy_video_path = self.get_proxy_path(input_video_path)
+
+        # time each processing stage so that slow submissions can be attributed to one of them
+        stage_timer = StageTimer(tracer)
+        start_time = time.perf_counter()
+
+        try:
+            # the video is probed before the job starts, so that a video which cannot be processed is rejected before
+            # any record of it is made
+            original_video_instance = Video(user=request.user, exercise_type=exercise_type)
+            with stage_timer.stage('upload', bytes_written=video_file.size):
+                original_video_instance.video.save(unique_filename, video_file, save=False)
+            with stage_timer.stage('probe'):
+                video_properties = self.probe_video(input_video_path)
+
+            # the probed metadata is recorded for the scheduling decisions
+            original_video_instance.fps = video_properties['fps'] or None
+            original_video_instance.width = video_properties['width'] or None
+            original_video_instance.height = video_properties['height'] or None
+            original_video_instance.frame_count = video_properties['frame_count'] or None
+            original_video_instance.duration_seconds = video_properties['duration'] or None
+
+            # every processing pass decodes the analysis proxy of the video if it exceeds its bounds, the original
+            # video being kept for archival
+            analysis_video_path, analysis_properties = input_video_path, video_properties
+            analysis_proxy_transcoder = self.get_analysis_proxy_transcoder()
+            if analysis_proxy_transcoder is not None and analysis_proxy_transcoder.needs_proxy(video_properties):
+                try:
+                    with stage_timer.stage('transcoding', frames=video_properties['frame_count']):
+                        proxy_properties = analysis_proxy_transcoder.transcode(input_video_path, proxy_video_path,
+                                                                               video_properties)
+                    stage_timer.add('transcoding', bytes_written=os.path.getsize(proxy_video_path))
+                    analysis_video_path, analysis_properties = proxy_video_path, proxy_properties
+                except OSError:
+                    # the original video is analyzed when its proxy cannot be written
+                    logger.warning("Could not transcode the analysis proxy of %s", input_video_path, exc_info=True)
+                    metrics_registry.inc('analysis_proxy_failures_total')
+
+            with transaction.atomic(), processing_queue.track_job(), \
+                    stage_timer.span('job', exercise_type=exercise_type, size=video_file.size):
+                # record the model complexity so that the advice quality can be correlated with it
+                original_video_instance.model_complexity = model_complexity = \
+                    self.select_model_complexity(analysis_properties)
+                original_video_instance.save()
+
+                # the advice of every repetition is given by the same version of the rules, recorded with it
+                rule_set = rule_set_repository.get_rule_set()
+
+                landmarks_extractor = None
+                if detect_exercise_type:
+                    landmarks_extractor = PrefetchingLandmarksExtractor(
+                        self.create_landmarks_extractor(model_complexity, pose_graph_pool))
+                    exercise_type = self.detect_exercise_type(analysis_video_path, landmarks_extractor, stage_timer)
+                    original_video_instance.exercise_type = exercise_type
+                    original_video_instance.save(update_fields=['exercise_type'])
+
+                processed_video_outputs = self.process_video(analysis_video_path, exercise_type, model_complexity,
+                                                             stage_timer, profile, rule_set, landmarks_extractor,
+                                                             analysis_properties['duration'])
+
+                if processed_video_outputs is None:
+                    raise Exception("Processing failed")
+
+                repetitions = []
+                # iterate over each processed video and their respective advice
+                for video_path, advices in processed_video_outputs:
+                    # the stage keeps the name the stored processing metrics have it under
+                    with stage_timer.stage('database'):
+                        # ensure the video path is correct
+                        video_path = re.sub(r'./media/', '', video_path)
+                        repetition_instance = Repetition(video=original_video_instance, repetition=video_path)
+                        repetition_instance.save()
+
+                        # save each piece of advice
+                        for category, details in advices.items():
+                            text, correction_level = details
+                            Advice.objects.create(
+                                repetition=repetition_instance,
+                                category=category,
+                                text=text,
+                                correction_level=correction_level,
+                                rule_set_version=rule_set.get_version()
+                            )
+
+                    repetitions.append(repetition_instance)
+
+                if not repetitions:
+                    raise Exception("Processing failed")
+
+                processing_metrics = self.save_processing_metrics(original_video_instance, analysis_properties,
+                                                                  stage_timer, time.perf_counter() - start_time)
+                # the metrics of a submission are only exported once it is committed
+                transaction.on_commit(functools.partial(self.export_processing_metrics, processing_metrics,
+                                                        exercise_type))
+
+                return Response(VideoSerializer(original_video_instance).data, status=status.HTTP_200_OK)
+        except (VideoProbeError, LandmarkExtractionError, AngleComputationError) as e:
+            self.cleanup_file(input_video_path)
+            print(e)
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            self.cleanup_file(input_video_path)
+            print(e)
+            return Response({"error": "An unexpected error occurred"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        finally:
+            self.cleanup_file(proxy_video_path)
+
+    @staticmethod
+    def get_unique_filename(original_filename):
+        """
+        Generate a unique file name by appending a UUID to the original file name.
+        """
+        base, ext = os.path.splitext(original_filename)
+        unique_filename = f"{base}_{uuid.uuid4().hex}{ext}"
+        return unique_filename
+
+    @staticmethod
+    def probe_video(video_file):
+        """
+        Probe the video file before its processing, raising a VideoProbeError if it cannot be processed, and return
+        its container metadata. The pose is detected on the sampled frames with the lightest model, unless the
+        landmarks are replayed instead of estimated on the frames.
+        """
+        landmarks_extractor = BlazePoseLandmarksExtractor(0, pose_graph_pool)
+
+        def detect_pose(image):
+            return landmarks_extractor.estimate_pose(image) is not None
+
+        detect_poses = settings.VIDEO_PROBE_POSE_DETECTION and settings.LANDMARKS_EXTRACTOR != 'replay'
+        video_prober = VideoProber(settings.VIDEO_MAX_DURATION_SECONDS, settings.VIDEO_MAX_RESOLUTION,
+                                   pose_detector=detect_pose if detect_poses else None)
+        return video_prober.probe(video_file)
+
+    @staticmethod
+    def get_analysis_proxy_transcoder():
+        """
+        Get the transcoder of the analysis proxies with the bounds of the settings, or None if the videos are analyzed
+        as they are.
+        """
+        if not settings.ANALYSIS_PROXY:
+            return None
+
+        return AnalysisProxyTranscoder(settings.ANALYSIS_PROXY_MAX_RESOLUTION, settings.ANALYSIS_PROXY_MAX_FPS)
+
+    @staticmethod
+    def get_proxy_path(video_file):
+        """
+        Get the path of the analysis proxy of a video, next to the video.
+        """
+        base, _ = os.path.splitext(video_file)
+        return f'{base}.proxy.mp4'
+
+    @staticmethod
+    def select_model_complexity(video_properties):
+        """
+        Select the pose estimation model complexity for the probed video, trading precision for latency when busy.
+        """
+        if settings.POSE_MODEL_COMPLEXITY != 'auto':
+            return int(settings.POSE_MODEL_COMPLEXITY)
+
+        policy = ModelComplexityPolicy(settings.POSE_LATENCY_SLO_SECONDS, settings.PROCESSING_WORKERS)
+
+        # the current job is already tracked by the processing queue
+        queue_depth = max(0, processing_queue.get_depth() - 1)
+
+        return policy.select(video_properties['frame_count'], video_properties['width'], video_properties['height'],
+                             queue_depth)
+
+    @staticmethod
+    def detect_exercise_type(video_file, landmarks_extractor, stage_timer):
+        """
+        Recognize the exercise performed in the video file from the landmarks of its first frames, prefetched by the
+        landmarks extractor so that their extraction is not repeated by the processing of the video.
+        """
+        landmarks_extractor.set_stage_timer(stage_timer)
+        with stage_timer.span('extraction'):
+            landmarks_dictionary = landmarks_extractor.prefetch(video_file, settings.EXERCISE_CLASSIFICATION_FRAMES)
+
+        with stage_timer.stage('classification', frames=len(landmarks_dictionary)):
+            exercise_type = exercise_classifier.classify(landmarks_extractor.process_keypoints(landmarks_dictionary))
+
+        if exercise_type is None or pose_correction_registry.get(exercise_type) is None:
+            raise LandmarkExtractionError("No exercise was recognized in the video")
+
+        return exercise_type
+
+    @staticmethod
+    def save_processing_metrics(video_instance, video_properties, stage_timer, total_wall_seconds):
+        """
+        Save the time spent in each processing stage of the video, along with its probed resolution.
+        """
+        return ProcessingMetrics.objects.create(
+            video=video_instance,
+            width=video_properties['width'] or None,
+            height=video_properties['height'] or None,
+            frame_count=video_properties['frame_count'] or None,
+            total_wall_seconds=total_wall_seconds,
+            stages=stage_timer.get_stages()
+        )
+
+    @staticmethod
+    def export_processing_metrics(processing_metrics, exercise_type):
+        """
+        Export the stage timings, frame rate and media bytes written of a processed video to the metrics endpoint.
+        """
+        labels = {'exercise_type': exercise_type}
+
+        for stage, measurements in processing_metrics.stages.items():
+            metrics_registry.observe('video_processing_stage_seconds', measurements['wall_seconds'],
+                                     dict(labels, stage=stage))
+            if measurements['bytes_written']:
+                metrics_registry.inc('media_bytes_written_total', measurements['bytes_written'], {'stage': stage})
+
+        if processing_metrics.frame_count:
+            metrics_registry.inc('video_processing_frames_total', processing_metrics.frame_count, labels)
+            if processing_metrics.total_wall_seconds > 0:
+                metrics_registry.observe('video_processing_frames_per_second',
+                                         processing_metrics.frame_count / processing_metrics.total_wall_seconds,
+                                         labels)
+
+    @staticmethod
+    def create_landmarks_extractor(model_complexity, graph_pool=None):
+        """
+        Create the landmarks extractor selected by the settings, borrowing its pose estimation graph from the pool
+        if any.
+        """
+        create_blaze_pose_extractor = functools.partial(
+            BlazePoseLandmarksExtractor, model_complexity, graph_pool,
+            MotionGate() if settings.POSE_MOTION_GATING else None, settings.POSE_KEYFRAME_INTERVAL,
+            OpticalFlowLandmarksPropagator() if settings.POSE_OPTICAL_FLOW_PROPAGATION else None)
+
+        if settings.LANDMARKS_EXTRACTOR == 'replay':
+            return ReplayLandmarksExtractor(settings.LANDMARKS_RECORDINGS_DIRECTORY, create_blaze_pose_extractor,
+                                            recording_key=VideoSubmitView.get_recording_key(model_complexity))
+
+        return create_blaze_pose_extractor()
+
+    @staticmethod
+    def get_recording_key(model_complexity):
+        """
+        Get the key of the landmarks recordings made with the extractor settings, the landmarks of the frames
+        without pose estimation depending on how they are filled in.
+        """
+        recording_key = f'complexity{model_complexity}'
+        if settings.POSE_MOTION_GATING:
+            recording_key += '_gated'
+        if settings.POSE_KEYFRAME_INTERVAL > 1:
+            recording_key += f'_interval{settings.POSE_KEYFRAME_INTERVAL}'
+        if settings.POSE_OPTICAL_FLOW_PROPAGATION:
+            recording_key += '_flow'
+
+        return recording_key
+
+    @staticmethod
+    def get_profile_paths(video_file):
+        """
+        Get the paths of the profile and of the memory report of a profiled video, next to the video.
+        """
+        base, _ = os.path.splitext(video_file)
+        return f'{base}.profile.folded', f'{base}.memory.txt'
+
+    @staticmethod
+    def process_video(video_file, exercise_type, model_complexity=2, stage_timer=None, profile=False, rule_set=None,
+                      landmarks_extractor=None, duration=0):
+        """
+        Process the video file and return the processed video paths paired with their respective advice, given by the
+        rule set if any or by the current one. A profiled video is processed in a process of its own, which saves its
+        profile and memory report next to the video. The landmarks are extracted by the landmarks extractor if any, or
+        by the one selected by the settings. The probed duration of the video, in seconds, tells whether it is
+        processed incrementally.
+        """
+        pose_correction = pose_correction_registry.get(exercise_type)
+        if pose_correction is None:
+            return None
+
+        try:
+            # the graphs of the pool cannot be sent to the process of a profiled video
+            if landmarks_extractor is None:
+                landmarks_extractor = VideoSubmitView.create_landmarks_extractor(
+                    model_complexity, None if profile else pose_graph_pool)
+
+            # long recordings are processed incrementally so that the memory used does not grow with their length
+            streaming = duration >= settings.STREAMING_PROCESSING_MIN_DURATION_SECONDS
+            process = pose_correction.process_video_stream if streaming else pose_correction.process_video
+            job = functools.partial(process, video_file, landmarks_extractor=landmarks_extractor, rule_set=rule_set)
+            # the executor cannot be sent to the process of a profiled video either
+            if not streaming and not profile:
+                job = functools.partial(job, advice_executor=advice_executor)
+
+            if profile:
+                profile_path, memory_report_path = VideoSubmitView.get_profile_paths(video_file)
+                outputs = ProfiledJobRunner(profile_path, memory_report_path).run(job, stage_timer)
+            else:
+                outputs = job(stage_timer=stage_timer)
+
+            # the repetitions of a video processed incrementally are processed as its outputs are consumed
+            return VideoSubmitView.iter_streaming_outputs(outputs) if streaming else outputs.items()
+        except (LandmarkExtractionError, AngleComputationError) as e:
+            raise e
+        except Exception as e:
+            raise Exception("An unexpected error occurred while processing the video")
+
+    @staticmethod
+    def iter_streaming_outputs(outputs):
+        """
+        Yield the outputs of a video processed incrementally, raising the errors of its processing the same way as
+        process_video.
+        """
+        try:
+            yield from outputs
+        except (LandmarkExtractionError, AngleComputationError) as e:
+            raise e
+        except Exception as e:
+            raise Exception("An unexpected error occurred while processing the video")
+
+    @staticmethod
+    def cleanup_file(file_path):
+        """
+        Delete the file at the given file path.
+        """
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+class UserVideosListView(ListAPIView):
+    serializer_class = VideoSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        exercise_type = self.request.query_params.get('type')
+        if exercise_type:
+            return Video.objects.filter(
+                user=self.request.user,
+                exercise_type=exercise_type
+            ).prefetch_related('repetitions__advice').order_by('-created_at')
+        return Video.objects.filter(
+            user=self.request.user
+        ).prefetch_related('repetitions__advice').order_by('-created_at')
+
+
+class VideoDeleteView(DestroyAPIView):
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        # only allow deleting videos that belong to the requesting user
+        return Video.objects.filter(user=self.request.user)
+
+    def delete(self, request, *args, **kwargs):
+        video_id = kwargs.get('pk', None)
+        if not video_id:
+            return Response({"message": "Invalid request"}, status=status.HTTP_400_BAD_REQUEST)
+
+        video = Video.objects.filter(pk=video_id, user=request.user).first()
+        if video:
+            self.perform_destroy(video)
+            return Response({"message": "Video deleted successfully"}, status=status.HTTP_204_NO_CONTENT)
+        else:
+            return Response({"message": "Video not found or not owned by user"}, status=status.HTTP_404_NOT_FOUND)
+
+    def perform_destroy(self, instance):
+        instance.delete()